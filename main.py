@@ -1,6 +1,8 @@
 from utils.tests import *
 from utils.Logger import Logger
 from utils.utils import gradient, benchmark
+from utils.sweep import sweep
+from utils.Grid import Grid
 import matplotlib.pyplot as plt
 
 
@@ -22,14 +24,10 @@ start_point = np.array([-1.2, 0.0])
 searched_point = np.array([1.0, 1.0])
 
 
-def make_data(size, step):
+def make_data(size, step, **params):
+    """ :param params: see `utils.Grid.Grid` (tile, max_workers, cache_dir) """
     bounds = np.array([-size, size])
-    x = np.arange(*(searched_point[0]+bounds), step)
-    y = np.arange(*(searched_point[1]+bounds), step)
-    xgrid, ygrid = np.meshgrid(x, y)
-
-    z = fn(xgrid, ygrid)
-    return xgrid, ygrid, z
+    return Grid(fn, searched_point[0]+bounds, searched_point[1]+bounds, step, **params)
 
 
 def contour(data):
@@ -77,57 +75,35 @@ def set_graphic(ax: plt.axes, values, title):
 
 def task1():
 
-    bounds = [1, 16]
+    exponents = list(range(1, 16))
 
     @benchmark
-    def eps_test(eps=3, h=5, criteria=3):
-        grad = lambda point: gradient(fn, point, 10**-h)
-
+    def eps_test(runs):
+        """ :param runs: list of (eps, h, criteria) exponents """
         params = {
             "one_dim_method": "golden_section",
-            "grad": grad,
             "step": None,
-            "one_dim_eps": 10**-eps,
-            "criteria_eps": 10**-criteria,
             "criteria": 0
         }
+        grid = [{"one_dim_eps": 10**-eps, "grad_h": 10**-h, "criteria_eps": 10**-criteria}
+                for eps, h, criteria in runs]
 
-        result = GradientDescent(fn, start_point, **params).start()
-        return result
+        results = sweep(fn, start_point, grid, **params)
+        return [exponents, results["iterations"].tolist(), results["fx"].tolist()]
 
     fig, axes = plt.subplots(4, 1, figsize=(9, 12))
 
     print("\ntest gradient\n")
-    grad_eps_test = [[],[], []]
-    for i in range(*bounds):
-        result = eps_test(h=i, eps=3, criteria=3)
-        grad_eps_test[0].append(i)
-        grad_eps_test[1].append(result.iterations)
-        grad_eps_test[2].append(result.history.current)
+    grad_eps_test = eps_test([(3, i, 3) for i in exponents])
 
     print("\neps test\n")
-    gd_eps_test = [[],[], []]
-    for i in range(*bounds):
-        result = eps_test(eps=i)
-        gd_eps_test[0].append(i)
-        gd_eps_test[1].append(result.iterations)
-        gd_eps_test[2].append(result.history.current)
+    gd_eps_test = eps_test([(i, 5, 3) for i in exponents])
 
     print("\ncriteria eps test\n")
-    criteria_eps_test = [[],[], []]
-    for i in range(*bounds):
-        result = eps_test(criteria=i)
-        criteria_eps_test[0].append(i)
-        criteria_eps_test[1].append(result.iterations)
-        criteria_eps_test[2].append(result.history.current)
+    criteria_eps_test = eps_test([(3, 5, i) for i in exponents])
 
     print("\ngradient and epses test\n")
-    gd_grad_eps_test = [[],[], []]
-    for i in range(*bounds):
-        result = eps_test(eps=i, h=i, criteria=i)
-        gd_grad_eps_test[0].append(i)
-        gd_grad_eps_test[1].append(result.iterations)
-        gd_grad_eps_test[2].append(result.history.current)
+    gd_grad_eps_test = eps_test([(i, i, i) for i in exponents])
 
     # grad_eps_test = [[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], [200, 4, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 5, 5, 4], [1.1138654959679026, 1.9338322273837666e-12, 1.9016646035506197e-06, 2.3389657061528475e-07, 4.451843947909425e-07, 2.610362292855971e-07, 2.467447660342118e-07, 2.4539476994885313e-07, 2.4498450675062175e-07, 2.466972798163045e-07, 2.4537393558127494e-07, 8.620702700112414e-07, 1.3194196669345807e-09, 5.904492652622623e-09, 3.4553994366211173e-13]]
     # gd_eps_test = [[1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15], [20, 6, 6, 36, 36, 36, 3, 3, 3, 3, 3, 3, 3, 3, 3], [1.97068568802946e-05, 2.327936863777599e-06, 4.451843947909425e-07, 2.396973756410826e-05, 2.6334322053867958e-05, 2.770784173437725e-05, 1.7554788893405403e-05, 1.1677548339730388e-08, 2.593894134924519e-06, 1.4325390264757815e-06, 1.3845917938177057e-06, 1.3803413848006244e-06, 1.3790148734085724e-06, 1.379048340538573e-06, 1.3790317758982276e-06]]
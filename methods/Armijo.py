@@ -0,0 +1,80 @@
+from utils.Logger import Logger
+
+
+class Armijo:
+    """
+        Неточный одномерный поиск (правило Армихо, дробление шага)
+        g(t) <= g(0) + c1 * t * g'(0),   t = t0, rho*t0, rho^2*t0, ...
+
+        g'(0) = ∇f(x)·direction is known from the gradient descent, so Sven interval is not needed.
+    """
+
+    TITLE = "Armijo"
+    BRACKETING = False      # takes start step instead of interval [a, b]
+    MAX_ITERATIONS = 100
+    C1 = 10**-4
+    RHO = 0.5
+
+    def __init__(self, fn, fx0, slope, step=1.0, dfn=None, **params):
+        """
+            :param fn: g(t)
+            :param fx0: g(0)
+            :param slope: g'(0), should be negative
+            :param step: first step t0
+            :param dfn: g'(t), not used by Armijo rule
+        """
+        self.f = fn
+        self.dfn = dfn
+        self.fx0 = fx0
+        self.slope = slope
+        self.start_step = step
+        self.c1 = params.get("c1", self.C1)
+        self.rho = params.get("rho", self.RHO)
+
+        self.iterations = 0
+        self.evaluations = 0
+        self.grad_evaluations = 0
+        self.x = None
+        self.fx = None
+
+        with Logger(self.TITLE):
+            if slope >= 0:
+                Logger.warning("! direction is not descent: g'(0)={} !", slope)
+            self.find_x()
+            self._report()
+
+    def _evaluate(self, t):
+        self.evaluations += 1
+        return self.f(t)
+
+    def _evaluate_derivative(self, t):
+        self.grad_evaluations += 1
+        return self.dfn(t)
+
+    def sufficient_decrease(self, t, ft):
+        return ft <= self.fx0 + self.c1 * t * self.slope
+
+    def find_x(self):
+        headers = ["i", "t", "g(t)", "g(0) + c1*t*g'(0)"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        t = self.start_step
+        while True:
+            self.iterations += 1
+            ft = self._evaluate(t)
+            Logger.debug(log_pattern, self.iterations, t, ft, self.fx0 + self.c1 * t * self.slope)
+
+            if self.sufficient_decrease(t, ft):
+                break
+            if self.iterations >= self.MAX_ITERATIONS:
+                Logger.warning("! MAX_ITERATIONS reached !")
+                break
+            t *= self.rho
+
+        self.x, self.fx = t, ft
+        return t
+
+    def _report(self):
+        Logger.log("---> found step={} (g(t)={}) on i={} ({} evaluations, {} derivatives)",
+                   self.x, self.fx, self.iterations, self.evaluations, self.grad_evaluations, new_line=True)
@@ -0,0 +1,68 @@
+from utils.Logger import Logger
+from utils.AsyncEvaluator import AsyncEvaluator
+from methods.DSKPowell import DSKPowell
+
+
+class AsyncDSKPowell(DSKPowell):
+    """
+        Метод ДСК-Пауэлла для `async def` функций
+        Initial triple f(a), f((a+b)/2), f(b) is evaluated concurrently (if it is not taken from `bracket`).
+
+        >>> x = (await AsyncDSKPowell(fn, a, b, eps=10**-3)).x
+    """
+
+    def __init__(self, fn, a, b, eps=0.001, max_concurrency=None, timeout=None, bracket=None):
+        """ :param bracket: `methods.Sven.Bracket`, see `DSKPowell` """
+        self.f = AsyncEvaluator(fn, max_concurrency, timeout)
+        self.x1 = a
+        self.x2 = (a+b)/2   # <-- central point
+        self.x3 = b
+        self.fx1 = self.fx2 = self.fx3 = None
+        triple = bracket.triple() if bracket is not None else None
+        if triple is not None:
+            (self.x1, self.fx1), (self.x2, self.fx2), (self.x3, self.fx3) = triple
+        self.eps = eps
+
+        self.iterations = 0
+        self.x = None
+
+    def __await__(self):
+        return self.run().__await__()
+
+    async def run(self):
+        if self.fx2 is None:
+            self.fx1, self.fx2, self.fx3 = await self.f.map([(self.x1,), (self.x2,), (self.x3,)])
+        with Logger("DSK Powell"):
+            await self.find_x()
+        return self
+
+    async def find_x(self):
+        """ see `DSKPowell.find_x` """
+        headers = ["i", "x1", "x2", "x3", "f(x1)", "f(x2)", "f(x3)", "x*", "f(x*)"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        while True:
+            self.iterations += 1
+
+            x, fx = self.next_x()
+            if fx is None:
+                fx = await self.f(x)
+
+            Logger.debug(log_pattern, self.iterations, self.x1, self.x2, self.x3, self.fx1, self.fx2, self.fx3, x, fx)
+
+            if self.should_stop(x, fx) is True:
+                self.x = x
+                break
+
+            if self.update_xs(x, fx) is False:
+                break
+
+        await self._report()
+        return self.x
+
+    async def _report(self):
+        if Logger.is_enabled(Logger.INFO) is False:
+            return
+        fx = await self.f(self.x)
+        Logger.log("---> found x={:.24f} (f(x)={:.24f}) on i={}", self.x, fx, self.iterations, new_line=True)
@@ -0,0 +1,71 @@
+from utils.Logger import Logger
+from utils.AsyncEvaluator import AsyncEvaluator
+from methods.GoldenSection import GoldenSection
+
+
+class AsyncGoldenSection(GoldenSection):
+    """
+        Метод золотого сечения для `async def` функций
+        f(x1) and f(x2) of every iteration are evaluated concurrently.
+
+        >>> x = (await AsyncGoldenSection(fn, a, b, eps=10**-3, max_concurrency=2)).x
+    """
+
+    def __init__(self, fn, a, b, eps=0.001, max_concurrency=None, timeout=None, bracket=None):
+        """ :param bracket: `methods.Sven.Bracket`, see `GoldenSection.seed` """
+        self.f = AsyncEvaluator(fn, max_concurrency, timeout)
+        self.a = a
+        self.b = b
+
+        self.iterations = 0
+        self.interval = None
+        self.x = None
+        self.eps = eps
+        self._seed = self.seed(bracket)
+
+    def __await__(self):
+        return self.run().__await__()
+
+    async def run(self):
+        with Logger("Golden Section"):
+            await self.set_interval()
+        return self
+
+    async def set_interval(self):
+        X1, X2 = self.X1_COEFFICIENT, self.X2_COEFFICIENT
+
+        headers = ["i", "a", "x1", "x2", "b", "L", "f(x1)", "f(x2)"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        while True:
+            if self.should_stop() is True:
+                self.interval = [self.a, self.b]
+                break
+
+            self.iterations += 1
+
+            L = self.b - self.a
+            x1 = self.a + X1 * L
+            x2 = self.a + X2 * L
+            if self._seed is None:
+                fx1, fx2 = await self.f.map([(x1,), (x2,)])
+            elif self._seed[0] == "x1":
+                (x1, fx1), fx2 = self._seed[1:], await self.f(x2)
+            else:
+                fx1, (x2, fx2) = await self.f(x1), self._seed[1:]
+            self._seed = None
+
+            Logger.debug(log_pattern, self.iterations, self.a, x1, x2, self.b, L, fx1, fx2)
+
+            if fx1 <= fx2:
+                self.b = x2
+            else:
+                self.a = x1
+
+        self.x = sum(self.interval) / 2
+
+        if Logger.is_enabled(Logger.INFO):
+            fx = await self.f(self.x)
+            Logger.log("---> found x={:.24f} (fx = {:.24f}) and interval={} on i={}",
+                       self.x, fx, self.interval, self.iterations, new_line=True)
@@ -0,0 +1,182 @@
+""" Метод наискорейшего спуска для `async def` функций """
+
+
+import os
+import asyncio
+import inspect
+
+import numpy as np
+
+from utils.Logger import Logger
+from utils.utils import GRADIENT_MODES, get_vector_norm, format_vector
+from utils.AsyncEvaluator import AsyncEvaluator
+
+from methods.GradientDescent import Iteration, OptimalGradientDescent, ConstGradientDescent
+from methods.AsyncSven import AsyncSven
+from methods.AsyncGoldenSection import AsyncGoldenSection
+from methods.AsyncDSKPowell import AsyncDSKPowell
+
+
+class AsyncGradientDescentMixin:
+    """
+        Same iterations as `GradientDescentMixin`, but fn (and grad) may be `async def`.
+        Independent evaluations are issued concurrently: f(x) together with all points of the numeric gradient,
+        probes of Sven, pairs of golden section points, the initial triple of DSK-Powell.
+
+        `max_concurrency` limits count of calls at the same time, `timeout` - seconds for one call.
+        The run may be cancelled as any asyncio task, calls in progress are cancelled too.
+    """
+
+    def __init__(self, fn, start_point, step, grad=None, **params):
+        if params.get("cache"):
+            raise ValueError("cache is not supported for async objectives")
+        if isinstance(grad, str):
+            raise ValueError(f"grad={grad!r} is not supported for async objectives")
+        super().__init__(fn, start_point, step, grad=grad, **params)
+
+        self.evaluator = AsyncEvaluator(self.f, params.get("max_concurrency", None), params.get("timeout", None))
+        if grad is None:
+            self.grad_h = params.get("grad_h", 0.00001)
+            self.grad_mode = params.get("grad_mode", "forward")
+            if self.grad_mode not in ("forward", "central"):
+                raise ValueError(f"Unknown gradient mode {self.grad_mode!r}, use one of {GRADIENT_MODES[:2]}")
+            self.grad = self.stats.counted(self.numeric_gradient, "grad")
+
+    async def numeric_gradient(self, point):
+        """ see `utils.utils.gradient`, all shifted points are evaluated concurrently """
+        n = len(point)
+        h = self.grad_h
+        steps = np.eye(n) * h
+
+        if self.grad_mode == "forward":
+            points = np.vstack([point, point + steps])
+            values = np.array(await self.evaluator.map([self._args(p) for p in points]))
+            return (values[1:] - values[0]) / h
+
+        points = np.vstack([point + steps, point - steps])
+        values = np.array(await self.evaluator.map([self._args(p) for p in points]))
+        return (values[:n] - values[n:]) / (2*h)
+
+    def _args(self, x):
+        """ args of fn in its calling convention (see `vectorized`) """
+        return (x,) if self.vectorized is True else tuple(x)
+
+    async def _value_and_gradient(self, x):
+        fx_task = asyncio.ensure_future(self.evaluator(*self._args(x)))
+        try:
+            with self.stats.phase("gradient"):
+                gx = self.grad(x)
+                if inspect.isawaitable(gx):
+                    gx = await gx
+            fx = await fx_task
+        except BaseException:
+            fx_task.cancel()
+            await asyncio.gather(fx_task, return_exceptions=True)
+            raise
+        return fx, gx
+
+    async def start(self):
+        title = f"Async Gradient Descent ({self.TYPE})"
+        with Logger(title):
+            with self.stats.phase("run"):
+                await self.find_x()
+            Logger.log("{}", self.stats)
+        if self.stats_hook is not None:
+            self.stats_hook(self.stats)
+        return self
+
+    async def find_x(self):
+        async for _ in self.iterate():
+            pass
+        return self.x
+
+    async def iterate(self):
+        """ async generator of iterations, see `GradientDescentMixin.iterate` """
+        headers = ["i", "x", "f(x)", "∇f(x)", "||∇f(x)||", "direction", "step"]
+        log_pattern = "{!s:^3}\t" + "{!s:<35.35}\t" * (len(headers)-1)
+        if self.resume is True and os.path.exists(self.checkpoint_path):
+            self.load_checkpoint(self.checkpoint_path)
+            Logger.log("resumed from {} on i={}", self.checkpoint_path, self.iterations)
+        Logger.debug(log_pattern, *headers)
+
+        x = self.start_point if self._resume_point is None else self._resume_point
+        while True:
+            i = self.iterations
+
+            fx, gx = await self._value_and_gradient(x)
+            self.point, self.gx = x, gx
+            norm = get_vector_norm(gx)
+            direction = self.get_direction(gx, norm)
+
+            Logger.debug(log_pattern, i, x, fx, gx, norm, direction, self.step)
+            self.history.append(i, x, fx, direction, norm)
+
+            if self.should_stop(norm) is True:
+                if Logger.is_enabled(Logger.INFO):
+                    Logger.log("---> found x={} on i={}", format_vector(x), self.iterations, new_line=True)
+                self.x = x
+                yield Iteration(i, x, fx, norm, None)
+                return
+
+            updated = self.update_step()
+            if inspect.isawaitable(updated):
+                await updated
+            yield Iteration(i, x, fx, norm, self.step)
+            x = self.get_next_x(x, self.step, direction)
+            self.iterations += 1
+
+            if self.checkpoint_path is not None and self.iterations % self.checkpoint_every == 0:
+                self.save_checkpoint(self.checkpoint_path, x)
+
+
+class AsyncOptimalGradientDescent(AsyncGradientDescentMixin, OptimalGradientDescent):
+    ONE_DIM_METHODS = {
+        "golden_section": AsyncGoldenSection,
+        "dsk_powell": AsyncDSKPowell,
+    }
+
+    def __init__(self, *args, **params):
+        super().__init__(*args, **params)
+        one_dim_method = params.get("one_dim_method", "golden_section").lower()
+        if one_dim_method not in self.ONE_DIM_METHODS:
+            raise ValueError(f"Unknown async one_dim_method {one_dim_method!r}, use one of {list(self.ONE_DIM_METHODS)}")
+        self.one_dim_method = self.ONE_DIM_METHODS[one_dim_method]
+
+    async def find_step(self, input_step=None):
+        current = self._line = self.history.current
+        sven_step = self.sven_step or self.get_sven_step(current)
+        g = lambda step: self.evaluator(*self._args(current.x + step * current.direction))
+
+        self.stats.count("line_search")
+        with Logger.suppressed(self._report_one_dim_details is False):
+            with self.stats.phase("sven"):
+                bracket = (await AsyncSven(g, 0, sven_step)).bracket
+            with self.stats.phase("one_dim"):
+                step = (await self.one_dim_method(g, *bracket, eps=self.one_dim_eps, bracket=bracket)).x
+
+        return step
+
+    async def update_step(self):
+        self.step = await self.find_step()
+
+
+class AsyncConstGradientDescent(AsyncGradientDescentMixin, ConstGradientDescent):
+    pass
+
+
+# Factory:
+
+
+class AsyncGradientDescent:
+    """
+        >>> async def fn(x1, x2):
+        ...     return await simulation(x1, x2)
+        >>> optimizer = await AsyncGradientDescent(fn, start_point, max_concurrency=8, timeout=5.0).start()
+    """
+
+    def __new__(cls, fn, start_point, step=None, grad=None, **params):
+        if "modification" in params:
+            raise ValueError("modifications are not supported for async objectives")
+        if step is None:
+            return AsyncOptimalGradientDescent(fn, start_point, step=step, grad=grad, **params)
+        return AsyncConstGradientDescent(fn, start_point, step=step, grad=grad, **params)
@@ -0,0 +1,91 @@
+from utils.Logger import Logger
+from utils.AsyncEvaluator import AsyncEvaluator
+from methods.Sven import Sven, Bracket
+
+
+class AsyncSven(Sven):
+    """
+        Алгоритм Свена для `async def` функций
+        Three probes f(x0-step), f(x0), f(x0+step) are evaluated concurrently.
+
+        >>> sven = await AsyncSven(fn, 0, 0.1, max_concurrency=3, timeout=1.0)
+        >>> sven.interval, sven.bracket
+    """
+
+    def __init__(self, fn, start_point, step, max_concurrency=None, timeout=None):
+        self.f = AsyncEvaluator(fn, max_concurrency, timeout)
+        self.start_point = start_point
+        self._start_step = step
+
+        self.iterations = 0
+
+        self.interval = None
+        self.bracket = None
+        self.x = None
+        self.step = None
+        self._fx_start = None
+        self._fx_step = None
+        self._fx_back = None
+
+    def __await__(self):
+        return self.run().__await__()
+
+    async def run(self):
+        step = self._start_step
+        with Logger("Sven interval"):
+            if await self._set_step(step) is False:
+                self.interval = [self.start_point-step, self.start_point+step]
+                self.bracket = Bracket(*self.interval, [(self.start_point-step, self._fx_back),
+                                                        (self.start_point, self._fx_start),
+                                                        (self.start_point+step, self._fx_step)])
+                self.x = sum(self.interval) / 2
+                self._report()
+            else:
+                await self.set_interval()
+        return self
+
+    async def _set_step(self, step):
+        """ see `Sven._set_step` """
+        x0 = self.start_point
+
+        fx, fx_neg, fx_pos = await self.f.map([(x0,), (x0 - step,), (x0 + step,)])
+
+        self._fx_start = fx
+        if fx_neg >= fx >= fx_pos:
+            self.step = step
+            self._fx_step, self._fx_back = fx_pos, fx_neg
+            return True
+        if fx_neg <= fx <= fx_pos:
+            self.step = -step
+            self._fx_step, self._fx_back = fx_neg, fx_pos
+            return True
+        self._fx_step, self._fx_back = fx_pos, fx_neg
+        return False
+
+    async def set_interval(self):
+        """ see `Sven.set_interval`, every next point depends on the previous one, so they are sequential """
+        headers = ["k", "x_k", "∆*2^k", "x_(k+1)", "f(x_k)", "f(x_(k+1))"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        x0, fx0 = self.start_point, self._fx_start
+        previous = (self.start_point - self.step, self._fx_back)
+        while True:
+            i = self.iterations
+            step = self.step * 2**i
+            x1 = x0 + step
+            fx1 = self._fx_step if i == 0 else await self.f(x1)
+            Logger.debug(log_pattern, i, x0, step, x1, fx0, fx1)
+
+            if self.should_stop(fx0, fx1):
+                self.iterations += 1    # adjust
+                self.interval = sorted([x0-step/2, x0+step/2])
+                self.bracket = Bracket(*self.interval, [previous, (x0, fx0), (x1, fx1)])
+                break
+
+            previous = (x0, fx0)
+            x0, fx0 = x1, fx1
+            self.iterations += 1
+
+        self.x = sum(self.interval) / 2
+        self._report()
@@ -0,0 +1,171 @@
+""" Метод наискорейшего спуска из многих начальных точек одновременно """
+
+
+import numpy as np
+
+from utils.Logger import Logger
+from utils.utils import batch_gradient, evaluate_points
+from utils.Stats import Stats, broadcast_points
+
+from methods.BatchOneDim import BatchSven, BatchGoldenSection, BatchFastGoldenSection, BatchDSKPowell
+
+
+class BatchGradientDescent:
+
+    """
+        Runs N independent gradient descents in lock-step:
+            X_(k+1) = X_k + step_k * direction_k,   X_k has shape (N, n)
+
+        fn is evaluated once per stage for all active points, so it should broadcast like `fn(xgrid, ygrid)`
+        (otherwise it is called point by point, see `evaluate_points`). With the numeric forward gradient
+        the points and their shifted copies are one call of fn per iteration, other gradients need one more.
+        Every trajectory stops on its own `criteria`/`criteria_eps`, as `GradientDescent` does.
+
+        step=None - optimal step (`BatchSven` + `one_dim_method` for all points at once, see `methods.BatchOneDim`),
+        step=float - const step (halved for the point where f(x) grows).
+    """
+
+    MAX_ITERATIONS = 2000
+    ONE_DIM_METHODS = {
+        "golden_section": BatchGoldenSection,
+        "fast_golden_section": BatchFastGoldenSection,
+        "dsk_powell": BatchDSKPowell,
+    }
+
+    def __init__(self, fn, start_points, step=None, grad=None, **params):
+        """ :param grad: should be a function that takes np.ndarray (N, n) and returns np.ndarray (N, n) """
+
+        self.stats = Stats()
+        self.stats_hook = params.get("stats_hook", None)
+        self.f = self.stats.counted(fn, "fn", broadcast_points)    # "fn" - points, "fn_calls" - calls
+        self.start_points = np.atleast_2d(start_points).astype(float)
+        self.TYPE = "optimal" if step is None else "const"
+
+        N = len(self.start_points)
+        self.step = np.full(N, np.nan if step is None else float(step))
+
+        self._grad_takes_fx = grad is None     # numeric gradient reuses f(x) of the iteration
+        self._grad_gives_fx = False            # forward gradient evaluates f(x) in the same call
+        if grad is None:
+            grad_h = params.get("grad_h", 0.00001)
+            grad_mode = params.get("grad_mode", "forward")
+            self._grad_gives_fx = grad_mode == "forward"
+            grad = lambda points, fxs=None, with_values=False: batch_gradient(self.f, points, grad_h, grad_mode, fxs,
+                                                                              with_values)
+        else:
+            if callable(grad) is False:
+                raise TypeError("Your gradient is not callable, also it should return np.ndarray")
+        self.grad = self.stats.counted(grad, "grad", lambda points, **kwargs: len(points))
+
+        self.criteria_eps = params.get("criteria_eps", 10**-3)
+        self.criteria = params.get("criteria", 1)
+        self.sven_step = params.get("sven_step", None)
+        self.one_dim_eps = params.get("one_dim_eps", 10**-3)
+        one_dim_method = params.get("one_dim_method", "golden_section").lower()
+        if one_dim_method not in self.ONE_DIM_METHODS:
+            raise ValueError(f"Unknown batch one_dim_method {one_dim_method!r}, use one of {list(self.ONE_DIM_METHODS)}")
+        self.one_dim_method = self.ONE_DIM_METHODS[one_dim_method]
+
+        # results:
+        self.x = None
+        self.fx = None
+        self.iterations = np.zeros(N, dtype=int)
+        self.converged = np.zeros(N, dtype=bool)
+
+    def start(self):
+        with Logger(f"Batch Gradient Descent ({self.TYPE}, N={len(self.start_points)})"):
+            with self.stats.phase("run"):
+                self.find_x()
+            Logger.log("{}", self.stats)
+        if self.stats_hook is not None:
+            self.stats_hook(self.stats)
+        return self
+
+    # main
+
+    def _check_criteria(self, x, fx, gx_norm, last_x, last_fx, has_last):
+        if self.criteria == 0:
+            dx = np.linalg.norm(x - last_x, axis=1) / np.linalg.norm(last_x, axis=1)
+            return has_last & (dx <= self.criteria_eps) & (np.abs(fx - last_fx) <= self.criteria_eps)
+        if self.criteria == 1:
+            return gx_norm <= self.criteria_eps
+        return np.zeros(len(x), dtype=bool)
+
+    def find_x(self):
+        headers = ["i", "active", "min f(x)", "max ||∇f(x)||"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        N = len(self.start_points)
+        x = self.start_points.copy()
+        fx = np.empty(N)
+        # last record of the history for every point (criteria 0 and const step)
+        last_x, last_fx = x.copy(), np.full(N, np.inf)
+        has_last = np.zeros(N, dtype=bool)
+
+        active = np.ones(N, dtype=bool)
+        i = 0
+        while True:
+            rows = np.flatnonzero(active)
+            xa = x[rows]
+
+            if self._grad_gives_fx is True:
+                with self.stats.phase("gradient"):
+                    fa, ga = self.grad(xa, with_values=True)
+            else:
+                fa = evaluate_points(self.f, xa)
+                with self.stats.phase("gradient"):
+                    ga = self.grad(xa, fxs=fa) if self._grad_takes_fx is True else self.grad(xa)
+            norm = np.linalg.norm(ga, axis=1)
+            fx[rows] = fa
+
+            Logger.debug(log_pattern, i, len(rows), fa.min(), norm.max())
+
+            passed = self._check_criteria(xa, fa, norm, last_x[rows], last_fx[rows], has_last[rows])
+            stop = passed | (self.iterations[rows] >= self.MAX_ITERATIONS)
+            self.converged[rows[passed]] = True
+            active[rows[stop]] = False
+
+            go = ~stop
+            rows, xa, fa, ga, norm = rows[go], xa[go], fa[go], ga[go], norm[go]
+            if len(rows) == 0:
+                break
+
+            if self.TYPE == "const":
+                direction = -ga / norm[:, None]
+                grows = has_last[rows] & (fa > last_fx[rows])
+                # like history.pop(): the point where f grows doesn't become the last record
+                keep = ~grows
+                last_x[rows[keep]], last_fx[rows[keep]] = xa[keep], fa[keep]
+                self.step[rows[grows]] /= 2
+            else:
+                direction = -ga
+                last_x[rows], last_fx[rows] = xa, fa
+                self.step[rows] = self.find_step(xa, direction)
+            has_last[rows] = True
+
+            x[rows] = xa + self.step[rows, None] * direction
+            self.iterations[rows] += 1
+            i += 1
+
+        self.x, self.fx = x, fx
+        Logger.log("---> converged {}/{} points, max i={}", self.converged.sum(), N, self.iterations.max(), new_line=True)
+        return x
+
+    # optimal step
+
+    def find_step(self, x, direction):
+        g = lambda steps, idx: evaluate_points(self.f, x[idx] + steps[:, None] * direction[idx])
+
+        if self.sven_step is not None:
+            sven_step = np.full(len(x), float(self.sven_step))
+        else:
+            x_norm = np.linalg.norm(x, axis=1)
+            sven_step = 0.1 * np.where(x_norm > 0, x_norm, 1.0) / np.linalg.norm(direction, axis=1)
+
+        self.stats.count("line_search", len(x))
+        with Logger.suppressed():
+            with self.stats.phase("sven"):
+                bracket = BatchSven(g, np.zeros(len(x)), sven_step).bracket
+            with self.stats.phase("one_dim"):
+                return self.one_dim_method(g, *bracket, eps=self.one_dim_eps, bracket=bracket).x
@@ -0,0 +1,388 @@
+""" Одномерные методы для многих независимых интервалов одновременно """
+
+
+import numpy as np
+
+from utils.Logger import Logger
+
+
+class BatchBracket:
+    """
+        `methods.Sven.Bracket` for M searches: intervals a, b with shape (M,)
+        and known points xs, fxs with shape (M, 3) sorted by x.
+        valid - searches where the middle point is the best one, only they may be seeded.
+
+        Unpacks as the intervals: `BatchDSKPowell(fn, *bracket, bracket=bracket)`.
+    """
+
+    def __init__(self, a, b, xs, fxs):
+        order = np.argsort(xs, axis=1)
+        self.a = a
+        self.b = b
+        self.xs = np.take_along_axis(xs, order, axis=1)
+        self.fxs = np.take_along_axis(fxs, order, axis=1)
+        self.valid = np.argmin(self.fxs, axis=1) == 1
+
+    @property
+    def interval(self):
+        return self.a, self.b
+
+    def __iter__(self):
+        return iter(self.interval)
+
+    def __len__(self):
+        return len(self.a)
+
+
+class BatchOneDim:
+    """
+        Base of batch one-dim methods: M independent searches advance in lock-step,
+        every step evaluates fn once for all searches which are not finished yet.
+
+        fn(x, idx) -> np.ndarray: values of searches `idx` in points `x` (both arrays of the same length),
+        e.g. `lambda t, idx: f(x0[idx] + t[:, None] * d[idx])`. For one function of all searches - `lambda t, idx: f(t)`.
+    """
+
+    MAX_ITERATIONS = 2000
+
+    def __init__(self, fn, size):
+        self.f = fn
+        self.iterations = np.zeros(size, dtype=int)
+        self.calls = 0
+        self.evaluations = 0
+        self.x = None
+
+    def _evaluate(self, x, idx):
+        self.calls += 1
+        self.evaluations += len(idx)
+        return np.asarray(self.f(x, idx), dtype=float)
+
+    def _report(self, title):
+        Logger.log("---> {}: {} searches, max i={}, {} calls of fn ({} evaluations)",
+                   title, len(self.iterations), self.iterations.max(initial=0), self.calls, self.evaluations,
+                   new_line=True)
+
+
+class BatchSven(BatchOneDim):
+    """
+        Алгоритм Свена для многих начальных точек
+        x_(k+1) = x_k +- step * 2^k for every search, see `methods.Sven.Sven`
+
+        Results: `interval` - (a, b) arrays, `x` - their centers, `iterations`,
+        `bracket` - `BatchBracket` with the last three points of every search.
+    """
+
+    def __init__(self, fn, start_points, steps):
+        """
+            :param start_points: np.ndarray (M,)
+            :param steps: np.ndarray (M,) or number
+        """
+        start_points = np.asarray(start_points, dtype=float)
+        super().__init__(fn, len(start_points))
+        self.start_point = start_points
+        self.steps = np.broadcast_to(np.asarray(steps, dtype=float), start_points.shape).copy()
+
+        self.interval = None
+        self.bracket = None
+
+        with Logger("Batch Sven interval"):
+            self.set_interval()
+
+    def set_interval(self):
+        headers = ["k", "active", "max |∆*2^k|"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        x0, step = self.start_point.copy(), self.steps
+        M = len(x0)
+        idx = np.arange(M)
+
+        # f(x0), f(x0-step), f(x0+step) of all searches in one call
+        values = self._evaluate(np.concatenate([x0, x0 - step, x0 + step]), np.tile(idx, 3))
+        fx0, fx_neg, fx_pos = values[:M], values[M:2*M], values[2*M:]
+
+        plus = (fx_neg >= fx0) & (fx0 >= fx_pos)
+        minus = ~plus & (fx_neg <= fx0) & (fx0 <= fx_pos)
+        step = np.where(plus, step, -step)
+        fx1 = np.where(plus, fx_pos, fx_neg)
+        fx_back = np.where(plus, fx_neg, fx_pos)
+
+        # searches without direction: interval is [x0-step, x0+step]
+        a, b = x0 - np.abs(step), x0 + np.abs(step)
+        xs = np.column_stack([x0 - step, x0, x0 + step])
+        fxs = np.column_stack([fx_back, fx0, fx1])
+        previous, fx_previous = x0 - step, fx_back
+
+        active = plus | minus
+        k = 0
+        while active.any():
+            rows = np.flatnonzero(active)
+            delta = step[rows] * 2**k
+            x1 = x0[rows] + delta
+            if k > 0:
+                fx1[rows] = self._evaluate(x1, rows)
+            Logger.debug(log_pattern, k, len(rows), np.abs(delta).max())
+
+            stop = (fx0[rows] < fx1[rows]) | (k > self.MAX_ITERATIONS)
+            if (k > self.MAX_ITERATIONS) and stop.any():
+                Logger.warning("! MAX_RECURSION_DEPTH reached !")
+            self.iterations[rows] += 1
+
+            done, go = rows[stop], rows[~stop]
+            bounds = np.sort([x0[done] - delta[stop]/2, x0[done] + delta[stop]/2], axis=0)
+            a[done], b[done] = bounds
+            xs[done] = np.column_stack([previous[done], x0[done], x1[stop]])
+            fxs[done] = np.column_stack([fx_previous[done], fx0[done], fx1[done]])
+
+            previous[go], fx_previous[go] = x0[go], fx0[go]
+            x0[go], fx0[go] = x1[~stop], fx1[go]
+            active[done] = False
+            k += 1
+
+        self.interval = (a, b)
+        self.bracket = BatchBracket(a, b, xs, fxs)
+        self.x = (a + b) / 2
+        self._report("found intervals")
+
+
+class BatchGoldenSection(BatchOneDim):
+    """
+        Золотое сечение для многих интервалов
+        x1 = a + 0.382*L,   x2 = a + 0.618*L - both points are evaluated on every iteration, see `methods.GoldenSection`
+
+        Every search stops on its own |b-a| <= eps. Results: `x`, `interval` - (a, b) arrays, `iterations`.
+    """
+
+    X1_COEFFICIENT = 0.382
+    X2_COEFFICIENT = 0.618
+
+    def __init__(self, fn, a, b, eps=0.001, bracket=None):
+        """
+            :param a: np.ndarray (M,) of left bounds
+            :param b: np.ndarray (M,) of right bounds
+            :param eps: number or np.ndarray (M,)
+            :param bracket: `BatchBracket`, its best points are probes of the first iteration (see `GoldenSection.seed`)
+        """
+        self.a = np.array(a, dtype=float)
+        self.b = np.array(b, dtype=float)
+        super().__init__(fn, len(self.a))
+        self.eps = np.broadcast_to(np.asarray(eps, dtype=float), self.a.shape)
+        self.interval = None
+
+        M = len(self.a)
+        self._x1, self._x2 = np.zeros(M), np.zeros(M)
+        self._fx1, self._fx2 = np.zeros(M), np.zeros(M)
+        self._known1, self._known2 = np.zeros(M, dtype=bool), np.zeros(M, dtype=bool)
+        if bracket is not None:
+            self.seed(bracket)
+
+        with Logger("Batch Golden Section"):
+            self.set_interval()
+
+    def seed(self, bracket):
+        """ moves [a, b] of valid searches into their known triples (l, m, r) like `GoldenSection.seed` """
+        (l, m, r), (_, fm, _) = bracket.xs.T, bracket.fxs.T
+        X1, X2 = self.X1_COEFFICIENT, self.X2_COEFFICIENT
+
+        a, b = np.minimum(self.a, self.b), np.maximum(self.a, self.b)
+        tolerance = 10**-12 * (r - l)
+        # candidates (M, 4): m is x1 or x2 from the left end l or from the right end r
+        lefts = np.column_stack([l, l, r - (r-m)/X2, r - (r-m)/X1])
+        rights = np.column_stack([l + (m-l)/X1, l + (m-l)/X2, r, r])
+        as_x1 = np.array([True, False, True, False])
+        inside = ((lefts >= (l - tolerance)[:, None]) & (lefts <= (a + tolerance)[:, None])
+                  & (rights >= (b - tolerance)[:, None]) & (rights <= (r + tolerance)[:, None]))
+        lengths = np.where(inside, rights - lefts, np.inf)
+        best = np.argmin(lengths, axis=1)
+        shortest = lengths[np.arange(len(best)), best]
+        rows = np.flatnonzero(bracket.valid & inside.any(axis=1)
+                              & (self.iterations_for(shortest) <= self.iterations_for(b - a)))
+
+        self.a[rows], self.b[rows] = lefts[rows, best[rows]], rights[rows, best[rows]]
+        rows1, rows2 = rows[as_x1[best[rows]]], rows[~as_x1[best[rows]]]
+        self._x1[rows1], self._fx1[rows1], self._known1[rows1] = m[rows1], fm[rows1], True
+        self._x2[rows2], self._fx2[rows2], self._known2[rows2] = m[rows2], fm[rows2], True
+
+    def iterations_for(self, length):
+        """ :return: (M,) numbers of iterations which shrink intervals of `length` to eps, see `GoldenSection` """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            n = np.ceil(np.log(self.eps / length) / np.log(self.X2_COEFFICIENT))
+        return np.where(length <= self.eps, 0, n)
+
+    def should_stop(self, rows):
+        return (np.abs(self.b[rows] - self.a[rows]) <= self.eps[rows]) | (self.iterations[rows] > self.MAX_ITERATIONS)
+
+    def set_interval(self):
+        X1, X2 = self.X1_COEFFICIENT, self.X2_COEFFICIENT
+        a, b, x1, x2, fx1, fx2 = self.a, self.b, self._x1, self._x2, self._fx1, self._fx2
+        known1, known2 = self._known1, self._known2
+
+        headers = ["i", "active", "max L"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        active = ~self.should_stop(np.arange(len(a)))
+        i = 0
+        while active.any():
+            i += 1
+            rows = np.flatnonzero(active)
+            self.iterations[rows] += 1
+
+            # missing probes of all searches in one call
+            need1, need2 = rows[~known1[rows]], rows[~known2[rows]]
+            x1[need1] = a[need1] + X1 * (b[need1] - a[need1])
+            x2[need2] = a[need2] + X2 * (b[need2] - a[need2])
+            values = self._evaluate(np.concatenate([x1[need1], x2[need2]]), np.concatenate([need1, need2]))
+            fx1[need1], fx2[need2] = values[:len(need1)], values[len(need1):]
+            Logger.debug(log_pattern, i, len(rows), (b[rows] - a[rows]).max())
+
+            left = fx1[rows] <= fx2[rows]
+            self.shrink(rows[left], rows[~left])
+
+            active[rows] = ~self.should_stop(rows)
+
+        if (self.iterations > self.MAX_ITERATIONS).any():
+            Logger.warning("! MAX_RECURSION_DEPTH reached !")
+        self.interval = (a, b)
+        self.x = (a + b) / 2
+        self._report("found x")
+
+    def shrink(self, left, right):
+        """ [a, x2] for searches `left` (f(x1) <= f(x2)), [x1, b] for searches `right`, probes are evaluated again """
+        self.b[left] = self._x2[left]
+        self.a[right] = self._x1[right]
+        self._known1[left], self._known2[left] = False, False
+        self._known1[right], self._known2[right] = False, False
+
+
+class BatchFastGoldenSection(BatchGoldenSection):
+    """
+        Золотое сечение для многих интервалов с повторным использованием точки
+        x1 = a + (1-τ)*L,   x2 = a + τ*L,   τ = (√5-1)/2 - one point is reused, see `methods.FastGoldenSection`
+    """
+
+    X1_COEFFICIENT = (3 - 5**0.5) / 2
+    X2_COEFFICIENT = (5**0.5 - 1) / 2
+
+    def shrink(self, left, right):
+        """ the kept probe becomes the other probe of the next iteration """
+        x1, x2, fx1, fx2 = self._x1, self._x2, self._fx1, self._fx2
+        self.b[left] = x2[left]
+        x2[left], fx2[left], self._known2[left], self._known1[left] = x1[left], fx1[left], True, False
+        self.a[right] = x1[right]
+        x1[right], fx1[right], self._known1[right], self._known2[right] = x2[right], fx2[right], True, False
+
+
+class BatchDSKPowell(BatchOneDim):
+    """
+        ДСК-Пауэлл для многих интервалов, see `methods.DSKPowell`
+        First iteration - vertex of the parabola through (x1, x2, x3) with evaluation of f,
+        next ones - Powell steps on the quadratic model (no evaluations).
+
+        Results: `x`, `iterations`.
+    """
+
+    MAX_ITERATIONS = 500
+
+    def __init__(self, fn, a, b, eps=0.001, bracket=None):
+        """
+            :param a: np.ndarray (M,) of left bounds
+            :param b: np.ndarray (M,) of right bounds
+            :param eps: number or np.ndarray (M,)
+            :param bracket: `BatchBracket`, known triples replace f(a), f((a+b)/2), f(b) of valid searches
+        """
+        a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+        super().__init__(fn, len(a))
+        self.eps = np.broadcast_to(np.asarray(eps, dtype=float), a.shape)
+
+        M = len(a)
+        self.xs = np.column_stack([a, (a+b)/2, b])
+        self.fxs = np.zeros((M, 3))
+        need = np.ones(M, dtype=bool)
+        if bracket is not None:
+            need = ~bracket.valid
+            self.xs[~need], self.fxs[~need] = bracket.xs[~need], bracket.fxs[~need]
+        rows = np.flatnonzero(need)
+        if len(rows) > 0:
+            self.fxs[rows] = self._evaluate(self.xs[rows].T.ravel(), np.tile(rows, 3)).reshape(3, -1).T
+
+        self.x = np.full(M, np.nan)
+
+        with Logger("Batch DSK Powell"):
+            self.find_x()
+
+    def _dsk_x(self, rows):
+        """ vertex of the parabola through the triple, see `DSKPowell._dsk_x` """
+        (x1, x2, x3), (fx1, fx2, fx3) = self.xs[rows].T, self.fxs[rows].T
+        dx = x3 - x2
+        uniform = x2 + dx*(fx1-fx3) / (2*(fx1-2*fx2+fx3))
+        left, right = x2 - x1, x2 - x3
+        r = left * (fx2-fx3)
+        q = right * (fx2-fx1)
+        return np.where(dx == left, uniform, x2 - 0.5 * (left*r - right*q) / (r - q))
+
+    def _powell(self, rows):
+        """ :return: x*, model value in x* """
+        (x1, x2, x3), (fx1, fx2, fx3) = self.xs[rows].T, self.fxs[rows].T
+        a0 = fx1
+        a1 = (fx2 - fx1)/(x2 - x1)
+        a2 = 1/(x3-x2) * ((fx3-fx1)/(x3-x1) - (fx2-fx1)/(x2-x1))
+        x = (x1+x2)/2 - a1/a2 * 0.5
+        return x, a0 + a1*(x-x1) + a2*(x-x1)*(x-x2)
+
+    def update_xs(self, rows, x, fx):
+        """ new x2 is the best of 4 points, x1 and x3 - its neighbours; :return: mask of searches where x2 is on the edge """
+        points = np.column_stack([self.xs[rows], x])
+        values = np.column_stack([self.fxs[rows], fx])
+        order = np.lexsort((values, points), axis=1)    # the order of sorted (x, f(x)) pairs in `DSKPowell`
+        points, values = np.take_along_axis(points, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+        best = np.argmin(values, axis=1)
+        edge = (best == 0) | (best == 3)
+        inner = np.flatnonzero(~edge)
+        window = best[inner, None] + np.arange(-1, 2)
+        self.xs[rows[inner]] = np.take_along_axis(points[inner], window, axis=1)
+        self.fxs[rows[inner]] = np.take_along_axis(values[inner], window, axis=1)
+        self.x[rows[edge]] = points[edge, best[edge]]
+        return edge
+
+    def find_x(self):
+        headers = ["i", "active"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        active = np.ones(len(self.x), dtype=bool)
+        i = 0
+        while active.any():
+            i += 1
+            rows = np.flatnonzero(active)
+            self.iterations[rows] += 1
+            Logger.debug(log_pattern, i, len(rows))
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if i == 1:
+                    x = self._dsk_x(rows)
+                else:
+                    x, fx = self._powell(rows)
+
+            # degenerate triple (flat f or equal points): the best known point is the answer
+            broken = ~np.isfinite(x)
+            if i == 1:
+                fx = np.zeros(len(rows))
+                if (~broken).any():
+                    fx[~broken] = self._evaluate(x[~broken], rows[~broken])
+            x[broken], fx[broken] = self.xs[rows[broken], 1], self.fxs[rows[broken], 1]
+
+            x2, fx2 = self.xs[rows, 1], self.fxs[rows, 1]
+            stop = broken | ((np.abs(fx2 - fx) <= self.eps[rows]) & (np.abs(x2 - x) <= self.eps[rows]))
+            stop |= self.iterations[rows] >= self.MAX_ITERATIONS
+            self.x[rows[stop]] = x[stop]
+            active[rows[stop]] = False
+
+            go = ~stop
+            edge = self.update_xs(rows[go], x[go], fx[go])
+            active[rows[go][edge]] = False
+
+        if (self.iterations >= self.MAX_ITERATIONS).any():
+            Logger.warning("! MAX_ITERATIONS reached !")
+        self._report("found x")
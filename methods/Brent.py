@@ -0,0 +1,127 @@
+import math
+
+from utils.Logger import Logger
+
+
+class Brent:
+    """
+        Одномерный метод поиска Брента (без производных)
+
+        Each iteration tries a parabola through the three best points x, w, v:
+            u = x - 0.5 * ((x-w)^2*(f(x)-f(v)) - (x-v)^2*(f(x)-f(w))) / ((x-w)*(f(x)-f(v)) - (x-v)*(f(x)-f(w)))
+        and falls back to a golden section step if the parabola step is out of [a, b] or doesn't shrink fast enough.
+        One evaluation of f per iteration.
+    """
+
+    BRACKETING = True       # takes interval [a, b] from Sven
+    MAX_ITERATIONS = 500
+    GOLDEN_COEFFICIENT = (3 - 5**0.5) / 2
+
+    def __init__(self, fn, a, b, eps=0.001, bracket=None):
+        """ :param bracket: `methods.Sven.Bracket`, search starts on its known triple (l, m, r) with x, w, v from it """
+        self.f = fn
+        self.a = a
+        self.b = b
+        self.eps = eps
+
+        self.iterations = 0
+        self.evaluations = 0
+        self.interval = None
+        self.x = None
+        self.fx = None
+        self._triple = bracket.triple() if bracket is not None else None
+
+        with Logger("Brent"):
+            self.find_x()
+
+    def _evaluate(self, x):
+        self.evaluations += 1
+        return self.f(x)
+
+    def should_stop(self, x, a, b):
+        """
+            Criteria: |x - (a+b)/2| <= eps - (b-a)/2, it is passed when b-a <= eps
+            :return: True if criteria is passed or reached max_recursion_depth, otherwise False
+        """
+        if abs(x - (a+b)/2) <= self.eps - (b-a)/2:
+            return True
+        if self.iterations >= self.MAX_ITERATIONS:
+            Logger.warning("! MAX_ITERATIONS reached !")
+            return True
+        return False
+
+    def find_x(self):
+        C = self.GOLDEN_COEFFICIENT
+        tol1 = self.eps / 2     # minimal distance between probes
+
+        headers = ["i", "a", "b", "x", "f(x)", "u", "f(u)", "step"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        a, b = sorted([self.a, self.b])
+        d = e = 0.0     # last and before last step
+        if self._triple is None:
+            x = w = v = a + C * (b-a)
+            fx = fw = fv = self._evaluate(x)
+        else:
+            a, b = self._triple[0][0], self._triple[2][0]
+            (x, fx), (w, fw), (v, fv) = sorted(self._triple, key=lambda point: point[1])
+            e = b - a       # three different points, parabola may be tried at once
+
+        while self.should_stop(x, a, b) is False:
+            self.iterations += 1
+            xm = (a+b) / 2
+
+            kind = "golden"
+            if abs(e) > tol1:
+                r = (x-w) * (fx-fv)
+                q = (x-v) * (fx-fw)
+                p = (x-v)*q - (x-w)*r
+                q = 2 * (q-r)
+                if q > 0:
+                    p = -p
+                q = abs(q)
+                e_prev, e = e, d
+
+                if abs(p) < abs(0.5*q*e_prev) and q*(a-x) < p < q*(b-x):
+                    kind = "parabolic"
+                    d = p / q
+                    u = x + d
+                    if u-a < 2*tol1 or b-u < 2*tol1:
+                        d = math.copysign(tol1, xm-x)
+
+            if kind == "golden":
+                e = a-x if x >= xm else b-x
+                d = C * e
+
+            u = x + d if abs(d) >= tol1 else x + math.copysign(tol1, d)
+            fu = self._evaluate(u)
+
+            Logger.debug(log_pattern, self.iterations, a, b, x, fx, u, fu, kind)
+
+            if fu <= fx:
+                if u >= x:
+                    a = x
+                else:
+                    b = x
+                v, w, x = w, x, u
+                fv, fw, fx = fw, fx, fu
+            else:
+                if u < x:
+                    a = u
+                else:
+                    b = u
+                if fu <= fw or w == x:
+                    v, w = w, u
+                    fv, fw = fw, fu
+                elif fu <= fv or v == x or v == w:
+                    v, fv = u, fu
+
+        self.interval = [a, b]
+        self.x, self.fx = x, fx
+        self._report()
+        return self.x
+
+    def _report(self):
+        Logger.log("---> found x={:.24f} (f(x)={:.24f}) on i={} ({} evaluations)",
+                   self.x, self.fx, self.iterations, self.evaluations, new_line=True)
@@ -1,3 +1,5 @@
+import math
+
 from utils.Logger import Logger
 
 
@@ -9,20 +11,26 @@ class DSKPowell:
         x* = x2 + ( dx*(f(x1)-f(x3)) ) / ( 2*(f(x1)-2*f(x2)+f(x3) )
     """
 
+    BRACKETING = True       # takes interval [a, b] from Sven
     MAX_ITERATIONS = 500
 
-    def __init__(self, fn, a, b, eps=0.001):
+    def __init__(self, fn, a, b, eps=0.001, bracket=None):
         """
             :param a: left bound
             :param b: right bound
+            :param bracket: `methods.Sven.Bracket`, its known triple is used instead of f(a), f((a+b)/2), f(b)
         """
         self.f = fn
-        self.x1 = a
-        self.fx1 = self.f(self.x1)
-        self.x2 = (a+b)/2   # <-- central point
-        self.fx2 = self.f(self.x2)
-        self.x3 = b
-        self.fx3 = self.f(self.x3)
+        triple = bracket.triple() if bracket is not None else None
+        if triple is not None:
+            (self.x1, self.fx1), (self.x2, self.fx2), (self.x3, self.fx3) = triple
+        else:
+            self.x1 = a
+            self.fx1 = self.f(self.x1)
+            self.x2 = (a+b)/2   # <-- central point
+            self.fx2 = self.f(self.x2)
+            self.x3 = b
+            self.fx3 = self.f(self.x3)
         self.eps = eps
 
         self.iterations = 0
@@ -44,7 +52,7 @@ class DSKPowell:
                 abs(self.x2 - x) <= self.eps]) is True:
             return True
         if self.iterations >= self.MAX_ITERATIONS:
-            Logger.log("! MAX_ITERATIONS reached !")
+            Logger.warning("! MAX_ITERATIONS reached !")
             return True
         return False
 
@@ -56,15 +64,16 @@ class DSKPowell:
 
         headers = ["i", "x1", "x2", "x3", "f(x1)", "f(x2)", "f(x3)", "x*", "f(x*)"]
         log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
-        Logger.log(log_pattern.format(*headers))
+        Logger.debug(log_pattern, *headers)
 
         while True:
             self.iterations += 1
 
-            method = self._dsk if self.iterations == 1 else self._powell
-            x, fx = method()
+            x, fx = self.next_x()
+            if fx is None:
+                fx = self.f(x)
 
-            Logger.log(log_pattern.format(self.iterations, self.x1, self.x2, self.x3, self.fx1, self.fx2, self.fx3, x, fx))
+            Logger.debug(log_pattern, self.iterations, self.x1, self.x2, self.x3, self.fx1, self.fx2, self.fx3, x, fx)
 
             if self.should_stop(x, fx) is True:
                 self.x = x
@@ -79,19 +88,40 @@ class DSKPowell:
     # utils
 
     def _report(self):
+        if Logger.is_enabled(Logger.INFO) is False:
+            return
         fx = self.f(self.x)
-        Logger.log(f"---> found x={self.x:.24f} (f(x)={fx:.24f}) on i={self.iterations}", new_line=True)
+        Logger.log("---> found x={:.24f} (f(x)={:.24f}) on i={}", self.x, fx, self.iterations, new_line=True)
+
+    def next_x(self):
+        """
+            x* of the iteration: DSK on the first one, Powell on others
+            :return: (x*, f(x*)) - value of Powell model, f(x*) is None if it should be evaluated (DSK),
+                     the best known point on a degenerate triple (flat f or equal points)
+        """
+        try:
+            x, fx = (self._dsk_x(), None) if self.iterations == 1 else self._powell()
+        except ZeroDivisionError:
+            x = math.nan
+        if math.isfinite(x) is False:
+            return self.x2, self.fx2
+        return x, fx
 
-    def _dsk(self):
-        """ first iteration (method DSK) """
+    def _dsk_x(self):
+        """
+            x* of the first iteration without evaluation of f(x*)
+            A triple from Sven bracket is not uniform, then x* is the vertex of the parabola through it:
+            x* = x2 - 0.5 * ((x2-x1)^2*(f(x2)-f(x3)) - (x2-x3)^2*(f(x2)-f(x1))) / ((x2-x1)*(f(x2)-f(x3)) - (x2-x3)*(f(x2)-f(x1)))
+        """
         dx = self.x3 - self.x2
         _dx = self.x2 - self.x1
-        Logger.assertion(bool(dx == _dx), f"dx = x3-x2 = x2-x1, but you has {dx:.48f} != {_dx:.48f}")
+        if dx == _dx:
+            return self.x2 + dx*(self.fx1-self.fx3) / (2*(self.fx1-2*self.fx2+self.fx3))
 
-        x = self.x2 + dx*(self.fx1-self.fx3) / (2*(self.fx1-2*self.fx2+self.fx3))
-        fx = self.f(x)
-
-        return x, fx
+        left, right = self.x2 - self.x1, self.x2 - self.x3
+        r = left * (self.fx2-self.fx3)
+        q = right * (self.fx2-self.fx1)
+        return self.x2 - 0.5 * (left*r - right*q) / (r - q)
 
     def _powell(self):
         """ another iterations (method Powell) """
@@ -0,0 +1,61 @@
+from utils.Logger import Logger
+from methods.GoldenSection import GoldenSection
+
+
+class FastGoldenSection(GoldenSection):
+    """
+        Одномерный метод поиска 'Золотое сечение' с повторным использованием точки
+        x1 = a + (1-τ)*L,   x2 = a + τ*L,   τ = (√5-1)/2
+
+        τ^2 = 1-τ, so after the interval shrinks one of x1, x2 is an inner point of the new interval
+        and every iteration needs only one evaluation of f
+    """
+
+    X1_COEFFICIENT = (3 - 5**0.5) / 2
+    X2_COEFFICIENT = (5**0.5 - 1) / 2
+
+    def __init__(self, fn, a, b, eps=0.001, bracket=None):
+        self.evaluations = 0
+        super().__init__(fn, a, b, eps, bracket)
+
+    def _evaluate(self, x):
+        self.evaluations += 1
+        return self.f(x)
+
+    def set_interval(self):
+        X1, X2 = self.X1_COEFFICIENT, self.X2_COEFFICIENT
+
+        headers = ["i", "a", "x1", "x2", "b", "L", "f(x1)", "f(x2)"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        x1 = x2 = None
+        fx1 = fx2 = None    # None means that point should be (re)calculated
+        while True:
+            if self.should_stop() is True:
+                self.interval = [self.a, self.b]
+                break
+
+            self.iterations += 1
+
+            L = self.b - self.a
+            if fx1 is None:
+                x1, fx1 = self._probe("x1", self.a + X1 * L)
+            if fx2 is None:
+                x2, fx2 = self._probe("x2", self.a + X2 * L)
+            self._seed = None
+
+            Logger.debug(log_pattern, self.iterations, self.a, x1, x2, self.b, L, fx1, fx2)
+
+            if fx1 <= fx2:
+                self.b = x2
+                x2, fx2 = x1, fx1
+                fx1 = None
+            else:
+                self.a = x1
+                x1, fx1 = x2, fx2
+                fx2 = None
+
+        self.x = sum(self.interval) / 2
+        Logger.log("---> found x={:.24f} and interval={} on i={} ({} evaluations)",
+                   self.x, self.interval, self.iterations, self.evaluations, new_line=True)
@@ -1,3 +1,5 @@
+import math
+
 from utils.Logger import Logger
 
 
@@ -7,11 +9,13 @@ class GoldenSection:
         x1 = a + 0.382*L,   x2 = a + 0.618*L
     """
 
+    BRACKETING = True       # takes interval [a, b] from Sven
     MAX_ITERATIONS = 2000
     X1_COEFFICIENT = 0.382
     X2_COEFFICIENT = 0.618
 
-    def __init__(self, fn, a, b, eps=0.001):
+    def __init__(self, fn, a, b, eps=0.001, bracket=None):
+        """ :param bracket: `methods.Sven.Bracket`, its best point is a probe of the first iteration (see `seed`) """
         self.f = fn
         self.a = a
         self.b = b
@@ -20,10 +24,54 @@ class GoldenSection:
         self.interval = None
         self.x = None
         self.eps = eps
+        self._seed = self.seed(bracket)
 
         with Logger("Golden Section"):
             self.set_interval()
 
+    def seed(self, bracket):
+        """
+            Moves [a, b] into the known triple (l, m, r) of the bracket, so that m is x1 or x2 of the first iteration:
+            [l, l + (m-l)/X1], [l, l + (m-l)/X2], [r - (r-m)/X2, r] or [r - (r-m)/X1, r].
+            The shortest of them inside [l, r] which still covers [a, b] is taken, and only if the search
+            needs no more iterations than on [a, b] - a longer interval costs more than the saved evaluation.
+            :return: ("x1" | "x2", m, f(m)) or None
+        """
+        triple = bracket.triple() if bracket is not None else None
+        if triple is None:
+            return None
+        (l, _), (m, fm), (r, _) = triple
+        X1, X2 = self.X1_COEFFICIENT, self.X2_COEFFICIENT
+
+        a, b = min(self.a, self.b), max(self.a, self.b)
+        tolerance = 10**-12 * (r - l)
+        candidates = [(l, l + (m-l)/X1, "x1"), (l, l + (m-l)/X2, "x2"),
+                      (r - (r-m)/X2, r, "x1"), (r - (r-m)/X1, r, "x2")]
+        candidates = [c for c in candidates
+                      if l - tolerance <= c[0] <= a + tolerance and b - tolerance <= c[1] <= r + tolerance]
+        if not candidates:
+            return None
+        left, right, name = min(candidates, key=lambda c: c[1] - c[0])
+        if self.iterations_for(right - left) > self.iterations_for(b - a):
+            return None
+        self.a, self.b = left, right
+        return name, m, fm
+
+    def iterations_for(self, length):
+        """ :return: number of iterations which shrink the interval of `length` to eps """
+        if length <= self.eps:
+            return 0
+        return math.ceil(math.log(self.eps / length) / math.log(self.X2_COEFFICIENT))
+
+    def _evaluate(self, x):
+        return self.f(x)
+
+    def _probe(self, name, x):
+        """ :return: (x, f(x)), the seeded probe of the first iteration is not evaluated """
+        if self._seed is not None and self._seed[0] == name:
+            return self._seed[1:]
+        return x, self._evaluate(x)
+
     # main
 
     def should_stop(self):
@@ -34,7 +82,7 @@ class GoldenSection:
         if abs(self.b - self.a) <= self.eps:
             return True
         if self.iterations > self.MAX_ITERATIONS:
-            Logger.log("! MAX_RECURSION_DEPTH reached !")
+            Logger.warning("! MAX_RECURSION_DEPTH reached !")
             return True
         return False
 
@@ -43,7 +91,7 @@ class GoldenSection:
 
         headers = ["i", "a", "x1", "x2", "b", "L", "f(x1)", "f(x2)"]
         log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
-        Logger.log(log_pattern.format(*headers))
+        Logger.debug(log_pattern, *headers)
 
         while True:
             if self.should_stop() is True:
@@ -53,12 +101,11 @@ class GoldenSection:
             self.iterations += 1
 
             L = self.b - self.a
-            x1 = self.a + X1 * L
-            x2 = self.a + X2 * L
-            fx1 = self.f(x1)
-            fx2 = self.f(x2)
+            x1, fx1 = self._probe("x1", self.a + X1 * L)
+            x2, fx2 = self._probe("x2", self.a + X2 * L)
+            self._seed = None
 
-            Logger.log(log_pattern.format(self.iterations, self.a, x1, x2, self.b, L, fx1, fx2))
+            Logger.debug(log_pattern, self.iterations, self.a, x1, x2, self.b, L, fx1, fx2)
 
             if fx1 <= fx2:
                 self.b = x2
@@ -67,8 +114,10 @@ class GoldenSection:
 
         self.x = sum(self.interval) / 2
 
-        fx = self.f(self.x)
-        Logger.log(f"---> found x={self.x:.24f} ({fx = :.24f}) and interval={self.interval} on i={self.iterations}", new_line=True)
+        if Logger.is_enabled(Logger.INFO):
+            fx = self.f(self.x)
+            Logger.log("---> found x={:.24f} (fx = {:.24f}) and interval={} on i={}",
+                       self.x, fx, self.interval, self.iterations, new_line=True)
 
 
 
@@ -1,13 +1,62 @@
 """ Метод наискорейшего спуска """
 
 
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 from utils.Logger import Logger
-from utils.utils import gradient, get_vector_norm
+from utils.utils import gradient, hessian, get_vector_norm, format_vector
+from utils.autodiff import autodiff_gradient
 from utils.History import History
+from utils.Cache import EvaluationCache
+from utils.Stats import Stats, broadcast_points, single_point
+from utils.BatchStream import BatchStream
 
 from methods.Sven import Sven
 from methods.GoldenSection import GoldenSection
 from methods.DSKPowell import DSKPowell
+from methods.FastGoldenSection import FastGoldenSection
+from methods.Brent import Brent
+from methods.Armijo import Armijo
+from methods.Wolfe import Wolfe
+from methods.KSection import KSection
+
+
+class Iteration:
+    """ record yielded by `GradientDescentMixin.iterate`, x is not copied """
+    __slots__ = ("i", "x", "fx", "gx_norm", "step")
+
+    def __init__(self, i, x, fx, gx_norm, step):
+        self.i = i
+        self.x = x
+        self.fx = fx
+        self.gx_norm = gx_norm
+        self.step = step    # step from x to the next point, None on the last iteration
+
+    def __repr__(self):
+        return f"<i={self.i}: x={self.x}, f(x)={self.fx}, ||∇f(x)||={self.gx_norm}, step={self.step}>"
+
+
+class LineFunction:
+    """
+        g(step) = fn(x + step*direction) of one line search, picklable if fn is:
+        a process pool gets it instead of the bound `OptimalGradientDescent.g`, which holds the whole solver
+    """
+
+    def __init__(self, fn, x, direction, vectorized=False):
+        self.fn = fn
+        self.x = x
+        self.direction = direction
+        self.vectorized = vectorized
+
+    def __call__(self, step):
+        point = self.x + step * self.direction
+        if self.vectorized is True:
+            return self.fn(point)
+        return self.fn(*point)
 
 
 class GradientDescentMixin:
@@ -21,35 +70,77 @@ class GradientDescentMixin:
     MAX_ITERATIONS = 2000
 
     def __init__(self, fn, start_point, step, grad=None, **params):
-        """ :param grad: should be a function that takes one arg: np.ndarray """
+        """ :param grad: should be a function that takes one arg: np.ndarray,
+                         or "autodiff" - exact gradient with dual numbers (see `utils.autodiff`)
+            :param params: `vectorized=True` - fn takes one np.ndarray `fn(x)` instead of `fn(x1, ..., xn)`,
+                           it should not keep x: trial points of line search reuse one buffer
+        """
 
         self.iterations = 0
-        self.history = History()
+        # `history_size`: keep only last iterations (ring buffer), criteria and modifications need 2 of them
+        history_size = params.get("history_size", None)
+        if params.get("record_history", True) is False:
+            history_size = 2
+        if history_size is not None and history_size < 2:
+            raise ValueError(f"history_size should be at least 2, got {history_size}")
+        self.history = History(history_size)
 
         self.x = None
-        self.f = fn
+        self.point = None   # current point and gradient in it, set before `get_direction`
+        self.gx = None
+        self.stats = Stats()
+        self.stats_hook = params.get("stats_hook", None)     # callable, takes `Stats` after the run
+        self.vectorized = params.get("vectorized", False)
+        # "fn" - evaluated points, numeric gradient evaluates n+1 points with one broadcast call
+        points = single_point if self.vectorized is True else broadcast_points
+        self.f = counted_fn = self.stats.counted(fn, "fn", points)
+        self._fn = fn       # without counting and cache: it is sent to process pools of line search
+        self.cache = None
+        if params.get("cache"):
+            # memoize evaluations during this run, `cache` may be True or max size of the cache
+            maxsize = None if params["cache"] is True else int(params["cache"])
+            self.cache = EvaluationCache(self.f, maxsize)
+            self.f = self.cache
         self.start_point = start_point.astype(float)
         self.step = step
 
+        self._grad_takes_fx = grad is None     # numeric gradient reuses f(x) of the iteration
         if grad is None:
             # numeric way
-            self.grad = lambda point: gradient(fn, point)
+            grad_h = params.get("grad_h", 0.00001)
+            grad_mode = params.get("grad_mode", "forward")
+            grad = lambda point, fx=None: gradient(self.f, point, grad_h, grad_mode, self.vectorized, fx)
+        elif grad == "autodiff":
+            # dual numbers can't be cached
+            grad = lambda point: autodiff_gradient(counted_fn, point, vectorized=self.vectorized)
         else:
             # your own gradient function
             if callable(grad) is False:
                 raise TypeError("Your gradient is not callable, also it should return np.ndarray")
-            self.grad = grad
+        self.grad = self.stats.counted(grad, "grad")
 
         self.criteria_eps = params.get("criteria_eps", 10**-3)
         self.criteria = params.get("criteria", 1)
         # 0 - ||x_(k+1) - x_k|| / ||x_k|| < eps AND |f(x_(k+1) - f(x_k)| < eps
         # 1 - ||∇f(x)|| < eps
 
+        # save state to `checkpoint_path` every `checkpoint_every` iterations, `resume` - continue from it if it exists
+        self.checkpoint_path = params.get("checkpoint_path", None)
+        self.checkpoint_every = params.get("checkpoint_every", 100)
+        self.resume = params.get("resume", False)
+        self._resume_point = None
+
     def start(self):
         title = f"Gradient Descent ({self.TYPE})"
         title += f", mod: {self.MODIFICATION}" if self.MODIFICATION is not None else ""
         with Logger(title):
-            self.find_x()
+            with self.stats.phase("run"):
+                self.find_x()
+            Logger.log("{}", self.stats)
+            if self.cache is not None:
+                Logger.log("cache: {} hits, {} misses ({:.1%})", self.cache.hits, self.cache.misses, self.cache.hit_rate)
+        if self.stats_hook is not None:
+            self.stats_hook(self.stats)
         return self
 
     def update_step(self):
@@ -66,6 +157,18 @@ class GradientDescentMixin:
         next_x = x + step * direction
         return next_x
 
+    def get_start_step(self, current):
+        """ 1/||∇f(x_0)||: the first move has unit length, any step keeps x_0 if it is a stationary point """
+        if current.gx_norm == 0:
+            return 1.0
+        return 1 / current.gx_norm
+
+    def evaluate(self, x):
+        """ f(x) in the calling convention of fn """
+        if self.vectorized is True:
+            return self.f(x)
+        return self.f(*x)
+
     def _check_criteria(self, gx_norm):
         if self.criteria == 0:
             if self.history.last is None:
@@ -84,37 +187,110 @@ class GradientDescentMixin:
         if self._check_criteria(gx_norm) is True:
             return True
         if self.iterations >= self.MAX_ITERATIONS:
-            Logger.log("! MAX_RECURSION_DEPTH reached !")
+            Logger.warning("! MAX_RECURSION_DEPTH reached !")
             return True
         return False
 
     def find_x(self):
+        for _ in self.iterate():
+            pass
+        return self.x
+
+    def iterate(self):
+        """ generator of iterations, caller may stop it at any moment or change `criteria_eps` between iterations,
+            values of `cache` are kept only while the generator runs
+
+            >>> for it in GradientDescent(fn, start_point, record_history=False).iterate():
+            ...     if it.fx < 10**-6:
+            ...         break
+        """
         headers = ["i", "x", "f(x)", "∇f(x)", "||∇f(x)||", "direction", "step"]
         log_pattern = "{!s:^3}\t" + "{!s:<35.35}\t" * (len(headers)-1)
-        Logger.log(log_pattern.format(*headers))
-
-        x = self.start_point
-        while True:
-            i = self.iterations
-
-            fx = self.f(*x)
-            gx = self.grad(x)
-            norm = get_vector_norm(gx)
-            direction = self.get_direction(gx, norm)
-
-            Logger.log(log_pattern.format(i, x, fx, gx, norm, direction, self.step))
-            self.history.append(i, x, fx, direction)
-
-            if self.should_stop(norm) is True:
-                Logger.log(f"---> found x=({x[0]:.24f}, {x[1]:.24f}) on i={self.iterations}", new_line=True)
-                self.x = x
-                break
-
-            self.update_step()
-            x = self.get_next_x(x, self.step, direction)
-            self.iterations += 1
-
-        return x
+        if self.resume is True and os.path.exists(self.checkpoint_path):
+            self.load_checkpoint(self.checkpoint_path)
+            Logger.log("resumed from {} on i={}", self.checkpoint_path, self.iterations)
+        Logger.debug(log_pattern, *headers)
+
+        x = self.start_point if self._resume_point is None else self._resume_point
+        if self.cache is not None:
+            self.cache.clear()     # values of the last run or restart
+        try:
+            while True:
+                i = self.iterations
+
+                fx = self.evaluate(x)
+                with self.stats.phase("gradient"):
+                    gx = self.grad(x, fx=fx) if self._grad_takes_fx is True else self.grad(x)
+                self.point, self.gx = x, gx
+                norm = get_vector_norm(gx)
+                direction = self.get_direction(gx, norm)
+
+                Logger.debug(log_pattern, i, x, fx, gx, norm, direction, self.step)
+                self.history.append(i, x, fx, direction, norm)
+
+                if self.should_stop(norm) is True:
+                    if Logger.is_enabled(Logger.INFO):
+                        Logger.log("---> found x={} on i={}", format_vector(x), self.iterations, new_line=True)
+                    self.x = x
+                    yield Iteration(i, x, fx, norm, None)
+                    return
+
+                self.update_step()
+                yield Iteration(i, x, fx, norm, self.step)
+                x = self.get_next_x(x, self.step, direction)
+                self.iterations += 1
+
+                if self.checkpoint_path is not None and self.iterations % self.checkpoint_every == 0:
+                    self.save_checkpoint(self.checkpoint_path, x)
+        finally:
+            if self.cache is not None:
+                self.cache.clear()
+
+    # checkpoints
+
+    def get_state(self):
+        """ state of the method which is not in history: {name: np.ndarray | number | str | None} """
+        return {}
+
+    def set_state(self, state):
+        """ :param state: dict from `get_state`, None values are missing """
+        pass
+
+    def save_checkpoint(self, path, x):
+        """ writes `.npz` with the point of the next iteration, step, history and `get_state()`
+
+            File is written next to `path` and then replaced, so a crash never leaves a broken checkpoint.
+        """
+        arrays = {"type": type(self).__name__, "x": x, "iterations": self.iterations,
+                  "step": np.nan if self.step is None else self.step}
+        arrays.update({f"history_{name}": column for name, column in self.history.arrays().items()})
+        arrays.update({f"state_{name}": value for name, value in self.get_state().items() if value is not None})
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, path):
+        """ restores state saved by `save_checkpoint`, the next `start()`/`iterate()` continues from it """
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+        if str(arrays["type"]) != type(self).__name__:
+            raise ValueError(f"Checkpoint of {arrays['type']} can't be loaded to {type(self).__name__}")
+
+        self._resume_point = arrays["x"]
+        self.iterations = int(arrays["iterations"])
+        step = float(arrays["step"])
+        self.step = None if np.isnan(step) else step
+        self.history = History.from_arrays(
+            {name[len("history_"):]: column for name, column in arrays.items() if name.startswith("history_")},
+            self.history.maxlen,
+        )
+        self.set_state({name[len("state_"):]: value.item() if value.ndim == 0 else value
+                        for name, value in arrays.items() if name.startswith("state_")})
+        return self
 
 
 # Main algorithms:
@@ -126,25 +302,121 @@ class OptimalGradientDescent(GradientDescentMixin):
 
     def __init__(self, *args, **params):
         super().__init__(*args, **params)
-        self.g = lambda step: self.f(*(self.history.current.x + step * self.history.current.direction))
+        self._line = None   # history unit, from which we search step
+        self._trial = np.empty_like(self.start_point)     # buffer for trial points x + step*direction
         self.sven_step = params.get("sven_step", None)
         self.one_dim_eps = params.get("one_dim_eps", 10**-3)
+        self.one_dim_params = params.get("one_dim_params", {})     # extra arguments of one-dim method, e.g. `k`
+        self._executor = None   # pool of a concurrent one-dim method, lives while `iterate` runs
         self._report_one_dim_details = params.get("report_one_dim_details", False)
 
+    def _trial_point(self, step):
+        trial = np.multiply(self._line.direction, step, out=self._trial)
+        trial += self._line.x
+        return trial
+
+    def g(self, step):
+        """ f(x + step*direction) """
+        return self.evaluate(self._trial_point(step))
+
+    def g_concurrent(self, step):
+        """ g(step) without the shared buffer of trial points, for one-dim methods which call it from several threads """
+        return self.evaluate(self._line.x + step * self._line.direction)
+
+    def dg(self, step):
+        """ g'(step) = ∇f(x + step*direction)·direction, only inexact line searches need it """
+        return self.grad(self._trial_point(step)) @ self._line.direction
+
+    def iterate(self):
+        try:
+            yield from super().iterate()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def get_state(self):
+        return dict(super().get_state(), one_dim_method=self.ONE_DIM_METHOD.__name__,
+                    one_dim_eps=self.one_dim_eps, sven_step=self.sven_step)
+
+    def set_state(self, state):
+        super().set_state(state)
+        one_dim_methods = {method.__name__: method for method in GradientDescent.ONE_DIM_METHODS.values()}
+        self.ONE_DIM_METHOD = one_dim_methods[state["one_dim_method"]]
+        self.one_dim_eps = state["one_dim_eps"]
+        self.sven_step = state.get("sven_step")
+
     def find_step(self, input_step=None):
-        logger_enable = Logger.ENABLE
-        if self._report_one_dim_details is False:
-            Logger.ENABLE = False
+        current = self._line = self.history.current
+        sven_step = self.sven_step or self.get_sven_step(current)
+
+        self.stats.count("line_search")
+        if self.ONE_DIM_METHOD.BRACKETING is False:
+            return self.find_inexact_step(current, sven_step)
+
+        if getattr(self.ONE_DIM_METHOD, "CONCURRENT", False) is True:
+            return self.find_concurrent_step(current, sven_step)
 
-        current = self.history.current
-        sven_step = self.sven_step or 0.1 * get_vector_norm(current.x) / get_vector_norm(current.direction)
-        interval = Sven(self.g, 0, sven_step).interval
-        step = self.ONE_DIM_METHOD(self.g, *interval, eps=self.one_dim_eps).x
+        with Logger.suppressed(self._report_one_dim_details is False):
+            with self.stats.phase("sven"):
+                bracket = Sven(self.g, 0, sven_step).bracket
+            with self.stats.phase("one_dim"):
+                step = self.ONE_DIM_METHOD(self.g, *bracket, eps=self.one_dim_eps, bracket=bracket,
+                                           **self.one_dim_params).x
 
-        if self._report_one_dim_details is False:
-            Logger.ENABLE = logger_enable
         return step
 
+    def find_concurrent_step(self, current, sven_step):
+        """
+            One-dim method evaluates probes in a pool: "thread" and "process" pools are created once per run.
+            Processes get `LineFunction` with fn of the user (no cache), their evaluations are counted afterwards.
+        """
+        params = dict(self.one_dim_params)
+        pool = params.get("pool", "thread")
+        if isinstance(pool, str):
+            if self._executor is None:
+                self._executor = self.ONE_DIM_METHOD.make_executor(pool, params.get("k"))
+            params["pool"] = self._executor
+        in_processes = pool == "process" or isinstance(pool, ProcessPoolExecutor)
+        g = LineFunction(self._fn, current.x, current.direction, self.vectorized) if in_processes else self.g_concurrent
+
+        with Logger.suppressed(self._report_one_dim_details is False):
+            with self.stats.phase("sven"):
+                bracket = Sven(self.g, 0, sven_step).bracket
+            with self.stats.phase("one_dim"):
+                search = self.ONE_DIM_METHOD(g, *bracket, eps=self.one_dim_eps, bracket=bracket, **params)
+                if in_processes:
+                    self.stats.count("fn", search.evaluations)
+                    self.stats.count("fn_calls", search.evaluations)
+
+        return search.x
+
+    def get_sven_step(self, current):
+        """ 10% of ||x|| along the direction, 10% of the direction if x = 0 (as `BatchGradientDescent` does) """
+        x_norm = get_vector_norm(current.x)
+        return 0.1 * (x_norm if x_norm > 0 else 1.0) / get_vector_norm(current.direction)
+
+    def find_inexact_step(self, current, start_step):
+        """ Armijo/Wolfe: no interval, g'(0) = ∇f(x)·direction is known already """
+        slope = self.gx @ current.direction
+        start_step = self.get_inexact_start_step(current, slope, start_step)
+
+        with Logger.suppressed(self._report_one_dim_details is False):
+            with self.stats.phase("one_dim"):
+                search = self.ONE_DIM_METHOD(self.g, current.fx, slope, start_step, dfn=self.dg, **self.one_dim_params)
+        Logger.debug("line search: {} evaluations, {} derivatives", search.evaluations, search.grad_evaluations)
+        return search.x
+
+    def get_inexact_start_step(self, current, slope, start_step):
+        last = self.history.last
+        if last is not None and current.fx < last.fx and slope < 0:
+            # g(t) is a parabola with the same decrease as on the last iteration, but not much longer than last step
+            start_step = min(1.01 * 2 * (current.fx - last.fx) / slope, 10 * self.step)
+        if not start_step > 0:
+            # no usable step of Sven (e.g. sven_step=0)
+            start_step = 1 / get_vector_norm(current.direction)
+        return start_step
+
     def get_direction(self, gx, norm):
         direction = -gx
         return direction
@@ -168,6 +440,105 @@ class ConstGradientDescent(GradientDescentMixin):
             self.step /= 2
 
 
+class StochasticGradientDescent(GradientDescentMixin):
+    """
+        Стохастический градиентный спуск по мини-батчам
+        x_(k+1) = x_k - step * ∇f_B(x_k), f_B(x) = fn(x, batch) - loss of one batch (e.g. mean over its records)
+
+        Full objective is never evaluated: every batch of the epoch makes one step,
+        an iteration of history is one epoch with mean f_B and mean ∇f_B over its batches,
+        criteria are checked on these means after every epoch (iterations, MAX_ITERATIONS - epochs).
+    """
+    TYPE = "stochastic"
+    LEARNING_RATE = 0.01
+
+    def __init__(self, fn, start_point, step=None, grad=None, **params):
+        """ :param fn: fn(x, batch), x - np.ndarray
+            :param grad: grad(x, batch) -> np.ndarray, "autodiff" or None (numeric)
+            :param params: `dataset` - see `utils.BatchStream.BatchStream`,
+                           batch_size, shuffle, seed, prefetch - options of the stream,
+                           `epochs` - max epochs, `step_decay` - step is multiplied by it after every epoch
+        """
+        if params.get("cache"):
+            raise ValueError("Stochastic gradient descent can't cache evaluations: fn depends on the batch")
+        # fn takes x as one np.ndarray
+        params["vectorized"] = True
+        super().__init__(fn, start_point, self.LEARNING_RATE if step is None else step, **params)
+
+        if grad is None:
+            grad_h = params.get("grad_h", 0.00001)
+            grad_mode = params.get("grad_mode", "forward")
+            grad = lambda point, batch: gradient(lambda x: self.f(x, batch), point, grad_h, grad_mode, True)
+        elif grad == "autodiff":
+            counted_fn = self.f
+            grad = lambda point, batch: autodiff_gradient(lambda x: counted_fn(x, batch), point, vectorized=True)
+        elif callable(grad) is False:
+            raise TypeError("Your gradient is not callable, also it should return np.ndarray")
+        self.grad = self.stats.counted(grad, "grad")
+
+        self.batches = BatchStream(params["dataset"], params.get("batch_size", 32), params.get("shuffle", True),
+                                   params.get("seed", None), params.get("prefetch", 2))
+        self.MAX_ITERATIONS = params.get("epochs", 100)
+        self.step_decay = params.get("step_decay", 1.0)
+        self.batch_steps = 0
+
+    def get_state(self):
+        return dict(super().get_state(), batch_steps=self.batch_steps, seed=self.batches.seed)
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.batch_steps = state["batch_steps"]
+        self.batches.seed = state["seed"]
+
+    def iterate(self):
+        """ generator of epochs, see `GradientDescentMixin.iterate` """
+        headers = ["epoch", "x", "mean f(x)", "mean ∇f(x)", "||mean ∇f(x)||", "batches", "step"]
+        log_pattern = "{!s:^5}\t" + "{!s:<35.35}\t" * (len(headers)-1)
+        if self.resume is True and os.path.exists(self.checkpoint_path):
+            self.load_checkpoint(self.checkpoint_path)
+            Logger.log("resumed from {} on epoch={}", self.checkpoint_path, self.iterations)
+        Logger.debug(log_pattern, *headers)
+
+        x = (self.start_point if self._resume_point is None else self._resume_point).copy()
+        while True:
+            i = self.iterations
+
+            fx_sum, gx_sum, count = 0.0, np.zeros_like(x), 0
+            for batch in self.batches.epoch(i):
+                fx_sum += self.f(x, batch)
+                with self.stats.phase("gradient"):
+                    gx = self.grad(x, batch)
+                gx_sum += gx
+                x -= self.step * gx
+                count += 1
+            if count == 0:
+                raise ValueError("Dataset has no batches")
+            self.batch_steps += count
+
+            fx, gx = fx_sum / count, gx_sum / count
+            self.point, self.gx = x, gx
+            norm = get_vector_norm(gx)
+
+            Logger.debug(log_pattern, i, x, fx, gx, norm, count, self.step)
+            self.history.append(i, x, fx, -gx, norm)
+
+            if self.should_stop(norm) is True:
+                if Logger.is_enabled(Logger.INFO):
+                    Logger.log("---> found x={} on epoch={} ({} batches)",
+                               format_vector(x), self.iterations, self.batch_steps, new_line=True)
+                self.x = x
+                yield Iteration(i, x, fx, norm, None)
+                return
+
+            self.step *= self.step_decay
+            yield Iteration(i, x, fx, norm, self.step)
+            x = x.copy()    # yielded x stays as it was at the end of the epoch
+            self.iterations += 1
+
+            if self.checkpoint_path is not None and self.iterations % self.checkpoint_every == 0:
+                self.save_checkpoint(self.checkpoint_path, x)
+
+
 # Modifications:
 
 
@@ -182,6 +553,166 @@ class BoothGradientDescent(OptimalGradientDescent):
         return x + self.delta * step * direction
 
 
+class BarzilaiBorweinGradientDescent(GradientDescentMixin):
+    """
+        Метод Барзилая-Борвейна
+        x_(k+1) = x_k - step_k * ∇f(x_k), no line search: one f and one ∇f per iteration
+        s = x_k - x_(k-1),  y = ∇f(x_k) - ∇f(x_(k-1))
+        step_k = s·s / s·y (bb_variant=1) or s·y / y·y (bb_variant=2)
+
+        Non-monotone safeguard: x_k is accepted if f(x_k) <= max of last `nonmonotone_memory` accepted f
+        - gamma * step * ||∇f(x_(k-1))||^2, otherwise it is removed from history and the step from x_(k-1) is halved.
+    """
+    TYPE = "no line search"
+    MODIFICATION = "Barzilai-Borwein"
+    GAMMA = 10**-4
+    MIN_STEP = 10**-10
+    MAX_STEP = 10**10
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.variant = kwargs.get("bb_variant", 1)
+        if self.variant not in (1, 2):
+            raise ValueError(f"bb_variant should be 1 or 2, got {self.variant}")
+        self.accepted_fxs = deque(maxlen=kwargs.get("nonmonotone_memory", 10))
+        self.rejections = 0
+        self._rejected = False
+
+    def get_state(self):
+        return dict(super().get_state(), accepted_fxs=np.array(self.accepted_fxs),
+                    rejections=self.rejections, rejected=self._rejected)
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.accepted_fxs.clear()
+        self.accepted_fxs.extend(np.atleast_1d(state["accepted_fxs"]).tolist())
+        self.rejections, self._rejected = state["rejections"], state["rejected"]
+
+    def get_direction(self, gx, norm):
+        return -gx
+
+    def is_acceptable(self, current, last):
+        # direction = -∇f, so ∇f(x_(k-1))·direction = -||direction||^2
+        decrease = self.GAMMA * self.step * (last.direction @ last.direction)
+        return bool(current.fx <= max(self.accepted_fxs) - decrease)
+
+    def get_bb_step(self, current, last):
+        s = current.x - last.x
+        y = last.direction - current.direction
+        sy = s @ y
+        if not sy > 0:
+            # no positive curvature along s, keep the step
+            return self.step
+        step = (s @ s) / sy if self.variant == 1 else sy / (y @ y)
+        return min(max(step, self.MIN_STEP), self.MAX_STEP)
+
+    def update_step(self):
+        current, last = self.history.current, self.history.last
+        self._rejected = False
+        if last is None:
+            if self.step is None:
+                self.step = self.get_start_step(current)
+            self.accepted_fxs.append(current.fx)
+            return
+
+        if self.is_acceptable(current, last) is False:
+            self.history.pop()
+            self.rejections += 1
+            self._rejected = True
+            self.step /= 2
+            return
+
+        self.step = self.get_bb_step(current, last)
+        self.accepted_fxs.append(current.fx)
+
+    def get_next_x(self, x, step, direction):
+        if self._rejected is True:
+            # step again from the last accepted point
+            accepted = self.history.current
+            return accepted.x + step * accepted.direction
+        return x + step * direction
+
+
+class NesterovGradientDescent(GradientDescentMixin):
+    """
+        Ускоренный градиентный метод Нестерова
+        x_(k+1) = y_k - step_k * ∇f(y_k),  y_(k+1) = x_(k+1) + beta_k * (x_(k+1) - x_k)
+        beta_k = (t_k - 1) / t_(k+1),  t_(k+1) = (1 + sqrt(1 + 4*t_k^2)) / 2
+
+        f and ∇f are evaluated only in y_k, so history and criteria are in y_k.
+        step_k = 1/L_k, L_k = L_FACTOR * ||∇f(y_k) - ∇f(y_(k-1))|| / ||y_k - y_(k-1)|| - local Lipschitz constant of ∇f,
+        the step can grow at most `STEP_GROWTH` times per iteration.
+        Adaptive restart (t = 1): when momentum points uphill, ∇f(y_k)·(x_(k+1) - x_k) > 0,
+        or when f increases - then y_k is removed from history and the halved step is made from y_(k-1).
+    """
+    TYPE = "no line search"
+    MODIFICATION = "Nesterov"
+    L_FACTOR = 3.0      # secant is a lower bound of the local constant
+    STEP_GROWTH = 1.2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.t = 1.0
+        self.restarts = 0
+        self._x_prev = None     # x_k
+        self._rejected = False
+
+    def get_state(self):
+        return dict(super().get_state(), t=self.t, restarts=self.restarts, x_prev=self._x_prev, rejected=self._rejected)
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.t, self.restarts, self._rejected = state["t"], state["restarts"], state["rejected"]
+        self._x_prev = state.get("x_prev")
+
+    def get_direction(self, gx, norm):
+        return -gx
+
+    def restart(self):
+        self.t = 1.0
+        self.restarts += 1
+
+    def update_step(self):
+        current, last = self.history.current, self.history.last
+        self._rejected = False
+        if last is None:
+            if self.step is None:
+                self.step = self.get_start_step(current)
+            return
+
+        if current.fx > last.fx:
+            self.history.pop()
+            self.restart()
+            self._rejected = True
+            self.step /= 2
+            return
+
+        s = get_vector_norm(current.x - last.x)
+        y = get_vector_norm(last.direction - current.direction)
+        if s > 0 and y > 0:
+            self.step = min(s / (self.L_FACTOR * y), self.STEP_GROWTH * self.step)
+
+    def get_next_x(self, x, step, direction):
+        if self._rejected is True:
+            # plain gradient step from the last point where f decreased
+            accepted = self.history.current
+            self._x_prev = accepted.x + step * accepted.direction
+            return self._x_prev.copy()
+
+        next_x = x + step * direction
+        if self._x_prev is None:
+            self._x_prev = x
+        move = next_x - self._x_prev
+        if direction @ move < 0:
+            self.restart()
+
+        t = (1 + np.sqrt(1 + 4 * self.t ** 2)) / 2
+        beta = (self.t - 1) / t
+        self.t = t
+        self._x_prev = next_x
+        return next_x + beta * move
+
+
 class HeavyBallGradientDescent(OptimalGradientDescent):
     # fixme
     MODIFICATION = "HeavyBall"
@@ -222,6 +753,218 @@ class LyusternikGradientDescent(OptimalGradientDescent):
         self.step = beta_coef
 
 
+class LBFGSGradientDescent(OptimalGradientDescent):
+    """
+        Квазиньютоновский метод L-BFGS
+        direction = -H_k * ∇f(x_k), H_k is built by the two-loop recursion from last m pairs
+        s_i = x_(i+1) - x_i,  y_i = ∇f(x_(i+1)) - ∇f(x_i)
+
+        Pairs are kept in fixed (m, n) arrays used as a ring buffer, so memory is O(m*n).
+    """
+    MODIFICATION = "L-BFGS"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.memory = kwargs.get("lbfgs_memory", 5)
+        if self.memory < 1:
+            raise ValueError(f"lbfgs_memory should be at least 1, got {self.memory}")
+        self.S = self.Y = self.rho = None     # (m, n), (m, n), (m,) - allocated with the first gradient
+        self.pairs = 0      # count of stored pairs
+        self._head = 0      # index of the next pair in the ring buffer
+        self._s = None      # last step x_(k+1) - x_k
+        self._prev_gx = None
+
+    def get_state(self):
+        return dict(super().get_state(), S=self.S, Y=self.Y, rho=self.rho, pairs=self.pairs, head=self._head,
+                    s=self._s, prev_gx=self._prev_gx)
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.S, self.Y, self.rho = state.get("S"), state.get("Y"), state.get("rho")
+        self.pairs, self._head = state["pairs"], state["head"]
+        self._s, self._prev_gx = state.get("s"), state.get("prev_gx")
+
+    def _store_pair(self, s, y):
+        sy = s @ y
+        if sy <= 10**-10 * get_vector_norm(s) * get_vector_norm(y):
+            # curvature condition doesn't hold (line search was too rough), H_k wouldn't be positive definite
+            return
+        self.S[self._head] = s
+        self.Y[self._head] = y
+        self.rho[self._head] = 1.0 / sy
+        self._head = (self._head + 1) % self.memory
+        self.pairs = min(self.pairs + 1, self.memory)
+
+    def reset(self):
+        self.pairs = 0
+        self._head = 0
+
+    def two_loop(self, gx):
+        """ :return: H_k * gx """
+        q = np.array(gx, dtype=float)
+        order = [(self._head - 1 - j) % self.memory for j in range(self.pairs)]     # from the newest pair
+        alpha = np.empty(self.pairs)
+        for j, idx in enumerate(order):
+            alpha[j] = self.rho[idx] * (self.S[idx] @ q)
+            q -= alpha[j] * self.Y[idx]
+
+        newest = order[0]
+        q *= (self.S[newest] @ self.Y[newest]) / (self.Y[newest] @ self.Y[newest])     # H_0 = gamma * I
+
+        for j in reversed(range(self.pairs)):
+            idx = order[j]
+            beta = self.rho[idx] * (self.Y[idx] @ q)
+            q += (alpha[j] - beta) * self.S[idx]
+        return q
+
+    def get_direction(self, gx, norm):
+        if self.S is None:
+            n = len(gx)
+            self.S, self.Y, self.rho = np.zeros((self.memory, n)), np.zeros((self.memory, n)), np.zeros(self.memory)
+        if self._s is not None:
+            self._store_pair(self._s, gx - self._prev_gx)
+        self._prev_gx = gx
+
+        if self.pairs == 0:
+            return -gx
+        direction = -self.two_loop(gx)
+        if direction @ gx >= 0:
+            # lost descent, start again from steepest descent
+            self.reset()
+            return -gx
+        return direction
+
+    def get_next_x(self, x, step, direction):
+        next_x = x + step * direction
+        self._s = next_x - x
+        return next_x
+
+
+class ConjugateGradientDescent(OptimalGradientDescent):
+    """
+        Нелинейный метод сопряженных градиентов
+        direction_k = -∇f(x_k) + beta_k * direction_(k-1)
+
+        Restarts with steepest descent every `cg_restart` iterations (dimension by default)
+        or when direction is not a descent one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.restart_every = kwargs.get("cg_restart", len(self.start_point))
+        self.restarts = 0
+        self._since_restart = 0
+        self._prev_gx = None
+
+    def get_state(self):
+        return dict(super().get_state(), prev_gx=self._prev_gx, since_restart=self._since_restart,
+                    restarts=self.restarts)
+
+    def set_state(self, state):
+        super().set_state(state)
+        self._prev_gx = state.get("prev_gx")
+        self._since_restart, self.restarts = state["since_restart"], state["restarts"]
+
+    def get_beta(self, gx, prev_gx):
+        raise Exception("This class is Mixin, you should use class `GradientDescent`")
+
+    def get_direction(self, gx, norm):
+        prev_gx, self._prev_gx = self._prev_gx, gx
+        previous = self.history.current     # direction of the last iteration (this one is not in history yet)
+        if prev_gx is None or previous is None or self._since_restart >= self.restart_every:
+            return self._restart(gx)
+
+        direction = -gx + self.get_beta(gx, prev_gx) * previous.direction
+        if direction @ gx >= 0:
+            return self._restart(gx)
+        self._since_restart += 1
+        return direction
+
+    def _restart(self, gx):
+        if self._since_restart != 0:
+            self.restarts += 1
+        self._since_restart = 1
+        return -gx
+
+
+class FletcherReevesGradientDescent(ConjugateGradientDescent):
+    MODIFICATION = "Fletcher-Reeves"
+
+    def get_beta(self, gx, prev_gx):
+        """ beta = ||∇f(x_k)||^2 / ||∇f(x_(k-1))||^2 """
+        return (gx @ gx) / (prev_gx @ prev_gx)
+
+
+class PolakRibiereGradientDescent(ConjugateGradientDescent):
+    MODIFICATION = "Polak-Ribiere+"
+
+    def get_beta(self, gx, prev_gx):
+        """ beta = max(0, ∇f(x_k)·(∇f(x_k) - ∇f(x_(k-1))) / ||∇f(x_(k-1))||^2) """
+        return max(0.0, (gx @ (gx - prev_gx)) / (prev_gx @ prev_gx))
+
+
+class NewtonGradientDescent(OptimalGradientDescent):
+    """
+        Метод Ньютона (с регулировкой шага)
+        direction = -(H(x_k) + tau*I)^(-1) * ∇f(x_k)
+
+        Hessian is factorized by Cholesky once per `hessian_reuse` iterations,
+        tau > 0 is added only if H is not positive definite (modified Cholesky).
+        Step is found by one-dim method, so far from the minimum the method doesn't diverge.
+    """
+    MODIFICATION = "Newton"
+    TAU_BETA = 10**-3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        hessian_fn = kwargs.get("hessian", None)      # your own function of np.ndarray, returns (n, n) np.ndarray
+        if hessian_fn is None:
+            hessian_h = kwargs.get("hessian_h", 0.0001)
+            hessian_fn = lambda point: hessian(self.f, point, hessian_h, self.vectorized)
+        elif callable(hessian_fn) is False:
+            raise TypeError("Your hessian is not callable, also it should return np.ndarray")
+        self.hessian = self.stats.counted(hessian_fn, "hessian")
+        self.hessian_reuse = kwargs.get("hessian_reuse", 1)
+        if self.sven_step is None:
+            self.sven_step = 1.0    # natural step of Newton's method
+
+        self.L = None       # lower triangular factor of H + tau*I
+        self.tau = 0.0
+        self._factor_age = 0
+
+    def get_state(self):
+        return dict(super().get_state(), L=self.L, tau=self.tau, factor_age=self._factor_age)
+
+    def set_state(self, state):
+        super().set_state(state)
+        self.L, self.tau, self._factor_age = state.get("L"), state["tau"], state["factor_age"]
+
+    def factorize(self, H):
+        """ modified Cholesky: H + tau*I = L*L^T, tau is increased until the factorization succeeds """
+        min_diagonal = min(H.diagonal())
+        tau = 0.0 if min_diagonal > 0 else -min_diagonal + self.TAU_BETA
+        eye = np.eye(len(H))
+        while True:
+            try:
+                return np.linalg.cholesky(H + tau * eye), tau
+            except np.linalg.LinAlgError:
+                tau = max(2 * tau, self.TAU_BETA)
+
+    def get_direction(self, gx, norm):
+        if self.L is None or self._factor_age >= self.hessian_reuse:
+            with self.stats.phase("hessian"):
+                self.L, self.tau = self.factorize(self.hessian(self.point))
+            self._factor_age = 0
+        self._factor_age += 1
+
+        y = np.linalg.solve(self.L, -gx)
+        direction = np.linalg.solve(self.L.T, y)
+        return direction
+
+    def get_inexact_start_step(self, current, slope, start_step):
+        return 1.0
+
+
 # Factory:
 
 
@@ -229,11 +972,22 @@ class GradientDescent:
     MODIFICATIONS = {
         "booth": BoothGradientDescent,
         "heavy_ball": HeavyBallGradientDescent,
+        "nesterov": NesterovGradientDescent,
+        "barzilai_borwein": BarzilaiBorweinGradientDescent,
         "lyusternik": LyusternikGradientDescent,
+        "lbfgs": LBFGSGradientDescent,
+        "fletcher_reeves": FletcherReevesGradientDescent,
+        "polak_ribiere": PolakRibiereGradientDescent,
+        "newton": NewtonGradientDescent,
     }
     ONE_DIM_METHODS = {
         "dsk_powell": DSKPowell,
-        "golden_section": GoldenSection
+        "golden_section": GoldenSection,
+        "fast_golden_section": FastGoldenSection,
+        "brent": Brent,
+        "armijo": Armijo,
+        "wolfe": Wolfe,
+        "k_section": KSection,
     }
 
     @classmethod
@@ -255,6 +1009,9 @@ class GradientDescent:
         return mod_gradient_descent
 
     def __new__(cls, fn, start_point, step=None, grad=None, **params):
+        if "dataset" in params:
+            return StochasticGradientDescent(fn, start_point, step=step, grad=grad, **params)
+
         if step is None:
             cls.optimal_setup_params(params)
 
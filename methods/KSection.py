@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from utils.Logger import Logger
+
+
+class KSection:
+    """
+        Одномерный метод поиска 'k-деление' (параллельный)
+        x_i = a + i*L/(k+1), i = 1..k  - k probes of one round are evaluated concurrently,
+        [a, b] becomes [x_(j-1), x_(j+1)] around the best probe x_j, so L shrinks (k+1)/2 times per round.
+
+        For odd k the best probe is the center of the next round and is not evaluated again (k-1 new probes).
+        Wall time of a round is one evaluation if the pool has k workers.
+
+        >>> x = KSection(fn, a, b, eps=10**-3, k=15, pool="process").x     # fn is a module-level function
+        >>> GradientDescent(fn, start_point, one_dim_method="k_section", one_dim_params={"pool": "process"})
+    """
+
+    BRACKETING = True       # takes interval [a, b] from Sven
+    CONCURRENT = True       # fn is called from several threads at once
+    MAX_ITERATIONS = 2000
+    POOLS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+    def __init__(self, fn, a, b, eps=0.001, bracket=None, k=None, pool="thread"):
+        """
+            :param k: probes per round, default - number of CPUs (at least 2)
+            :param pool: "thread", "process" (fn should be picklable) or your own `concurrent.futures.Executor`,
+                         which is not shut down here - reuse it between searches
+            :param bracket: `methods.Sven.Bracket`, its points are reused if they are probes of the first round
+        """
+        if isinstance(pool, Executor) is False and pool not in self.POOLS:
+            raise ValueError(f"Unknown pool {pool!r}, use one of {list(self.POOLS)} or concurrent.futures.Executor")
+        self.f = fn
+        self.a = a
+        self.b = b
+        self.eps = eps
+        self.k = self.get_k(k)
+        self.pool = pool
+
+        self.iterations = 0
+        self.evaluations = 0
+        self.interval = None
+        self.x = None
+        self.fx = None
+        self._known = [] if bracket is None else list(bracket.points)    # [(x, f(x))]
+
+        with Logger("K-Section"):
+            if isinstance(pool, Executor):
+                self.set_interval(pool)
+            else:
+                with self.make_executor(pool, self.k) as executor:
+                    self.set_interval(executor)
+
+    @staticmethod
+    def get_k(k=None):
+        """ :return: probes per round, number of CPUs (at least 2) by default """
+        k = k or max(2, os.cpu_count() or 1)
+        if k < 2:
+            raise ValueError(f"k should be at least 2, got {k}")
+        return k
+
+    @classmethod
+    def make_executor(cls, pool, k=None):
+        """ :return: new executor with k workers for pool "thread" or "process", the caller shuts it down """
+        if pool not in cls.POOLS:
+            raise ValueError(f"Unknown pool {pool!r}, use one of {list(cls.POOLS)} or concurrent.futures.Executor")
+        return cls.POOLS[pool](cls.get_k(k))
+
+    def should_stop(self):
+        """
+            Criteria: |b-a| <= eps
+            :return: True if criteria is passed or reached max_recursion_depth, otherwise False
+        """
+        if abs(self.b - self.a) <= self.eps:
+            return True
+        if self.iterations > self.MAX_ITERATIONS:
+            Logger.warning("! MAX_RECURSION_DEPTH reached !")
+            return True
+        return False
+
+    def _lookup(self, x, tolerance):
+        for known_x, known_fx in self._known:
+            if abs(known_x - x) <= tolerance:
+                return known_fx
+        return None
+
+    def evaluate(self, executor, xs, tolerance):
+        """ f in every probe, known values are reused, others are evaluated concurrently """
+        fxs = [self._lookup(x, tolerance) for x in xs]
+        missing = [i for i, fx in enumerate(fxs) if fx is None]
+        for i, fx in zip(missing, executor.map(self.f, [xs[i] for i in missing])):
+            fxs[i] = fx
+        self.evaluations += len(missing)
+        return fxs
+
+    def set_interval(self, executor):
+        k = self.k
+
+        headers = ["i", "a", "b", "L", "x_j", "f(x_j)", "new probes"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        self.a, self.b = sorted([self.a, self.b])
+        while self.should_stop() is False:
+            self.iterations += 1
+
+            L = self.b - self.a
+            xs = [self.a + i * L / (k+1) for i in range(1, k+1)]
+            evaluations = self.evaluations
+            fxs = self.evaluate(executor, xs, 10**-9 * L)
+
+            j = min(range(k), key=lambda i: fxs[i])
+            self.x, self.fx = xs[j], fxs[j]
+            Logger.debug(log_pattern, self.iterations, self.a, self.b, L, self.x, self.fx,
+                         self.evaluations - evaluations)
+
+            # neighbours of x_j, the bounds if x_j is the first or the last probe
+            self.a, self.b = (xs[j-1] if j > 0 else self.a), (xs[j+1] if j < k-1 else self.b)
+            self._known = [(self.x, self.fx)]
+
+        self.interval = [self.a, self.b]
+        if self.x is None:
+            self.x = sum(self.interval) / 2
+        Logger.log("---> found x={:.24f} and interval={} on i={} ({} evaluations)",
+                   self.x, self.interval, self.iterations, self.evaluations, new_line=True)
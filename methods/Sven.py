@@ -1,6 +1,38 @@
 from utils.Logger import Logger
 
 
+class Bracket:
+    """
+        Interval [a, b] found by Sven and points of the last Sven steps where f is already known.
+        points - [(x, f(x))] sorted by x, the best of them is surrounded by the others,
+        so one-dim methods may start from these points without new evaluations.
+
+        Bracket unpacks as the interval: `DSKPowell(fn, *bracket, bracket=bracket)`.
+    """
+
+    def __init__(self, a, b, points):
+        self.a = a
+        self.b = b
+        self.points = sorted(points)
+
+    @property
+    def interval(self):
+        return [self.a, self.b]
+
+    def triple(self):
+        """ :return: [(x, f(x))] * 3 - the best known point and its nearest neighbours, None if it is on the edge """
+        best = min(range(len(self.points)), key=lambda i: self.points[i][1])
+        if best == 0 or best == len(self.points)-1:
+            return None
+        return self.points[best-1:best+2]
+
+    def __iter__(self):
+        return iter(self.interval)
+
+    def __repr__(self):
+        return f"<Bracket [{self.a}, {self.b}], points={self.points}>"
+
+
 class Sven:
     """
         Этап установления границ интервала
@@ -16,12 +48,19 @@ class Sven:
         self.iterations = 0
 
         self.interval = None
+        self.bracket = None     # `Bracket`: interval and known points
         self.x = None
         self.step = None
+        self._fx_start = None   # f(x0)
+        self._fx_step = None    # f(x0 + self.step)
+        self._fx_back = None    # f(x0 - self.step)
 
         with Logger("Sven interval"):
             if self._set_step(step) is False:
                 self.interval = [self.start_point-step, self.start_point+step]
+                self.bracket = Bracket(*self.interval, [(self.start_point-step, self._fx_back),
+                                                        (self.start_point, self._fx_start),
+                                                        (self.start_point+step, self._fx_step)])
                 self.x = sum(self.interval) / 2
                 self._report()
             else:
@@ -39,12 +78,16 @@ class Sven:
         fx_neg = self.f(x0 - step)
         fx_pos = self.f(x0 + step)
 
+        self._fx_start = fx
         if fx_neg >= fx >= fx_pos:
             self.step = step
+            self._fx_step, self._fx_back = fx_pos, fx_neg
             return True
         if fx_neg <= fx <= fx_pos:
             self.step = -step
+            self._fx_step, self._fx_back = fx_neg, fx_pos
             return True
+        self._fx_step, self._fx_back = fx_pos, fx_neg
         return False
 
     def should_stop(self, fx0, fx1):
@@ -55,7 +98,7 @@ class Sven:
         max_recursion_reached = self.iterations > self.MAX_ITERATIONS
         if max_recursion_reached or fx0 < fx1:
             if max_recursion_reached:
-                Logger.log("! MAX_RECURSION_DEPTH reached !")
+                Logger.warning("! MAX_RECURSION_DEPTH reached !")
             return True
         return False
 
@@ -69,30 +112,35 @@ class Sven:
 
         headers = ["k", "x_k", "∆*2^k", "x_(k+1)", "f(x_k)", "f(x_(k+1))"]
         log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
-        Logger.log(log_pattern.format(*headers))
+        Logger.debug(log_pattern, *headers)
 
         if self.step is None:
             # interval found on step setup
             return
 
-        x0 = self.start_point
+        x0, fx0 = self.start_point, self._fx_start
+        previous = (self.start_point - self.step, self._fx_back)
         while True:
             i = self.iterations
             step = self.step * 2**i
             x1 = x0 + step
-            fx0, fx1 = self.f(x0), self.f(x1)
-            Logger.log(log_pattern.format(i, x0, step, x1, fx0, fx1))
+            # f(x0) is known from the previous iteration, f(x0+step) - from step setup
+            fx1 = self._fx_step if i == 0 else self.f(x1)
+            Logger.debug(log_pattern, i, x0, step, x1, fx0, fx1)
 
             if self.should_stop(fx0, fx1):
                 self.iterations += 1    # adjust
                 self.interval = sorted([x0-step/2, x0+step/2])
+                self.bracket = Bracket(*self.interval, [previous, (x0, fx0), (x1, fx1)])
                 break
 
-            x0 = x1
+            previous = (x0, fx0)
+            x0, fx0 = x1, fx1
             self.iterations += 1
 
         self.x = sum(self.interval) / 2
         self._report()
 
     def _report(self):
-        Logger.log(f"---> found x={self.x} and interval=({self.interval[0]:.24f}, {self.interval[1]:.24f}) on i={self.iterations}", new_line=True)
+        Logger.log("---> found x={} and interval=({:.24f}, {:.24f}) on i={}",
+                   self.x, self.interval[0], self.interval[1], self.iterations, new_line=True)
@@ -0,0 +1,87 @@
+from utils.Logger import Logger
+from methods.Armijo import Armijo
+
+
+class Wolfe(Armijo):
+    """
+        Неточный одномерный поиск (сильные условия Вольфе)
+        g(t) <= g(0) + c1 * t * g'(0)   and   |g'(t)| <= c2 * |g'(0)|
+
+        Step grows twice until the conditions hold or the interval with acceptable step is found,
+        then the interval is zoomed with quadratic interpolation (Nocedal & Wright, alg. 3.5-3.6).
+    """
+
+    TITLE = "Wolfe"
+    C2 = 0.9
+
+    def __init__(self, fn, fx0, slope, step=1.0, dfn=None, **params):
+        if dfn is None:
+            raise ValueError("Wolfe conditions need derivative `dfn`")
+        self.c2 = params.get("c2", self.C2)
+        super().__init__(fn, fx0, slope, step, dfn, **params)
+
+    def curvature(self, dt):
+        return abs(dt) <= -self.c2 * self.slope
+
+    def find_x(self):
+        headers = ["i", "t", "g(t)", "g'(t)"]
+        log_pattern = "{!s:^3}\t" + "{!s:<24.24}\t" * (len(headers)-1)
+        Logger.debug(log_pattern, *headers)
+
+        t_prev, ft_prev, dt_prev = 0.0, self.fx0, self.slope
+        t = self.start_step
+        while True:
+            self.iterations += 1
+            ft = self._evaluate(t)
+
+            if self.sufficient_decrease(t, ft) is False or (self.iterations > 1 and ft >= ft_prev):
+                Logger.debug(log_pattern, self.iterations, t, ft, None)
+                return self.zoom(t_prev, ft_prev, dt_prev, t, ft)
+
+            dt = self._evaluate_derivative(t)
+            Logger.debug(log_pattern, self.iterations, t, ft, dt)
+
+            if self.curvature(dt):
+                break
+            if dt >= 0:
+                return self.zoom(t, ft, dt, t_prev, ft_prev)
+            if self.iterations >= self.MAX_ITERATIONS:
+                Logger.warning("! MAX_ITERATIONS reached !")
+                break
+
+            t_prev, ft_prev, dt_prev = t, ft, dt
+            t *= 2
+
+        self.x, self.fx = t, ft
+        return t
+
+    def zoom(self, lo, f_lo, d_lo, hi, f_hi):
+        """ interval between lo and hi contains step with strong Wolfe conditions, f(lo) is the best one """
+        while True:
+            self.iterations += 1
+
+            # minimum of the parabola by f(lo), f'(lo), f(hi) - safeguarded to stay inside the interval
+            dx = hi - lo
+            denominator = 2 * (f_hi - f_lo - d_lo * dx)
+            t = lo - d_lo * dx**2 / denominator if denominator != 0 else lo + dx/2
+            if not (min(lo, hi) + 0.1*abs(dx) <= t <= max(lo, hi) - 0.1*abs(dx)):
+                t = lo + dx/2
+
+            ft = self._evaluate(t)
+            if self.sufficient_decrease(t, ft) is False or ft >= f_lo:
+                hi, f_hi = t, ft
+            else:
+                dt = self._evaluate_derivative(t)
+                if self.curvature(dt):
+                    break
+                if dt * (hi - lo) >= 0:
+                    hi, f_hi = lo, f_lo
+                lo, f_lo, d_lo = t, ft, dt
+
+            if self.iterations >= self.MAX_ITERATIONS:
+                Logger.warning("! MAX_ITERATIONS reached !")
+                t, ft = lo, f_lo
+                break
+
+        self.x, self.fx = t, ft
+        return t
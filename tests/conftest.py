@@ -0,0 +1,12 @@
+import pytest
+
+from utils.Logger import Logger
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    """ solvers print tables of iterations, tests check results only """
+    enable, assertion_exit = Logger.ENABLE, Logger.ASSERTION_EXIT
+    Logger.ENABLE, Logger.ASSERTION_EXIT = False, False
+    yield
+    Logger.ENABLE, Logger.ASSERTION_EXIT = enable, assertion_exit
@@ -0,0 +1,120 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from utils.Logger import Logger, MemorySink
+from utils.AsyncEvaluator import AsyncEvaluator
+from methods.AsyncGradientDescent import AsyncGradientDescent
+from methods.AsyncSven import AsyncSven
+from methods.AsyncGoldenSection import AsyncGoldenSection
+from methods.AsyncDSKPowell import AsyncDSKPowell
+from methods.Sven import Sven
+from methods.GoldenSection import GoldenSection
+from methods.DSKPowell import DSKPowell
+from methods.GradientDescent import GradientDescent
+
+
+def fn(x1, x2):
+    return 4*x1**2 + x1*x2 + x2**2 + x1
+
+
+class Simulation:
+    """ async fn, remembers the max count of calls at the same time """
+
+    def __init__(self, fn, delay=0.0):
+        self.fn = fn
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, *args):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.fn(*args)
+        finally:
+            self.running -= 1
+
+
+g = lambda t: (t - 1.7)**2
+
+
+@pytest.mark.parametrize("method, reference", [(AsyncGoldenSection, GoldenSection), (AsyncDSKPowell, DSKPowell)])
+def test_one_dim_methods_are_the_same_as_sync(method, reference):
+    bracket = Sven(g, 0, 0.1).bracket
+    found = asyncio.run(_await(AsyncSven(Simulation(g), 0, 0.1))).bracket
+    assert (found.interval, found.points) == (bracket.interval, bracket.points)
+
+    found = asyncio.run(_await(method(Simulation(g), *bracket, eps=10**-6, bracket=bracket)))
+    assert found.x == pytest.approx(reference(g, *bracket, eps=10**-6, bracket=bracket).x, abs=10**-9)
+
+    # flat objective: degenerate triple of DSK-Powell
+    flat = lambda t: 1.0
+    found = asyncio.run(_await(method(Simulation(flat), 0.0, 1.0, eps=10**-6)))
+    assert found.x == reference(flat, 0.0, 1.0, eps=10**-6).x
+
+
+async def _await(search):
+    return await search
+
+
+@pytest.mark.parametrize("params", [{}, {"step": 0.1}])
+def test_gradient_descent_is_the_same_as_sync(params):
+    start = np.array([3.0, -2.0])
+    optimizer = asyncio.run(_await(AsyncGradientDescent(Simulation(fn), start, **params).start()))
+    reference = GradientDescent(fn, start, **params).start()
+    assert optimizer.iterations == reference.iterations
+    assert np.allclose(optimizer.x, reference.x, atol=10**-9)
+
+
+def test_max_concurrency():
+    simulation = Simulation(fn, delay=0.001)
+    asyncio.run(_await(AsyncGradientDescent(simulation, np.array([3.0, -2.0]), max_concurrency=2).start()))
+    assert simulation.max_running == 2
+
+
+def test_timeout():
+    evaluate = AsyncEvaluator(Simulation(fn, delay=1.0), timeout=0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(evaluate(1.0, 2.0))
+
+
+def test_failed_call_cancels_the_others():
+    slow = Simulation(fn, delay=1.0)
+
+    async def failing(*args):
+        raise RuntimeError("simulation failed")
+
+    async def run():
+        calls = AsyncEvaluator(lambda *args: failing() if args[0] < 0 else slow(*args))
+        with pytest.raises(RuntimeError):
+            await calls.map([(1.0, 1.0), (-1.0, 1.0), (2.0, 1.0)])
+        assert slow.running == 0
+
+    asyncio.run(run())
+
+
+def test_suppressed_logging_of_one_task_does_not_hide_the_others(monkeypatch):
+    sink = MemorySink()
+    monkeypatch.setattr(Logger, "SINKS", [sink])
+    monkeypatch.setattr(Logger, "ENABLE", True)
+
+    async def quiet():
+        with Logger.suppressed():
+            await asyncio.sleep(0.01)
+            Logger.log("hidden")
+            await asyncio.sleep(0.01)
+
+    async def loud():
+        for k in range(3):
+            Logger.log("shown {}", k)
+            await asyncio.sleep(0.005)
+
+    async def run():
+        await asyncio.gather(quiet(), loud())
+
+    asyncio.run(run())
+    assert sink.messages == ["shown 0", "shown 1", "shown 2"]
+    assert Logger.ENABLE is True
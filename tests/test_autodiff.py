@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from utils.autodiff import Dual, autodiff_gradient
+from methods.GradientDescent import GradientDescent
+
+
+def fn(x1, x2, x3):
+    return x1*x2 + np.sin(x3)*x1 + np.exp(x2) + x3**3 / x1
+
+
+def exact_gradient(point):
+    x1, x2, x3 = point
+    return np.array([x2 + math.sin(x3) - x3**3 / x1**2, x1 + math.exp(x2), math.cos(x3)*x1 + 3*x3**2 / x1])
+
+
+@pytest.mark.parametrize("multi_seed", [True, False])
+def test_gradient_is_exact(multi_seed):
+    point = np.array([1.5, -0.5, 0.3])
+    assert np.allclose(autodiff_gradient(fn, point, multi_seed), exact_gradient(point), rtol=10**-14, atol=0)
+
+
+def test_vectorized_fn_uses_numpy_functions_on_arrays_of_duals():
+    point = np.array([0.5, 1.5, 2.0])
+    f = lambda x: np.sum(np.exp(x) * np.sqrt(x)) + np.log(x[0]) + x @ x
+    expected = np.exp(point) * (np.sqrt(point) + 0.5 / np.sqrt(point)) + 2*point
+    expected[0] += 1 / point[0]
+    assert np.allclose(autodiff_gradient(f, point, vectorized=True), expected, rtol=10**-14, atol=0)
+
+
+def test_unary_ufuncs():
+    x = Dual(0.5, 1.0)
+    for ufunc, derivative in [(np.tanh, 1 - math.tanh(0.5)**2), (np.arctan, 1 / 1.25), (np.square, 1.0),
+                              (np.cos, -math.sin(0.5)), (np.absolute, 1.0), (np.negative, -1.0)]:
+        assert ufunc(x).d == pytest.approx(derivative)
+
+
+@pytest.mark.parametrize("f", [
+    lambda x1, x2, x3: math.sin(x1) * x2,    # math functions call float()
+    lambda x1, x2, x3: float(x1 * x2),
+    lambda x1, x2, x3: 1.0,                  # result doesn't depend on the arguments
+])
+def test_lost_derivative_raises(f):
+    with pytest.raises(TypeError):
+        autodiff_gradient(f, np.array([1.0, 2.0, 3.0]))
+
+
+def test_gradient_descent_with_autodiff():
+    f = lambda x1, x2: (x1 - 1)**2 + 10*(x2 + 2)**2 + np.exp(x1 - 1)
+    gd = GradientDescent(f, np.array([3.0, 1.0]), grad="autodiff", criteria_eps=10**-6, one_dim_eps=10**-8).start()
+    assert gd.stats.total("grad") == gd.iterations + 1
+    # 2u + e^u = 0 for u = x1 - 1
+    assert np.allclose(gd.x, [1 - 0.35173371124919584, -2], atol=10**-5)
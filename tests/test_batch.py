@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from methods.GradientDescent import GradientDescent
+from methods.BatchGradientDescent import BatchGradientDescent
+
+
+def fn(x1, x2):
+    return 4*x1**2 + x1*x2 + x2**2 + 0.1*x1**4
+
+
+def grad(point):
+    x1, x2 = point
+    return np.array([8*x1 + x2 + 0.4*x1**3, x1 + 2*x2])
+
+
+def batch_grad(points):
+    return np.array([grad(point) for point in points])
+
+
+STARTS = np.random.default_rng(0).uniform(-3, 3, (20, 2))
+
+
+@pytest.mark.parametrize("one_dim_method", ["golden_section", "fast_golden_section", "dsk_powell"])
+def test_batch_gradient_descent_matches_gradient_descent(one_dim_method):
+    """ same iterations for every start point, x differs only by rounding of array arithmetic """
+    batch = BatchGradientDescent(fn, STARTS, grad=batch_grad, one_dim_method=one_dim_method, criteria_eps=10**-5).start()
+    for k, start in enumerate(STARTS):
+        single = GradientDescent(fn, start, grad=grad, one_dim_method=one_dim_method, criteria_eps=10**-5).start()
+        assert batch.iterations[k] == single.iterations
+        assert batch.converged[k]
+        assert np.allclose(batch.x[k], single.x, rtol=0, atol=10**-12)
+
+
+def test_batch_const_step():
+    batch = BatchGradientDescent(fn, STARTS, step=0.05, grad=batch_grad).start()
+    assert batch.converged.all()
+    assert np.allclose(batch.x, 0, atol=10**-2)
+
+
+def test_batch_numeric_gradient_is_one_call_per_iteration():
+    calls = []
+
+    def counted(x1, x2):
+        calls.append(np.shape(x1))
+        return fn(x1, x2)
+
+    batch = BatchGradientDescent(counted, STARTS, step=0.05).start()
+    assert batch.converged.all()
+    # f in all active points and their shifted points, one call per iteration
+    assert len(calls) == batch.iterations.max() + 1
+    assert batch.stats.total("fn") == 3 * (batch.iterations + 1).sum()
+
+    calls.clear()
+    central = BatchGradientDescent(counted, STARTS, step=0.05, grad_mode="central").start()
+    assert np.allclose(central.x, batch.x, atol=10**-3)
+    assert len(calls) == 2 * (central.iterations.max() + 1)
+
+
+def test_unknown_batch_one_dim_method():
+    with pytest.raises(ValueError):
+        BatchGradientDescent(fn, STARTS, one_dim_method="brent")
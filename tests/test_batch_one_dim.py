@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from methods.Sven import Sven
+from methods.GoldenSection import GoldenSection
+from methods.FastGoldenSection import FastGoldenSection
+from methods.DSKPowell import DSKPowell
+from methods.BatchOneDim import BatchSven, BatchGoldenSection, BatchFastGoldenSection, BatchDSKPowell
+
+
+M = 200
+rng = np.random.default_rng(0)
+CENTERS, FREQUENCIES = rng.uniform(-3, 3, M), rng.uniform(0.5, 5, M)
+STARTS, STEPS = rng.uniform(-2, 2, M), rng.uniform(0.01, 1, M)
+
+
+def batch_fn(t, idx):
+    return (t - CENTERS[idx])**2 + 0.1 * np.cos(FREQUENCIES[idx] * t)
+
+
+def scalar_fn(i):
+    return lambda t: (t - CENTERS[i])**2 + 0.1 * np.cos(FREQUENCIES[i] * t)
+
+
+def test_sven():
+    batch = BatchSven(batch_fn, STARTS, STEPS)
+    for i in range(M):
+        single = Sven(scalar_fn(i), STARTS[i], STEPS[i])
+        assert (batch.interval[0][i], batch.interval[1][i]) == tuple(single.interval)
+        assert batch.iterations[i] == single.iterations
+        assert list(zip(batch.bracket.xs[i], batch.bracket.fxs[i])) == single.bracket.points
+
+
+@pytest.mark.parametrize("seeded", [False, True])
+@pytest.mark.parametrize("batch_method, method", [(BatchGoldenSection, GoldenSection),
+                                                  (BatchFastGoldenSection, FastGoldenSection),
+                                                  (BatchDSKPowell, DSKPowell)])
+def test_the_same_searches_as_scalar_methods(batch_method, method, seeded):
+    bracket = BatchSven(batch_fn, STARTS, STEPS).bracket
+    batch = batch_method(batch_fn, *bracket, eps=10**-6, bracket=bracket if seeded else None)
+    for i in range(M):
+        single_bracket = Sven(scalar_fn(i), STARTS[i], STEPS[i]).bracket
+        single = method(scalar_fn(i), *single_bracket, eps=10**-6, bracket=single_bracket if seeded else None)
+        assert batch.x[i] == single.x
+        assert batch.iterations[i] == single.iterations
+
+
+def test_dsk_powell_on_flat_function():
+    flat = lambda t: 1.0
+    single = DSKPowell(flat, 0.0, 1.0, eps=10**-6)
+    batch = BatchDSKPowell(lambda t, idx: np.ones(len(t)), [0.0], [1.0], eps=10**-6)
+    assert single.x == batch.x[0] == 0.5
+    assert single.iterations == batch.iterations[0] == 1
+    assert batch.evaluations == 3
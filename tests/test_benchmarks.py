@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from utils.utils import gradient
+from utils.benchmarks import make_problems, make_methods, run_one, run_benchmarks, compare
+from methods.GradientDescent import GradientDescent
+
+
+PROBLEMS = {problem.name: problem for problem in make_problems()}
+
+
+@pytest.mark.parametrize("name", list(PROBLEMS))
+def test_exact_gradients(name):
+    problem = PROBLEMS[name]
+    assert problem.grad is not None
+    point = problem.start_point + 0.37
+    expected = gradient(problem.fn, point, 10**-6, "central")
+    assert np.allclose(problem.grad(point), expected, rtol=10**-6, atol=10**-6)
+
+
+def test_methods_without_line_search_are_not_crossed():
+    methods = make_methods()
+    names = [name for name, _ in methods]
+    assert len(names) == len(set(names))
+    for modification in ("nesterov", "barzilai_borwein"):
+        assert [name for name in names if name.split("/")[0] == modification] == [modification]
+    for one_dim_method in GradientDescent.ONE_DIM_METHODS:
+        assert f"lbfgs/{one_dim_method}" in names
+
+
+@pytest.mark.parametrize("method", ["optimal/golden_section", "optimal/brent", "optimal/dsk_powell"])
+def test_himmelblau_runs_with_bracketing_methods(method):
+    params = dict(make_methods())[method]
+    record = run_one(PROBLEMS["himmelblau"], params, criteria=1, criteria_eps=10**-4)
+    assert "error" not in record
+    assert record["distance"] < 10**-3
+
+
+@pytest.mark.parametrize("method", ["newton/golden_section", "lbfgs/golden_section", "fletcher_reeves/golden_section",
+                                    "polak_ribiere/brent"])
+def test_second_order_methods_converge_fast_on_quadratic(method):
+    """ with exact gradient and exact line search: about n = 2 iterations """
+    params = dict(make_methods())[method]
+    record = run_one(PROBLEMS["quadratic_c100"], params, criteria=1, criteria_eps=10**-4, one_dim_eps=10**-8)
+    assert record["max_iterations_reached"] is False
+    assert record["iterations"] <= 4
+    assert record["distance"] < 10**-6
+
+
+def test_compare_reports_changes():
+    methods = [("optimal/golden_section", {"one_dim_method": "golden_section"})]
+    results = run_benchmarks([PROBLEMS["quadratic_c100"]], methods)
+    baseline = [dict(results[0], iterations=results[0]["iterations"] * 2)]
+    changes = compare(results, baseline)
+    assert [change[2] for change in changes if change[2] != "time"] == ["iterations"]
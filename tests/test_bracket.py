@@ -0,0 +1,105 @@
+import functools
+
+import numpy as np
+import pytest
+
+from methods.Sven import Sven, Bracket
+from methods.GoldenSection import GoldenSection
+from methods.FastGoldenSection import FastGoldenSection
+from methods.DSKPowell import DSKPowell
+from methods.Brent import Brent
+from methods.KSection import KSection
+from methods.GradientDescent import GradientDescent
+
+
+EPSILONS = [10**-3, 10**-4, 10**-5, 10**-6, 10**-7, 10**-8]
+
+
+class Counted:
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.fn(x)
+
+
+def g(t):
+    return (t - 1.7)**2 + 0.1 * np.cos(3 * t)
+
+
+def test_bracket_keeps_the_points_of_sven():
+    f = Counted(g)
+    bracket = Sven(f, 0, 0.1).bracket
+    assert bracket.interval[0] < 1.7 < bracket.interval[1]
+    assert len(bracket.points) == 3 < f.calls
+    assert all(fx == g(x) for x, fx in bracket.points)
+    l, m, r = bracket.triple()
+    assert l[0] < m[0] < r[0] and m[1] <= min(l[1], r[1])
+
+
+def test_triple_on_the_edge():
+    assert Bracket(0, 2, [(0, 1.0), (1, 2.0), (2, 3.0)]).triple() is None
+
+
+@pytest.mark.parametrize("method", [GoldenSection, FastGoldenSection, Brent,
+                                    functools.partial(KSection, k=3)], ids=lambda m: getattr(m, "__name__", "KSection"))
+def test_bracket_saves_evaluations_and_keeps_the_result(method):
+    bracket = Sven(g, 0, 0.1).bracket
+    saved = 0
+    for eps in EPSILONS:
+        cold, seeded = Counted(g), Counted(g)
+        x_cold = method(cold, *bracket, eps=eps).x
+        x_seeded = method(seeded, *bracket, eps=eps, bracket=bracket).x
+        assert x_seeded == pytest.approx(x_cold, abs=eps)
+        assert seeded.calls <= cold.calls
+        saved += cold.calls - seeded.calls
+    assert saved >= len(EPSILONS) // 3
+
+
+def test_golden_section_seeds_only_when_it_needs_no_more_iterations():
+    bracket = Sven(g, 0, 0.1).bracket
+    for eps in EPSILONS:
+        cold = GoldenSection(g, *bracket, eps=eps)
+        seeded = GoldenSection(g, *bracket, eps=eps, bracket=bracket)
+        assert seeded.iterations <= cold.iterations
+
+    # x1 of the first iteration is the best point of Sven: the interval is [l, l + (m-l)/X1], it covers [a, b]
+    points = []
+    GoldenSection(lambda x: points.append(x) or g(x), *bracket, eps=10**-8, bracket=bracket)
+    (l, _), (m, _), _ = bracket.triple()
+    assert m not in points and points[0] == pytest.approx(l + (m - l) / GoldenSection.X1_COEFFICIENT * 0.618)
+    assert l + (m - l) / GoldenSection.X1_COEFFICIENT >= bracket.b
+
+
+def test_dsk_powell_starts_from_the_triple():
+    q = lambda t: (t - 1.7)**2
+    bracket = Sven(q, 0, 0.1).bracket
+    cold, seeded = Counted(q), Counted(q)
+    # the parabola through any triple of a quadratic is exact
+    assert DSKPowell(cold, *bracket, eps=10**-6).x == pytest.approx(1.7)
+    assert DSKPowell(seeded, *bracket, eps=10**-6, bracket=bracket).x == pytest.approx(1.7)
+    assert seeded.calls < cold.calls
+
+    # on other functions both approximations have the accuracy of the parabola
+    minimum = 1.5502839
+    assert DSKPowell(g, *Sven(g, 0, 0.1).bracket, eps=10**-6).x == pytest.approx(minimum, abs=0.02)
+    assert DSKPowell(g, *Sven(g, 0, 0.1).bracket, eps=10**-6, bracket=Sven(g, 0, 0.1).bracket).x == \
+        pytest.approx(minimum, abs=0.02)
+
+
+@pytest.mark.parametrize("one_dim_method", ["golden_section", "fast_golden_section", "dsk_powell", "brent"])
+def test_gradient_descent_reuses_sven_points(one_dim_method, monkeypatch):
+    fn = lambda x1, x2: 4*x1**2 + x1*x2 + x2**2 + np.exp(x1)
+    seeded = GradientDescent(fn, np.array([3.0, -2.0]), one_dim_method=one_dim_method, one_dim_eps=10**-6).start()
+
+    # the same run without hand-off: one-dim methods don't get the bracket
+    for method in GradientDescent.ONE_DIM_METHODS.values():
+        init = method.__init__
+        monkeypatch.setattr(method, "__init__",
+                            lambda self, *args, bracket=None, _init=init, **kwargs: _init(self, *args, **kwargs))
+    cold = GradientDescent(fn, np.array([3.0, -2.0]), one_dim_method=one_dim_method, one_dim_eps=10**-6).start()
+
+    assert np.allclose(seeded.x, cold.x, atol=10**-4)
+    assert seeded.stats.total("fn") / (seeded.iterations + 1) < cold.stats.total("fn") / (cold.iterations + 1)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from utils.Cache import EvaluationCache
+from methods.GradientDescent import GradientDescent
+
+
+def fn(x1, x2):
+    return 4*x1**2 + x1*x2 + x2**2
+
+
+def test_hits_and_misses():
+    f = EvaluationCache(fn)
+    assert f(1.0, 2.0) == f(1.0, 2.0) == fn(1.0, 2.0)
+    assert (f.hits, f.misses) == (1, 1)
+
+
+def test_arrays_are_keys_by_value():
+    f = EvaluationCache(lambda x: x @ x)
+    f(np.array([1.0, 2.0]))
+    f(np.array([1.0, 2.0]))
+    f(np.array([1.0, 2.0], dtype=np.float32))
+    assert (f.hits, f.misses) == (1, 2)
+
+
+def test_lru_eviction():
+    f = EvaluationCache(fn, maxsize=2)
+    f(1.0, 1.0)
+    f(2.0, 2.0)
+    f(1.0, 1.0)     # (1, 1) is the newest now
+    f(3.0, 3.0)     # (2, 2) is evicted
+    assert len(f) == 2
+    f(1.0, 1.0)
+    f(2.0, 2.0)
+    assert (f.hits, f.misses) == (2, 4)
+
+
+def test_cache_does_not_change_the_result():
+    x0 = np.array([6.0, 4.0])
+    plain = GradientDescent(fn, x0, one_dim_method="golden_section").start()
+    cached = GradientDescent(fn, x0, one_dim_method="golden_section", cache=True).start()
+    assert np.array_equal(plain.x, cached.x)
+    assert cached.cache.hits > 0
+    assert cached.stats.total("fn") < plain.stats.total("fn")
+
+
+def test_cache_lives_while_iterate_runs():
+    optimizer = GradientDescent(fn, np.array([6.0, 4.0]), one_dim_method="golden_section", cache=True)
+    iterations = optimizer.iterate()
+    next(iterations)
+    next(iterations)
+    assert len(optimizer.cache) > 0
+    iterations.close()
+    assert len(optimizer.cache) == 0
+
+    for _ in optimizer.iterate():
+        pass
+    assert len(optimizer.cache) == 0
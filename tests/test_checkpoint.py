@@ -0,0 +1,75 @@
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from methods.GradientDescent import GradientDescent
+
+
+START = np.array([-1.2, 1.0, 0.5])
+
+
+def fn(x1, x2, x3):
+    return (x1 - 1)**2 + 5*(x1 + x2)**2 + 2*(x3 - x2)**2 + 0.1*x1**4
+
+
+def grad(x):
+    x1, x2, x3 = x
+    return np.array([2*(x1 - 1) + 10*(x1 + x2) + 0.4*x1**3, 10*(x1 + x2) - 4*(x3 - x2), 4*(x3 - x2)])
+
+
+PARAMS = [
+    {},
+    {"step": 0.5},
+    {"modification": "nesterov", "step": 0.01},
+    {"modification": "barzilai_borwein", "step": 0.01},
+    {"modification": "lbfgs"},
+    {"modification": "fletcher_reeves"},
+    {"modification": "polak_ribiere", "one_dim_method": "brent"},
+    {"modification": "newton", "one_dim_method": "armijo"},
+    {"one_dim_method": "wolfe", "sven_step": 0.01},
+]
+
+
+def make(params, **kwargs):
+    return GradientDescent(fn, START, grad=grad, criteria_eps=10**-6, **params, **kwargs)
+
+
+@pytest.mark.parametrize("params", PARAMS, ids=lambda params: "-".join(map(str, params.values())) or "optimal")
+def test_resume_gives_the_same_result(tmp_path, params):
+    reference = make(params).start()
+    assert reference.iterations > 4
+
+    path = str(tmp_path / "run.npz")
+    crashed = make(params, checkpoint_path=path, checkpoint_every=2)
+    # "crash" on the iteration 3, last checkpoint is saved before the iteration 2
+    for _ in itertools.islice(crashed.iterate(), 4):
+        pass
+
+    resumed = make(params, checkpoint_path=path, checkpoint_every=2, resume=True).start()
+    assert resumed.iterations == reference.iterations
+    assert np.array_equal(resumed.x, reference.x)
+    assert np.array_equal(resumed.history.xs, reference.history.xs)
+    assert np.array_equal(resumed.history.fxs, reference.history.fxs)
+
+
+def test_checkpoint_is_replaced_atomically(tmp_path):
+    path = str(tmp_path / "run.npz")
+    gd = make({}, checkpoint_path=path, checkpoint_every=2).start()
+    assert os.listdir(tmp_path) == ["run.npz"]
+    with np.load(path) as npz:
+        assert int(npz["iterations"]) == gd.iterations - gd.iterations % 2
+
+
+def test_resume_without_checkpoint_starts_from_the_beginning(tmp_path):
+    path = str(tmp_path / "missing.npz")
+    gd = make({}, checkpoint_path=path, resume=True).start()
+    assert np.array_equal(gd.x, make({}).start().x)
+
+
+def test_checkpoint_of_other_method(tmp_path):
+    path = str(tmp_path / "run.npz")
+    make({"modification": "lbfgs"}, checkpoint_path=path, checkpoint_every=1).start()
+    with pytest.raises(ValueError):
+        make({}).load_checkpoint(path)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from utils.benchmarks import make_quadratic
+from methods.GradientDescent import (GradientDescent, ConjugateGradientDescent, FletcherReevesGradientDescent,
+                                     PolakRibiereGradientDescent)
+
+
+START = np.array([1.0, -2.0, 3.0, -4.0])
+MODIFICATIONS = {"fletcher_reeves": FletcherReevesGradientDescent, "polak_ribiere": PolakRibiereGradientDescent}
+
+
+@pytest.mark.parametrize("modification", list(MODIFICATIONS))
+def test_quadratic_is_solved_in_about_n_iterations(modification):
+    fn, grad = make_quadratic(100, len(START))
+    params = dict(grad=grad, criteria_eps=10**-6, one_dim_eps=10**-10)
+    cg = GradientDescent(fn, START, modification=modification, **params).start()
+    steepest = GradientDescent(fn, START, **params).start()
+    assert type(cg) is MODIFICATIONS[modification]
+    assert np.allclose(cg.x, 0, atol=10**-6)
+    # exact CG needs n iterations, the line search is exact up to one_dim_eps only
+    assert cg.iterations <= 2 * len(START) < steepest.iterations
+
+
+@pytest.mark.parametrize("modification", list(MODIFICATIONS))
+def test_restarts(modification):
+    fn, grad = make_quadratic(100, len(START))
+    gd = GradientDescent(fn, START, grad=grad, modification=modification, cg_restart=3,
+                         criteria_eps=10**-6, one_dim_eps=10**-10).start()
+    assert np.allclose(gd.x, 0, atol=10**-6)
+    # restart every 3 iterations at least
+    assert gd.restarts >= (gd.iterations - 1) // 3
+    assert gd._since_restart <= 3
+
+
+def test_beta():
+    gx, prev_gx = np.array([1.0, 2.0]), np.array([2.0, 0.0])
+    assert FletcherReevesGradientDescent.get_beta(None, gx, prev_gx) == 5 / 4
+    assert PolakRibiereGradientDescent.get_beta(None, gx, prev_gx) == (1*(-1) + 2*2) / 4
+    # negative beta is replaced with 0 (restart along the gradient)
+    assert PolakRibiereGradientDescent.get_beta(None, np.array([1.0, 0.0]), prev_gx) == 0.0
+
+
+def test_base_class_is_mixin():
+    with pytest.raises(Exception, match="Mixin"):
+        ConjugateGradientDescent.get_beta(None, np.ones(2), np.ones(2))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from utils.utils import gradient, batch_gradient
+from methods.GradientDescent import GradientDescent
+
+
+def fn(x1, x2):
+    return 3*x1**2 + x1*x2 + 2*x2**2
+
+
+def exact_gradient(point):
+    x1, x2 = point
+    return np.array([6*x1 + x2, x1 + 4*x2])
+
+
+class Calls:
+    """ fn which remembers how many calls and points it got """
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+        self.points = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        self.points += np.size(args[0])
+        return self.fn(*args)
+
+
+@pytest.mark.parametrize("mode", ["forward", "central", "complex"])
+def test_gradient_modes(mode):
+    point = np.array([1.5, -0.5])
+    assert np.allclose(gradient(fn, point, 10**-6, mode), exact_gradient(point), atol=10**-4)
+
+
+@pytest.mark.parametrize("mode", ["forward", "central"])
+def test_vectorized_gradient_is_the_same(mode):
+    point = np.array([1.5, -0.5])
+    vectorized = gradient(lambda x: fn(*x), point, 10**-6, mode, vectorized=True)
+    assert np.allclose(vectorized, gradient(fn, point, 10**-6, mode), atol=10**-6)
+
+
+def test_gradient_is_one_broadcast_call():
+    counted = Calls(fn)
+    gradient(counted, np.array([1.5, -0.5]))
+    assert counted.calls == 1
+    assert counted.points == 3
+
+
+def test_known_fx_is_not_evaluated_again():
+    point = np.array([1.5, -0.5])
+    counted = Calls(fn)
+    result = gradient(counted, point, fx=fn(*point))
+    assert counted.points == 2
+    assert np.allclose(result, gradient(fn, point))
+
+    counted = Calls(lambda x: fn(*x))
+    gradient(counted, point, vectorized=True, fx=fn(*point))
+    assert counted.calls == 2
+
+
+def test_batch_gradient():
+    points = np.array([[1.5, -0.5], [0.0, 2.0], [-1.0, 1.0]])
+    expected = np.array([exact_gradient(p) for p in points])
+    assert np.allclose(batch_gradient(fn, points, 10**-6, "central"), expected, atol=10**-4)
+    fxs = fn(*points.T)
+    assert np.allclose(batch_gradient(fn, points, fxs=fxs), batch_gradient(fn, points))
+
+
+def test_iteration_reuses_fx_in_numeric_gradient():
+    counted = Calls(fn)
+    GradientDescent(counted, np.array([6.0, 4.0]), step=0.1, criteria_eps=10**-2).start()
+    iterations = []
+    for it in GradientDescent(fn, np.array([6.0, 4.0]), step=0.1, criteria_eps=10**-2).iterate():
+        iterations.append(it)
+    # f(x) and n shifted points per iteration, no second f(x)
+    assert counted.points == len(iterations) * 3
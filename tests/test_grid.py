@@ -0,0 +1,103 @@
+import os
+import threading
+
+import numpy as np
+
+from utils.Grid import Grid, objective_key
+
+
+def fn(x, y):
+    return (x - 1)**2 + np.sin(y)
+
+
+def make(c):
+    return lambda x, y: (x - c)**2 + y**2
+
+
+def test_values_and_tiles():
+    grid = Grid(fn, (-1, 1), (-2, 2), 0.1, tile=7)
+    xgrid, ygrid, z = grid
+    assert z.shape == (40, 20) == grid.shape
+    assert np.allclose(z, fn(*np.meshgrid(np.arange(-1, 1, 0.1), np.arange(-2, 2, 0.1))))
+    assert len(grid.tiles()) == 6 * 3
+
+
+def test_process_pool_gives_the_same_grid():
+    serial = Grid(fn, (-1, 1), (-2, 2), 0.1, tile=7)
+    parallel = Grid(fn, (-1, 1), (-2, 2), 0.1, tile=7, max_workers=2)
+    assert np.array_equal(serial.z, parallel.z)
+
+
+def test_cache(tmp_path):
+    first = Grid(fn, (-1, 1), (-1, 1), 0.1, cache_dir=str(tmp_path))
+    second = Grid(fn, (-1, 1), (-1, 1), 0.1, cache_dir=str(tmp_path))
+    assert (first.cached, second.cached) == (False, True)
+    assert second.path == first.path and np.array_equal(first.z, second.z)
+    assert Grid(fn, (-1, 1), (-1, 1), 0.2, cache_dir=str(tmp_path)).cached is False
+
+
+def test_closures_get_different_cache_entries(tmp_path):
+    one = Grid(make(1), (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path))
+    two = Grid(make(2), (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path))
+    assert two.cached is False
+    assert not np.array_equal(one.z, two.z)
+    assert Grid(make(2), (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path)).cached is True
+
+
+def test_key_depends_on_defaults_and_global_functions():
+    def f(x, y, a=1):
+        return a*x + y
+
+    def g(x, y, a=2):
+        return a*x + y
+
+    assert objective_key(f) != objective_key(g)
+    assert objective_key(make(1)) == objective_key(make(1))
+
+    # functions used as globals are a part of the code
+    global helper
+    helper = lambda x: x**2
+    uses_helper = lambda x, y: helper(x) + y
+    key = objective_key(uses_helper)
+    helper = lambda x: x**3
+    assert objective_key(uses_helper) != key
+
+
+CALLS = 0
+
+
+def counted(x, y):
+    global CALLS
+    CALLS += 1
+    return x + y
+
+
+def test_key_does_not_depend_on_global_counter(tmp_path):
+    key = objective_key(counted)
+    counted(1.0, 2.0)
+    assert objective_key(counted) == key
+    Grid(counted, (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path))
+    assert Grid(counted, (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path)).cached is True
+
+
+def test_fn_which_cant_be_identified_is_not_cached(tmp_path):
+    lock = threading.Lock()
+
+    def locked(x, y):
+        with lock:
+            return x + y
+
+    assert objective_key(locked) is None
+    grid = Grid(locked, (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path))
+    assert grid.cached is False and os.listdir(tmp_path) == []
+
+    keyed = Grid(locked, (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path), cache_key="locked sum")
+    assert Grid(locked, (-1, 1), (-1, 1), 0.5, cache_dir=str(tmp_path), cache_key="locked sum").path == keyed.path
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_temporary_file_is_removed():
+    grid = Grid(fn, (-1, 1), (-1, 1), 0.5)
+    path = grid.path
+    grid.close()
+    assert os.path.exists(path) is False
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from utils.History import History
+from methods.GradientDescent import GradientDescent
+
+
+def fill(history, count):
+    for i in range(count):
+        history.append(i, np.array([i, -i], dtype=float), float(i * i), np.array([1.0, 0.0]), float(i))
+    return history
+
+
+def test_buffers_grow():
+    history = fill(History(), History.INITIAL_CAPACITY * 2 + 3)
+    assert len(history) == History.INITIAL_CAPACITY * 2 + 3
+    assert history.capacity >= len(history)
+    assert np.array_equal(history.iterations, np.arange(len(history)))
+    assert np.array_equal(history.xs[:, 1], -np.arange(len(history)))
+    assert history.current.i == len(history) - 1
+    assert history.last.i == len(history) - 2
+
+
+def test_ring_buffer_keeps_last_records():
+    history = fill(History(maxlen=5), 13)
+    assert len(history) == 5
+    assert history.capacity == 5
+    assert np.array_equal(history.iterations, np.arange(8, 13))
+    assert np.array_equal(history.fxs, np.arange(8, 13) ** 2)
+    assert [unit.i for unit in history[1:3]] == [9, 10]
+    assert history[-1].i == 12
+
+
+def test_pop_returns_copies():
+    history = fill(History(maxlen=3), 7)
+    popped = history.pop()
+    assert popped.i == 6
+    fill(history, 1)    # reuses the slot of the popped record
+    assert np.array_equal(popped.x, [6, -6])
+    assert history.current.i == 0
+    assert history.last.i == 5
+
+
+def test_setitem_and_index_errors():
+    history = fill(History(), 3)
+    history[0] = (10, np.array([1.0, 1.0]), 2.0, np.array([0.0, 1.0]))
+    assert history[0].i == 10
+    with pytest.raises(IndexError):
+        history[3]
+    with pytest.raises(TypeError):
+        history[0] = 1
+    with pytest.raises(ValueError):
+        History(maxlen=0)
+
+
+def test_save_and_load(tmp_path):
+    history = fill(History(maxlen=4), 9)
+    path = tmp_path / "history.npz"
+    history.save(path)
+    loaded = History.load(path)
+    for name, column in history.arrays().items():
+        assert np.array_equal(loaded.arrays()[name], column)
+
+
+def test_history_size_of_gradient_descent():
+    fn = lambda x1, x2: 4*x1**2 + x1*x2 + x2**2
+    full = GradientDescent(fn, np.array([6.0, 4.0]), step=0.1).start()
+    short = GradientDescent(fn, np.array([6.0, 4.0]), step=0.1, history_size=3).start()
+    unrecorded = GradientDescent(fn, np.array([6.0, 4.0]), step=0.1, record_history=False).start()
+    assert len(full.history) > 3
+    assert len(short.history) == 3
+    assert len(unrecorded.history) == 2
+    assert np.array_equal(short.history.xs, full.history.xs[-3:])
+    assert np.array_equal(unrecorded.x, full.x)
@@ -0,0 +1,68 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from methods.GradientDescent import GradientDescent
+
+
+fn = lambda x1, x2: 4*x1**2 + x1*x2 + x2**2
+grad = lambda x: np.array([8*x[0] + x[1], x[0] + 2*x[1]])
+START = np.array([3.0, -2.0])
+
+
+# const step is not here: its history drops the points where f(x) grows
+@pytest.mark.parametrize("params", [{}, {"modification": "nesterov"}, {"modification": "lbfgs"}])
+def test_iterate_gives_the_same_trajectory_as_start(params):
+    records = [(it.i, it.x.copy(), it.fx, it.gx_norm) for it in GradientDescent(fn, START, grad=grad, **params).iterate()]
+    gd = GradientDescent(fn, START, grad=grad, **params).start()
+
+    assert [i for i, *_ in records] == list(gd.history.iterations)
+    assert np.array_equal([x for _, x, *_ in records], gd.history.xs)
+    assert np.array_equal([fx for _, _, fx, _ in records], gd.history.fxs)
+    assert np.array_equal([norm for *_, norm in records], gd.history.grad_norms)
+
+
+def test_iterate_const_step():
+    records = list(GradientDescent(fn, START, step=0.5, grad=grad).iterate())
+    gd = GradientDescent(fn, START, step=0.5, grad=grad).start()
+    assert len(records) == gd.iterations + 1
+    assert np.array_equal(records[-1].x, gd.x)
+
+
+def test_last_record_has_no_step():
+    records = list(GradientDescent(fn, START, grad=grad).iterate())
+    assert all(it.step is not None for it in records[:-1])
+    assert records[-1].step is None
+    assert records[-1].gx_norm <= 10**-3
+
+
+def test_early_stop():
+    gd = GradientDescent(fn, START, grad=grad)
+    records = list(itertools.islice(gd.iterate(), 3))
+    assert [it.i for it in records] == [0, 1, 2]
+    assert gd.iterations == 2 and gd.x is None
+
+
+def test_criteria_eps_can_be_changed_between_iterations():
+    gd = GradientDescent(fn, START, grad=grad, criteria_eps=10**-10)
+    for it in gd.iterate():
+        if it.i == 2:
+            gd.criteria_eps = 10**2
+    assert it.i == 3 and it.step is None
+
+
+def test_without_history_recording():
+    gd = GradientDescent(fn, START, grad=grad, record_history=False, criteria_eps=10**-8)
+    records = [it.fx for it in gd.iterate()]
+    reference = GradientDescent(fn, START, grad=grad, criteria_eps=10**-8).start()
+
+    assert len(records) > 2
+    assert records == list(reference.history.fxs)
+    assert len(gd.history.items()) == gd.history.capacity == 2
+    assert np.array_equal(gd.x, reference.x)
+
+
+def test_history_size_should_keep_two_iterations():
+    with pytest.raises(ValueError):
+        GradientDescent(fn, START, grad=grad, history_size=1)
@@ -0,0 +1,87 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from methods.KSection import KSection
+from methods.GradientDescent import GradientDescent
+
+
+def g(t):
+    return (t - 1.7)**2 + 0.1 * np.cos(3 * t)
+
+
+def fn(x1, x2):
+    return 4*x1**2 + x1*x2 + x2**2 + np.exp(x1)
+
+
+START = np.array([3.0, -2.0])
+
+
+def is_shut_down(executor):
+    try:
+        executor.submit(abs, 1)
+    except RuntimeError:
+        return True
+    return False
+
+
+@pytest.mark.parametrize("k", [2, 3, 8])
+def test_finds_minimum(k):
+    search = KSection(g, 0.7, 2.3, eps=10**-6, k=k)
+    assert abs(search.interval[1] - search.interval[0]) <= 10**-6
+    assert search.x == pytest.approx(1.5502839, abs=10**-6)
+
+
+def test_odd_k_reuses_the_best_probe():
+    search = KSection(g, 0.7, 2.3, eps=10**-6, k=3)
+    # k probes in the first round, k-1 new ones in the others
+    assert search.evaluations == 3 + 2 * (search.iterations - 1)
+    even = KSection(g, 0.7, 2.3, eps=10**-6, k=4)
+    assert even.evaluations == 4 * even.iterations
+
+
+def test_own_executor_is_not_shut_down():
+    with ThreadPoolExecutor(2) as executor:
+        first = KSection(g, 0.7, 2.3, eps=10**-6, k=3, pool=executor)
+        second = KSection(g, 0.7, 2.3, eps=10**-6, k=3, pool=executor)
+        assert first.x == second.x == KSection(g, 0.7, 2.3, eps=10**-6, k=3, pool="process").x
+
+
+def test_wrong_parameters():
+    with pytest.raises(ValueError):
+        KSection(g, 0.7, 2.3, k=1)
+    with pytest.raises(ValueError):
+        KSection(g, 0.7, 2.3, pool="cluster")
+
+
+def test_process_pool_in_gradient_descent():
+    params = dict(one_dim_method="k_section", one_dim_eps=10**-6)
+    threads = GradientDescent(fn, START, one_dim_params={"k": 3, "pool": "thread"}, **params).start()
+    processes = GradientDescent(fn, START, one_dim_params={"k": 3, "pool": "process"}, **params).start()
+    assert processes.iterations == threads.iterations
+    assert np.array_equal(processes.x, threads.x)
+    assert processes.stats.total("fn") == threads.stats.total("fn")
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_one_pool_per_run(pool, monkeypatch):
+    executors = []
+    make_executor = KSection.make_executor.__func__
+
+    def counted(cls, *args):
+        executors.append(make_executor(cls, *args))
+        return executors[-1]
+
+    monkeypatch.setattr(KSection, "make_executor", classmethod(counted))
+    gd = GradientDescent(fn, START, one_dim_method="k_section", one_dim_params={"k": 3, "pool": pool}).start()
+    assert gd.stats.total("line_search") > 1
+    assert len(executors) == 1 and is_shut_down(executors[0])
+    assert gd._executor is None
+
+    # a run stopped by the caller shuts its pool down too
+    iterations = GradientDescent(fn, START, one_dim_method="k_section", one_dim_params={"k": 3, "pool": pool}).iterate()
+    list(itertools.islice(iterations, 2))
+    iterations.close()
+    assert len(executors) == 2 and is_shut_down(executors[1])
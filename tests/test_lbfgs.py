@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from utils.benchmarks import make_quadratic, rosenbrock, rosenbrock_gradient
+from methods.GradientDescent import GradientDescent, LBFGSGradientDescent
+
+
+START = np.array([1.0, -2.0, 3.0, -4.0, 5.0])
+
+
+def test_factory():
+    fn, grad = make_quadratic(10, 2)
+    assert type(GradientDescent(fn, np.array([1.0, 1.0]), grad=grad, modification="lbfgs")) is LBFGSGradientDescent
+
+
+def test_fewer_iterations_than_steepest_descent_on_ill_conditioned_quadratic():
+    fn, grad = make_quadratic(100, len(START))
+    params = dict(grad=grad, criteria_eps=10**-6, one_dim_eps=10**-10)
+    lbfgs = GradientDescent(fn, START, modification="lbfgs", **params).start()
+    steepest = GradientDescent(fn, START, **params).start()
+    assert np.allclose(lbfgs.x, 0, atol=10**-6)
+    assert lbfgs.iterations < steepest.iterations
+    # with (almost) exact line search L-BFGS with m >= n is CG on a quadratic: about n iterations
+    assert lbfgs.iterations <= 2 * len(START)
+
+
+@pytest.mark.parametrize("memory", [1, 3, 10])
+def test_pairs_are_kept_in_fixed_ring_buffer(memory):
+    gd = GradientDescent(rosenbrock, START, grad=rosenbrock_gradient, modification="lbfgs", lbfgs_memory=memory,
+                         criteria_eps=10**-6, one_dim_eps=10**-8).start()
+    assert gd.S.shape == gd.Y.shape == (memory, len(START))
+    assert gd.rho.shape == (memory,)
+    assert 1 <= gd.pairs <= memory
+    assert np.linalg.norm(rosenbrock_gradient(gd.x)) <= 10**-6
+
+
+def test_two_loop_holds_secant_equation():
+    """ H_k * y_(k-1) = s_(k-1) for the newest pair """
+    gd = GradientDescent(rosenbrock, START, grad=rosenbrock_gradient, modification="lbfgs", lbfgs_memory=3)
+    for record in gd.iterate():
+        if gd.pairs == 3:
+            break
+    newest = (gd._head - 1) % gd.memory
+    assert np.allclose(gd.two_loop(gd.Y[newest]), gd.S[newest])
+
+
+def test_memory_should_be_positive():
+    fn, grad = make_quadratic(10, 2)
+    with pytest.raises(ValueError):
+        GradientDescent(fn, np.array([1.0, 1.0]), grad=grad, modification="lbfgs", lbfgs_memory=0)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from methods.Armijo import Armijo
+from methods.Wolfe import Wolfe
+from methods.GradientDescent import GradientDescent
+
+
+# g(t) = f(x + t*d) for f = (x-3)^2 from x = 0 along d = 1
+g = lambda t: (t - 3)**2
+dg = lambda t: 2*(t - 3)
+
+
+def test_armijo_halves_step_until_sufficient_decrease():
+    search = Armijo(g, g(0), dg(0), step=16.0)
+    # 16 and 8 don't decrease g enough, 4 does
+    assert search.x == 4.0
+    assert search.evaluations == search.iterations == 3
+    assert search.grad_evaluations == 0
+    assert search.fx <= g(0) + Armijo.C1 * search.x * dg(0)
+
+
+def test_armijo_accepts_first_step():
+    search = Armijo(g, g(0), dg(0), step=1.0)
+    assert (search.x, search.evaluations) == (1.0, 1)
+
+
+@pytest.mark.parametrize("step", [0.01, 1.0, 100.0])
+def test_wolfe_step_holds_strong_conditions(step):
+    search = Wolfe(g, g(0), dg(0), step=step, dfn=dg)
+    t = search.x
+    assert g(t) <= g(0) + Wolfe.C1 * t * dg(0)
+    assert abs(dg(t)) <= Wolfe.C2 * abs(dg(0))
+    assert search.evaluations >= 1
+
+
+def test_wolfe_needs_derivative():
+    with pytest.raises(ValueError):
+        Wolfe(g, g(0), dg(0))
+
+
+def test_wolfe_tight_curvature_finds_exact_minimum_of_parabola():
+    # c2 -> 0 is an exact line search, the interpolation of the parabola hits the minimum
+    assert Wolfe(g, g(0), dg(0), step=100.0, dfn=dg, c2=10**-6).x == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize("one_dim_method", ["armijo", "wolfe"])
+def test_gradient_descent_with_inexact_line_search(one_dim_method):
+    fn = lambda x1, x2: 4*x1**2 + x1*x2 + x2**2
+    grad = lambda x: np.array([8*x[0] + x[1], x[0] + 2*x[1]])
+    gd = GradientDescent(fn, np.array([3.0, -2.0]), grad=grad, one_dim_method=one_dim_method, criteria_eps=10**-6).start()
+    assert np.allclose(gd.x, [0, 0], atol=10**-5)
+
+    golden = GradientDescent(fn, np.array([3.0, -2.0]), grad=grad, criteria_eps=10**-6).start()
+    # the point of inexact search: far less evaluations of fn per line search
+    assert gd.stats.total("fn") < golden.stats.total("fn")
+    assert gd.stats.total("line_search") == gd.iterations
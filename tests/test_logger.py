@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from utils.Logger import Logger, MemorySink, FileSink, JsonLinesSink
+
+
+class Lazy:
+    """ argument that fails the test if it is formatted """
+
+    def __format__(self, spec):
+        raise AssertionError("disabled record was formatted")
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    memory = MemorySink()
+    monkeypatch.setattr(Logger, "SINKS", [memory])
+    monkeypatch.setattr(Logger, "ENABLE", True)
+    monkeypatch.setattr(Logger, "LEVEL", Logger.DEBUG)
+    return memory
+
+
+def test_records_and_depth(sink):
+    with Logger("title"):
+        Logger.log("x={}", 1)
+        Logger.debug("row {} {}", 2, 3)
+    assert sink.messages[1:3] == ["x=1", "row 2 3"]
+    assert [record.depth for record in sink.records] == [0, 1, 1, 0]
+
+
+def test_disabled_logging_does_not_format(sink):
+    Logger.ENABLE = False
+    Logger.debug("{}", Lazy())
+    Logger.log("{}", Lazy())
+    assert sink.records == []
+
+
+def test_level_filter(sink):
+    Logger.LEVEL = Logger.WARNING
+    Logger.debug("{}", Lazy())
+    Logger.log("{}", Lazy())
+    Logger.warning("careful")
+    assert sink.messages == ["careful"]
+    assert Logger.is_enabled(Logger.INFO) is False
+
+
+def test_suppressed(sink):
+    with Logger.suppressed():
+        Logger.log("hidden")
+    with Logger.suppressed(False):
+        Logger.log("shown")
+    Logger.log("after")
+    assert sink.messages == ["shown", "after"]
+
+
+def test_memory_sink_maxlen(sink):
+    sink.maxlen = 2
+    for k in range(5):
+        Logger.log("{}", k)
+    assert sink.messages == ["3", "4"]
+
+
+def test_file_sinks_are_buffered(tmp_path, monkeypatch):
+    text_path, json_path = tmp_path / "log.txt", tmp_path / "log.jsonl"
+    text, lines = FileSink(text_path, buffer_size=3), JsonLinesSink(json_path, buffer_size=100)
+    monkeypatch.setattr(Logger, "SINKS", [text, lines])
+    monkeypatch.setattr(Logger, "ENABLE", True)
+
+    Logger.log("one")
+    Logger.log("two")
+    assert text_path.read_text(encoding="utf-8") == ""
+    Logger.warning("three")
+    assert text_path.read_text(encoding="utf-8").splitlines() == ["one", "two", "three"]
+
+    Logger.remove_sink(lines)
+    records = [json.loads(line) for line in json_path.read_text(encoding="utf-8").splitlines()]
+    assert [(record["level"], record["message"]) for record in records] == [
+        ("INFO", "one"), ("INFO", "two"), ("WARNING", "three")]
+    text.close()
+
+
+def test_assertion_is_printed_even_if_logging_is_disabled(sink, capsys):
+    Logger.ENABLE = False
+    assert Logger.assertion(True, "not shown") is True
+    assert Logger.assertion(False, "x={}", 1) is False
+    assert "AssertionError: x=1" in capsys.readouterr().out
+    assert sink.records == []
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from utils.utils import hessian
+from utils.benchmarks import rosenbrock, rosenbrock_gradient
+from methods.GradientDescent import GradientDescent, NewtonGradientDescent
+
+
+def fn(x1, x2, x3):
+    return x1**2 * x2 + 3*x2**2 + x1*x3 + np.exp(x3)
+
+
+def exact_hessian(point):
+    x1, x2, x3 = point
+    return np.array([[2*x2, 2*x1, 1], [2*x1, 6, 0], [1, 0, np.exp(x3)]])
+
+
+def test_hessian_is_symmetric_and_accurate():
+    point = np.array([0.5, -1.0, 0.3])
+    H = hessian(fn, point)
+    assert np.array_equal(H, H.T)
+    assert np.allclose(H, exact_hessian(point), atol=10**-6)
+
+
+def test_hessian_of_vectorized_fn():
+    point = np.array([0.5, -1.0, 0.3])
+    assert np.array_equal(hessian(lambda x: fn(*x), point, vectorized=True), hessian(fn, point))
+
+
+def test_one_iteration_on_quadratic():
+    A = np.array([[4.0, 1.0], [1.0, 3.0]])
+    b = np.array([1.0, 2.0])
+    f = lambda x1, x2: 0.5 * np.array([x1, x2]) @ A @ np.array([x1, x2]) - b @ np.array([x1, x2])
+    gd = GradientDescent(f, np.array([5.0, -7.0]), grad=lambda x: A @ x - b, hessian=lambda x: A,
+                         modification="newton", one_dim_method="armijo", criteria_eps=10**-9).start()
+    assert type(gd) is NewtonGradientDescent
+    assert gd.iterations == 1
+    assert np.allclose(gd.x, np.linalg.solve(A, b))
+
+
+@pytest.mark.parametrize("reuse", [1, 3])
+def test_hessian_reuse(reuse):
+    gd = GradientDescent(rosenbrock, np.array([-1.2, 1.0]), grad=rosenbrock_gradient, modification="newton",
+                         hessian_reuse=reuse, one_dim_method="armijo", criteria_eps=10**-8).start()
+    assert np.allclose(gd.x, [1, 1], atol=10**-6)
+    # direction is found in the last point too (it is recorded in history)
+    assert gd.stats.total("hessian") == -(-(gd.iterations + 1) // reuse)    # ceil
+
+
+def test_modified_cholesky_of_indefinite_hessian():
+    H = np.array([[1.0, 0.0], [0.0, -2.0]])
+    L, tau = NewtonGradientDescent.factorize(NewtonGradientDescent, H)
+    assert tau > 2
+    assert np.allclose(L @ L.T, H + tau * np.eye(2))
+
+
+def test_saddle_point_is_left_along_descent_direction():
+    f = lambda x1, x2: x1**2 - x2**2 + x2**4
+    gd = GradientDescent(f, np.array([1.0, 0.1]), modification="newton", criteria_eps=10**-6).start()
+    assert np.allclose(gd.x, [0, 1 / np.sqrt(2)], atol=10**-3)
+
+
+def test_hessian_should_be_callable():
+    with pytest.raises(TypeError):
+        GradientDescent(fn, np.zeros(3), modification="newton", hessian=np.eye(3))
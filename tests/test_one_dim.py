@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pytest
+
+from methods.GoldenSection import GoldenSection
+from methods.DSKPowell import DSKPowell
+from methods.FastGoldenSection import FastGoldenSection
+from methods.Brent import Brent
+from methods.GradientDescent import GradientDescent
+
+
+def parabola(x):
+    return (x - 1.234)**2 + 0.5
+
+
+def counted(fn):
+    def wrapper(x):
+        wrapper.calls += 1
+        return fn(x)
+    wrapper.calls = 0
+    return wrapper
+
+
+@pytest.mark.parametrize("method", [GoldenSection, DSKPowell, FastGoldenSection, Brent])
+def test_minimum_of_parabola(method):
+    assert method(parabola, -3, 5, eps=10**-6).x == pytest.approx(1.234, abs=10**-5)
+
+
+@pytest.mark.parametrize("method", [FastGoldenSection, Brent])
+def test_minimum_of_not_smooth_function(method):
+    assert method(lambda x: abs(x - 0.3) + math.sqrt(abs(x - 0.3)), -1, 2, eps=10**-6).x == pytest.approx(0.3, abs=10**-5)
+
+
+def test_fast_golden_section_makes_one_evaluation_per_iteration():
+    f = counted(parabola)
+    search = FastGoldenSection(f, -3, 5, eps=10**-6)
+    assert search.evaluations == f.calls == search.iterations + 1
+    assert search.iterations <= GoldenSection(parabola, -3, 5, eps=10**-6).iterations
+
+
+def test_brent_is_exact_on_parabola():
+    f = counted(parabola)
+    Brent(f, -3, 5, eps=10**-6)
+    assert f.calls < 15
+
+
+@pytest.mark.parametrize("one_dim_method", ["fast_golden_section", "brent"])
+def test_gradient_descent_with_new_engines(one_dim_method):
+    fn = lambda x1, x2: 4*x1**2 + x1*x2 + x2**2
+    result = GradientDescent(fn, np.array([6.0, 4.0]), one_dim_method=one_dim_method, one_dim_eps=10**-6).start()
+    assert np.allclose(result.x, [0, 0], atol=10**-3)
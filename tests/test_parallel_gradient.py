@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from utils.utils import gradient
+from utils.ParallelGradient import ParallelGradient
+from methods.GradientDescent import GradientDescent
+
+
+# objectives are on module level: they are sent to the worker processes
+
+def fn(*x):
+    return sum((i + 1) * xi**2 for i, xi in enumerate(x)) + x[0] * x[-1]
+
+
+def vectorized_fn(x):
+    return fn(*x)
+
+
+def failing_fn(*x):
+    raise RuntimeError("objective failed")
+
+
+POINT = np.array([1.0, -2.0, 0.5, 3.0, -1.5])
+
+
+@pytest.mark.parametrize("mode", ParallelGradient.MODES)
+def test_the_same_as_serial_gradient(mode):
+    with ParallelGradient(fn, mode=mode, max_workers=2) as grad:
+        parallel = grad(POINT)
+    assert np.allclose(parallel, gradient(fn, POINT, mode=mode), rtol=10**-9, atol=10**-9)
+
+
+def test_vectorized_fn():
+    with ParallelGradient(vectorized_fn, max_workers=2, vectorized=True) as grad:
+        assert np.allclose(grad(POINT), gradient(fn, POINT), rtol=10**-9, atol=10**-9)
+
+
+def test_pool_is_kept_between_calls_and_recreated_for_new_dimension():
+    with ParallelGradient(fn, max_workers=2) as grad:
+        grad(POINT)
+        buffer = grad.points
+        grad(POINT + 1)
+        assert grad.points is buffer and grad.calls == 2
+
+        assert np.allclose(grad(POINT[:3]), gradient(fn, POINT[:3]), rtol=10**-9, atol=10**-9)
+        assert grad.points.shape == (4, 3)
+    assert grad.points is None
+
+
+def test_error_of_worker_is_raised():
+    with ParallelGradient(failing_fn, max_workers=2) as grad:
+        with pytest.raises(RuntimeError, match="objective failed"):
+            grad(POINT)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        ParallelGradient(fn, mode="complex")
+
+
+def test_gradient_descent_with_parallel_gradient():
+    with ParallelGradient(fn, max_workers=2) as grad:
+        optimizer = GradientDescent(fn, POINT, grad=grad, criteria_eps=10**-4).start()
+        reference = GradientDescent(fn, POINT, criteria_eps=10**-4).start()
+        assert grad.calls == optimizer.iterations + 1
+    assert optimizer.iterations == reference.iterations
+    assert np.allclose(optimizer.x, reference.x, atol=10**-9)
@@ -0,0 +1,102 @@
+import json
+import threading
+
+import numpy as np
+
+from utils.Stats import Stats, broadcast_points, json_exporter
+from utils.sweep import sweep
+from methods.GradientDescent import GradientDescent
+from methods.BatchGradientDescent import BatchGradientDescent
+
+
+def fn(x1, x2):
+    return 4*x1**2 + x1*x2 + x2**2
+
+
+def test_calls_are_counted_in_the_innermost_phase():
+    stats = Stats()
+    f = stats.counted(lambda x: x**2, "fn")
+    f(1.0)
+    with stats.phase("sven"):
+        f(1.0)
+        with stats.phase("one_dim"):
+            f(2.0)
+    assert stats.calls == {"main": {"fn": 1}, "sven": {"fn": 1}, "one_dim": {"fn": 1}}
+    assert stats.total("fn") == 3
+    assert stats.times["sven"] >= stats.times["one_dim"]
+
+
+def test_broadcast_calls_count_points():
+    assert broadcast_points(1.0, 2.0) == 1
+    assert broadcast_points(np.zeros(5), np.zeros(5)) == 5
+    assert broadcast_points(np.zeros((3, 4)), 1.0) == 12
+
+    stats = Stats()
+    f = stats.counted(fn, "fn", broadcast_points)
+    f(np.zeros(7), np.ones(7))
+    f(1.0, 2.0)
+    assert stats.total("fn") == 8
+    assert stats.total("fn_calls") == 2
+
+
+def test_failed_call_is_not_counted():
+    stats = Stats()
+
+    def broken(x1, x2):
+        raise TypeError("no arrays")
+
+    f = stats.counted(broken, "fn", broadcast_points)
+    try:
+        f(np.zeros(3), np.zeros(3))
+    except TypeError:
+        pass
+    assert stats.total("fn") == 0
+
+
+def test_count_is_thread_safe():
+    stats = Stats()
+    f = stats.counted(lambda: None, "fn")
+    threads = [threading.Thread(target=lambda: [f() for _ in range(10000)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stats.total("fn") == 40000
+
+
+def objective_points(optimizer_fn, run):
+    """ points evaluated by the user's function during `run` """
+    points = []
+
+    def recorded(x1, x2):
+        points.append(np.size(x1))
+        return optimizer_fn(x1, x2)
+
+    return run(recorded), sum(points)
+
+
+def test_gradient_descent_counts_every_point():
+    optimizer, points = objective_points(fn, lambda f: GradientDescent(f, np.array([6.0, 4.0]), step=0.1).start())
+    assert optimizer.stats.total("fn") == points
+    assert optimizer.stats.total("fn_calls") < points
+
+
+def test_batch_gradient_descent_counts_every_point():
+    starts = np.random.default_rng(1).uniform(-3, 3, (10, 2))
+    optimizer, points = objective_points(fn, lambda f: BatchGradientDescent(f, starts).start())
+    assert optimizer.stats.total("fn") == points
+    assert optimizer.stats.total("grad") == optimizer.iterations.sum() + len(starts)
+
+
+def test_sweep_reports_points():
+    row = sweep(fn, np.array([6.0, 4.0]), [{"step": 0.1}], max_workers=1)[0]
+    # one f(x) and n = 2 shifted points per iteration
+    assert row["evaluations"] == 3 * (row["iterations"] + 1)
+
+
+def test_json_exporter(tmp_path):
+    path = tmp_path / "stats.json"
+    GradientDescent(fn, np.array([6.0, 4.0]), stats_hook=json_exporter(path)).start()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["totals"]["fn"] > data["totals"]["fn_calls"] > 0
+    assert set(data["times"]) >= {"run", "gradient", "sven", "one_dim"}
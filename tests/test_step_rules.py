@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from utils.benchmarks import make_quadratic, rosenbrock, rosenbrock_gradient
+from methods.GradientDescent import (GradientDescent, OptimalGradientDescent, HeavyBallGradientDescent,
+                                     NesterovGradientDescent, BarzilaiBorweinGradientDescent)
+
+
+START = np.array([1.0, -2.0, 3.0, -4.0])
+fn, grad = make_quadratic(100, len(START))
+
+
+def test_factory():
+    classes = {"heavy_ball": HeavyBallGradientDescent, "nesterov": NesterovGradientDescent,
+               "barzilai_borwein": BarzilaiBorweinGradientDescent}
+    for modification, cls in classes.items():
+        assert type(GradientDescent(fn, START, grad=grad, modification=modification)) is cls
+
+
+@pytest.mark.parametrize("modification", ["nesterov", "barzilai_borwein"])
+def test_one_evaluation_per_iteration_without_line_search(modification):
+    gd = GradientDescent(fn, START, step=0.001, grad=grad, modification=modification, criteria_eps=10**-6).start()
+    steepest = GradientDescent(fn, START, grad=grad, criteria_eps=10**-6).start()
+    assert np.allclose(gd.x, 0, atol=10**-5)
+    assert gd.stats.total("fn") < steepest.stats.total("fn") / 5
+    # rejected points are evaluated too
+    assert gd.stats.total("fn") == gd.stats.total("grad") <= 2 * (gd.iterations + 1)
+    assert gd.stats.total("line_search") == 0
+
+
+@pytest.mark.parametrize("modification", ["nesterov", "barzilai_borwein"])
+def test_rosenbrock(modification):
+    gd = GradientDescent(rosenbrock, np.array([-1.2, 1.0]), step=0.0001, grad=rosenbrock_gradient,
+                         modification=modification, criteria_eps=10**-4).start()
+    assert gd.iterations < gd.MAX_ITERATIONS
+    assert np.allclose(gd.x, [1, 1], atol=10**-3)
+
+
+@pytest.mark.parametrize("modification", ["nesterov", "barzilai_borwein"])
+def test_start_at_the_minimum(modification):
+    shifted = lambda x1, x2: (x1 - 1)**2 + (x2 + 2)**2
+    shifted_grad = lambda point: 2 * (point - [1, -2])
+    # criteria 0 does not stop on the first iteration, so the first step is taken with ∇f(x_0) = 0
+    gd = GradientDescent(shifted, np.array([1.0, -2.0]), grad=shifted_grad, modification=modification,
+                         criteria=0).start()
+    assert gd.iterations == 1
+    assert np.array_equal(gd.x, [1, -2])
+
+
+def test_barzilai_borwein_variants():
+    for variant in (1, 2):
+        gd = GradientDescent(fn, START, step=0.001, grad=grad, modification="barzilai_borwein", bb_variant=variant,
+                             criteria_eps=10**-6).start()
+        assert np.allclose(gd.x, 0, atol=10**-5)
+    with pytest.raises(ValueError):
+        GradientDescent(fn, START, grad=grad, modification="barzilai_borwein", bb_variant=3)
+
+
+def test_heavy_ball_without_momentum_is_steepest_descent():
+    heavy_ball = GradientDescent(fn, START, grad=grad, modification="heavy_ball", delta=0.0, criteria_eps=10**-6).start()
+    steepest = GradientDescent(fn, START, grad=grad, criteria_eps=10**-6).start()
+    assert heavy_ball.iterations == steepest.iterations
+    assert np.array_equal(heavy_ball.x, steepest.x)
+
+
+def test_heavy_ball_momentum_speeds_up_steepest_descent():
+    heavy_ball = GradientDescent(fn, START, grad=grad, modification="heavy_ball", criteria_eps=10**-6).start()
+    steepest = GradientDescent(fn, START, grad=grad, criteria_eps=10**-6).start()
+    assert isinstance(heavy_ball, OptimalGradientDescent)
+    assert np.allclose(heavy_ball.x, 0, atol=10**-5)
+    assert heavy_ball.iterations < steepest.iterations / 2
+
+
+def test_heavy_ball_step():
+    gd = GradientDescent(fn, START, grad=grad, modification="heavy_ball", delta=0.5)
+    (x0, _), (x1, step), (x2, _) = [(it.x.copy(), it.step) for it, _ in zip(gd.iterate(), range(3))]
+    # x_2 = x_1 + step * direction + delta * (x_1 - x_0)
+    assert np.allclose(x2, x1 - step * grad(x1) + 0.5 * (x1 - x0))
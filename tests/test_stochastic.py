@@ -0,0 +1,120 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from utils.BatchStream import BatchStream
+from methods.GradientDescent import GradientDescent, StochasticGradientDescent
+
+
+TRUE_X = np.array([2.0, -1.0, 0.5])
+
+
+def make_dataset(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n, len(TRUE_X)))
+    return np.column_stack([features, features @ TRUE_X + 0.01 * rng.normal(size=n)])
+
+
+def loss(x, batch):
+    return np.mean((batch[:, :-1] @ x - batch[:, -1])**2)
+
+
+def loss_gradient(x, batch):
+    residuals = batch[:, :-1] @ x - batch[:, -1]
+    return 2 * batch[:, :-1].T @ residuals / len(batch)
+
+
+DATASET = make_dataset()
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_epoch_covers_every_record_once(prefetch):
+    stream = BatchStream(np.arange(100.0)[:, None], batch_size=32, seed=1, prefetch=prefetch)
+    batches = list(stream.epoch(0))
+    assert [len(batch) for batch in batches] == [32, 32, 32, 4]
+    assert sorted(np.concatenate(batches)[:, 0]) == list(range(100))
+
+
+def test_order_depends_only_on_seed_and_epoch():
+    data = np.arange(50.0)[:, None]
+    stream = BatchStream(data, batch_size=10, seed=1)
+    first = [batch.copy() for batch in stream.epoch(3)]
+    list(stream.epoch(0))
+    list(stream.epoch(1))
+    assert all(np.array_equal(a, b) for a, b in zip(first, stream.epoch(3)))
+    assert all(np.array_equal(a, b) for a, b in zip(first, BatchStream(data, batch_size=10, seed=1).epoch(3)))
+    assert not all(np.array_equal(a, b) for a, b in zip(first, stream.epoch(4)))
+
+
+def test_without_shuffle_batches_are_slices():
+    stream = BatchStream(np.arange(10.0)[:, None], batch_size=4, shuffle=False)
+    assert [list(batch[:, 0]) for batch in stream.epoch(0)] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_memory_mapped_npy(tmp_path):
+    path = str(tmp_path / "data.npy")
+    np.save(path, DATASET)
+    stream = BatchStream(path, batch_size=100, seed=0)
+    assert isinstance(stream.dataset, np.memmap)
+    in_memory = BatchStream(DATASET, batch_size=100, seed=0)
+    assert np.array_equal(np.concatenate(list(stream.epoch(0))), np.concatenate(list(in_memory.epoch(0))))
+
+
+def test_callable_and_iterable_datasets():
+    calls = []
+
+    def batches(epoch):
+        calls.append(epoch)
+        yield from np.array_split(DATASET, 4)
+
+    assert len(list(BatchStream(batches).epoch(5))) == 4 and calls == [5]
+    assert len(list(BatchStream(np.array_split(DATASET, 3)).epoch(0))) == 3
+
+
+def test_error_of_reading_thread_is_raised():
+    def batches(epoch):
+        yield DATASET[:10]
+        raise OSError("disk is gone")
+
+    with pytest.raises(OSError, match="disk is gone"):
+        list(BatchStream(batches, prefetch=1).epoch(0))
+
+
+@pytest.mark.parametrize("grad", [loss_gradient, None, "autodiff"])
+def test_converges_to_least_squares(grad):
+    gd = GradientDescent(loss, np.zeros(3), step=0.05, grad=grad, dataset=DATASET, batch_size=50, seed=0,
+                         criteria=0, criteria_eps=10**-6, epochs=50).start()
+    assert type(gd) is StochasticGradientDescent
+    assert np.allclose(gd.x, TRUE_X, atol=10**-2)
+    assert gd.batch_steps == 20 * (gd.iterations + 1)
+    if grad is loss_gradient:
+        assert gd.stats.total("fn") == gd.stats.total("grad") == gd.batch_steps
+
+
+@pytest.mark.parametrize("seed", [0, None])
+def test_resume_gives_the_same_result(tmp_path, seed):
+    params = dict(step=0.05, grad=loss_gradient, dataset=DATASET, batch_size=64, seed=seed, epochs=12,
+                  criteria_eps=10**-12, step_decay=0.9)
+    path = str(tmp_path / "sgd.npz")
+
+    crashed = GradientDescent(loss, np.zeros(3), checkpoint_path=path, checkpoint_every=4, **params)
+    for _ in itertools.islice(crashed.iterate(), 6):
+        pass
+    resumed = GradientDescent(loss, np.zeros(3), checkpoint_path=path, checkpoint_every=4, resume=True, **params)
+    resumed.start()
+    # seed=None draws a new random seed, but the checkpoint keeps the seed of the crashed run
+    assert resumed.batches.seed == crashed.batches.seed
+    reference = GradientDescent(loss, np.zeros(3), **params)
+    reference.batches.seed = crashed.batches.seed
+    reference.start()
+
+    assert resumed.iterations == reference.iterations == 12
+    assert resumed.batch_steps == reference.batch_steps
+    assert np.array_equal(resumed.x, reference.x)
+    assert np.array_equal(resumed.history.fxs, reference.history.fxs)
+
+
+def test_cache_is_not_supported():
+    with pytest.raises(ValueError):
+        GradientDescent(loss, np.zeros(3), dataset=DATASET, cache=True)
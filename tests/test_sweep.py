@@ -0,0 +1,38 @@
+import numpy as np
+
+from utils.sweep import make_grid, sweep
+from methods.GradientDescent import GradientDescent
+
+
+def fn(x1, x2):
+    return 4*x1**2 + x1*x2 + x2**2
+
+
+START_POINT = np.array([6.0, 4.0])
+GRID = {"one_dim_method": ["golden_section", "dsk_powell"], "criteria_eps": [10**-2, 10**-4]}
+
+
+def test_make_grid_order():
+    assert make_grid(GRID) == [
+        {"one_dim_method": "golden_section", "criteria_eps": 10**-2},
+        {"one_dim_method": "golden_section", "criteria_eps": 10**-4},
+        {"one_dim_method": "dsk_powell", "criteria_eps": 10**-2},
+        {"one_dim_method": "dsk_powell", "criteria_eps": 10**-4},
+    ]
+    assert make_grid([{"step": 0.1}]) == [{"step": 0.1}]
+
+
+def test_sweep_in_this_process_matches_direct_runs():
+    results = sweep(fn, START_POINT, GRID, max_workers=1, criteria=1)
+    for row, params in zip(results, make_grid(GRID)):
+        direct = GradientDescent(fn, START_POINT, criteria=1, **params).start()
+        assert row["iterations"] == direct.iterations
+        assert row["evaluations"] == direct.stats.total("fn")
+        assert np.array_equal(row["x"], direct.history.current.x)
+
+
+def test_process_pool_gives_the_same_results():
+    local = sweep(fn, START_POINT, GRID, max_workers=1)
+    pooled = sweep(fn, START_POINT, GRID, max_workers=2)
+    for name in ("iterations", "evaluations", "x", "fx"):
+        assert np.array_equal(local[name], pooled[name])
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from utils.Logger import Logger, MemorySink
+from utils.utils import format_vector, evaluate_points, hessian
+from methods.GradientDescent import GradientDescent
+
+
+COEFFICIENTS = np.linspace(1, 10, 50)
+
+
+def vector_fn(x):
+    return COEFFICIENTS @ x**2 + np.sum(np.cos(x), axis=0)     # x may be (n, m) for positional_fn
+
+
+def positional_fn(*x):
+    return vector_fn(np.array(x))
+
+
+START = np.linspace(-1, 1, len(COEFFICIENTS))
+
+
+class Points:
+    """ vector fn which keeps the ids of arrays it gets """
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.ids = set()
+
+    def __call__(self, x):
+        assert x.ndim == 1
+        self.ids.add(id(x))
+        return self.fn(x)
+
+
+@pytest.mark.parametrize("params", [{}, {"modification": "lbfgs"}, {"modification": "newton"}])
+def test_the_same_result_as_positional_fn(params):
+    vectorized = GradientDescent(vector_fn, START, vectorized=True, **params).start()
+    positional = GradientDescent(positional_fn, START, **params).start()
+    # finite differences of one fn in two calling conventions differ by rounding only
+    assert vectorized.iterations == positional.iterations
+    assert np.allclose(vectorized.x, positional.x, atol=10**-4)
+
+
+def test_line_search_reuses_one_buffer():
+    fn = Points(vector_fn)
+    gd = GradientDescent(fn, START, vectorized=True, grad=lambda x: 2 * COEFFICIENTS * x - np.sin(x)).start()
+    assert gd.stats.total("fn") > 3 * gd.iterations
+    # the points of iterations and one work buffer of trial points
+    assert id(gd._trial) in fn.ids
+
+
+def test_evaluate_points_and_hessian_of_vector_fn():
+    points = np.vstack([START, -START, START / 2])
+    assert np.array_equal(evaluate_points(vector_fn, points, vectorized=True), [vector_fn(p) for p in points])
+    point = START[:4]
+    fn = lambda x: x[0]**2 * x[1] + x[2] * x[3]**3
+    assert np.array_equal(hessian(fn, point, vectorized=True), hessian(lambda *x: fn(np.array(x)), point))
+
+
+def test_report_of_long_vector(monkeypatch):
+    sink = MemorySink()
+    monkeypatch.setattr(Logger, "SINKS", [sink])
+    monkeypatch.setattr(Logger, "ENABLE", True)
+    monkeypatch.setattr(Logger, "LEVEL", Logger.INFO)
+
+    GradientDescent(vector_fn, START, vectorized=True).start()
+    found = [message for message in sink.messages if message.startswith("---> found x=")]
+    assert len(found) == 1 and "..." in found[0]
+    assert format_vector(np.arange(3.0), precision=1) == "[0.0, 1.0, 2.0]"
+    assert format_vector(np.arange(10.0), precision=1) == "[0.0, 1.0, 2.0, ..., 7.0, 8.0, 9.0]"
+
+
+def test_history_of_vectors():
+    gd = GradientDescent(vector_fn, START, vectorized=True).start()
+    assert gd.history.xs.shape == (gd.iterations + 1, len(START))
+    assert np.array_equal(gd.history.xs[-1], gd.x)
@@ -0,0 +1,67 @@
+import asyncio
+import inspect
+
+
+class AsyncEvaluator:
+    """
+        Calls objective that may be `async def` (or a plain function),
+        with a limit of concurrent calls and a timeout for every call.
+
+        >>> evaluate = AsyncEvaluator(simulation, max_concurrency=8, timeout=5.0)
+        >>> fx = await evaluate(1.0, 2.0)
+        >>> values = await evaluate.map([(1.0, 2.0), (1.5, 2.0), (1.0, 2.5)])   # concurrently
+
+        If one call of `map` fails (or the caller is cancelled), the other calls are cancelled too.
+    """
+
+    def __init__(self, fn, max_concurrency=None, timeout=None):
+        """
+            :param max_concurrency: max count of calls at the same time, None - no limit
+            :param timeout: seconds for one call, None - wait forever (asyncio.TimeoutError is raised)
+        """
+        if isinstance(fn, AsyncEvaluator):
+            fn = fn.fn
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency should be positive, got {max_concurrency}")
+        self.fn = fn
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.evaluations = 0
+        self.__semaphore = None
+
+    @property
+    def semaphore(self):
+        # created lazily: it should belong to the running event loop
+        if self.__semaphore is None and self.max_concurrency is not None:
+            self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.__semaphore
+
+    async def __call(self, *args):
+        self.evaluations += 1
+        result = self.fn(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def __call__(self, *args):
+        if self.semaphore is None:
+            return await asyncio.wait_for(self.__call(*args), self.timeout)
+        async with self.semaphore:
+            return await asyncio.wait_for(self.__call(*args), self.timeout)
+
+    async def map(self, calls):
+        """ :param calls: list of args tuples
+            :return: list of results in the same order
+        """
+        tasks = [asyncio.ensure_future(self(*args)) for args in calls]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def __str__(self):
+        return f"<AsyncEvaluator evaluations={self.evaluations}, " \
+               f"max_concurrency={self.max_concurrency}, timeout={self.timeout}>"
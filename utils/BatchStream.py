@@ -0,0 +1,99 @@
+import queue
+import threading
+
+import numpy as np
+
+
+class BatchStream:
+    """
+        Mini-batches of a dataset for stochastic methods, every epoch is read by a background thread
+        which keeps up to `prefetch` batches ready.
+
+        dataset may be:
+            * path to `.npy` file - it is memory-mapped, only rows of the current batches are read;
+            * np.ndarray (rows are records);
+            * function `epoch -> iterable of batches` (e.g. a generator function), called once per epoch;
+            * iterable of batches, it is iterated again every epoch (a generator gives only one epoch).
+
+        >>> stream = BatchStream("data.npy", batch_size=256, seed=1)
+        >>> for batch in stream.epoch(0):
+        ...     pass
+    """
+
+    _END = object()
+
+    def __init__(self, dataset, batch_size=32, shuffle=True, seed=None, prefetch=2):
+        """ :param shuffle: shuffle records of array datasets every epoch (rows of a batch are read in file order)
+            :param seed: order of records in epoch k depends only on (seed, k), so a resumed run reads the same batches
+        """
+        if isinstance(dataset, str):
+            dataset = np.load(dataset, mmap_mode="r")
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        # random seed is drawn once: it is kept in checkpoints of the method
+        self.seed = int(np.random.SeedSequence(seed).generate_state(1, np.uint64)[0])
+
+    @property
+    def is_array(self):
+        return isinstance(self.dataset, np.ndarray)
+
+    def _batches(self, epoch):
+        if self.is_array is False:
+            yield from self.dataset(epoch) if callable(self.dataset) else self.dataset
+            return
+
+        n = len(self.dataset)
+        order = np.random.default_rng([self.seed, epoch]).permutation(n) if self.shuffle is True else np.arange(n)
+        for start in range(0, n, self.batch_size):
+            idx = order[start:start + self.batch_size]
+            # sorted indices read the memory-mapped file forward
+            yield self.dataset[np.sort(idx)] if self.shuffle is True else self.dataset[idx[0]:idx[-1] + 1]
+
+    def _produce(self, epoch, buffer, stop):
+        try:
+            for batch in self._batches(epoch):
+                while stop.is_set() is False:
+                    try:
+                        buffer.put(batch, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            item = self._END
+        except BaseException as e:
+            item = e
+        while stop.is_set() is False:
+            try:
+                buffer.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def epoch(self, epoch=0):
+        """ :return: generator of batches of the epoch, the reading thread stops when the generator is closed """
+        if self.prefetch == 0:
+            yield from self._batches(epoch)
+            return
+
+        buffer = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        thread = threading.Thread(target=self._produce, args=(epoch, buffer, stop), daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is self._END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+
+    def __str__(self):
+        source = f"array {self.dataset.shape}" if self.is_array else type(self.dataset).__name__
+        return f"<BatchStream {source}, batch_size={self.batch_size}, shuffle={self.shuffle}, prefetch={self.prefetch}>"
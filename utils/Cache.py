@@ -0,0 +1,67 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EvaluationCache:
+    """
+        Memoizes calls of the function by exact values of the arguments.
+        Keeps only last `maxsize` points (LRU eviction).
+
+        >>> f = EvaluationCache(lambda x1, x2: x1**2 + x2**2, maxsize=128)
+        >>> f(1.0, 2.0), f(1.0, 2.0)
+        >>> f.hits, f.misses
+        (1, 1)
+    """
+
+    DEFAULT_MAXSIZE = 1024
+
+    def __init__(self, fn, maxsize=None):
+        self.fn = fn
+        self.maxsize = maxsize or self.DEFAULT_MAXSIZE
+
+        self.hits = 0
+        self.misses = 0
+        self.__values = OrderedDict()
+
+    @staticmethod
+    def make_key(args):
+        key = []
+        for arg in args:
+            if isinstance(arg, np.ndarray):
+                key.append((arg.dtype.str, arg.shape, arg.tobytes()))
+            else:
+                key.append(arg)
+        return tuple(key)
+
+    def __call__(self, *args):
+        key = self.make_key(args)
+
+        if key in self.__values:
+            self.hits += 1
+            self.__values.move_to_end(key)
+            return self.__values[key]
+
+        self.misses += 1
+        value = self.fn(*args)
+        self.__values[key] = value
+        if len(self.__values) > self.maxsize:
+            self.__values.popitem(last=False)
+        return value
+
+    @property
+    def hit_rate(self):
+        calls = self.hits + self.misses
+        if calls == 0:
+            return 0.0
+        return self.hits / calls
+
+    def clear(self):
+        """ drops stored values, but keeps hits/misses statistics """
+        self.__values.clear()
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __str__(self):
+        return f"<EvaluationCache hits={self.hits} misses={self.misses} size={len(self)}/{self.maxsize}>"
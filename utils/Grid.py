@@ -0,0 +1,203 @@
+import os
+import pickle
+import hashlib
+import inspect
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils.Logger import Logger
+from utils.utils import evaluate_points
+
+
+# worker state, it is set once per process by `_init_worker`
+_worker = {}
+
+
+def _init_worker(fn, path, xs, ys):
+    Logger.ENABLE = False
+    Logger.ASSERTION_EXIT = False
+    _worker.update(fn=fn, z=np.load(path, mmap_mode="r+"), xs=xs, ys=ys)
+
+
+def _fill_tile(fn, xs, ys, z, rows, columns):
+    xgrid, ygrid = np.meshgrid(xs[columns], ys[rows])
+    values = evaluate_points(fn, np.column_stack([xgrid.ravel(), ygrid.ravel()]))
+    z[rows, columns] = values.reshape(xgrid.shape)
+
+
+def _run_tile(rows, columns):
+    _fill_tile(_worker["fn"], _worker["xs"], _worker["ys"], _worker["z"], rows, columns)
+    _worker["z"].flush()
+
+
+def _code_key(code, names):
+    """ bytecode and constants of code and of nested functions, `names` gets the global names they use """
+    names.update(code.co_names)
+    consts = [_code_key(const, names) if hasattr(const, "co_code") else repr(const) for const in code.co_consts]
+    return code.co_code.hex() + repr(consts)
+
+
+def _value_key(value, seen):
+    """ digest of a value fn depends on, None if it can't be serialized """
+    if inspect.ismodule(value):
+        return f"module:{value.__name__}"
+    if hasattr(value, "__code__"):
+        return objective_key(value, seen)
+    if isinstance(value, np.ndarray):
+        return hashlib.sha1(repr((value.dtype.str, value.shape)).encode() + value.tobytes()).hexdigest()
+    try:
+        return hashlib.sha1(pickle.dumps(value)).hexdigest()
+    except Exception:
+        return None
+
+
+def _is_code(value):
+    """ global of fn which is a part of its code: a function or a module """
+    return inspect.ismodule(value) or hasattr(value, "__code__")
+
+
+def objective_key(fn, seen=None):
+    """ identity of fn for the disk cache:
+        qualified name, bytecode, defaults, values of closure cells, functions and modules used by fn as globals
+        (if fn is a python function), pickled fn otherwise. None - fn depends on something that can't be serialized,
+        it should not be cached.
+        Other globals (constants, counters of calls) are not in the key: pass `cache_key` to `Grid` if they change fn
+    """
+    name = f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', type(fn).__name__)}"
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        value = _value_key(fn, seen)
+        return None if value is None else f"{name}:{value}"
+
+    seen = set() if seen is None else seen
+    if id(fn) in seen:
+        return name     # recursion
+    seen.add(id(fn))
+
+    names = set()
+    parts = [_code_key(code, names)]
+    kwdefaults = getattr(fn, "__kwdefaults__", None) or {}
+    fn_globals = getattr(fn, "__globals__", {})
+    dependencies = [*(getattr(fn, "__defaults__", None) or ()),
+                    *(kwdefaults[key] for key in sorted(kwdefaults)),
+                    *(cell.cell_contents for cell in getattr(fn, "__closure__", None) or ()),
+                    *(fn_globals[key] for key in sorted(names) if key in fn_globals and _is_code(fn_globals[key]))]
+    if hasattr(fn, "__self__"):
+        dependencies.append(fn.__self__)    # bound method
+    for value in dependencies:
+        digest = _value_key(value, seen)
+        if digest is None:
+            return None
+        parts.append(digest)
+    return f"{name}:{hashlib.sha1(repr(parts).encode()).hexdigest()}"
+
+
+class Grid:
+    """
+        Values of fn(x, y) on a regular grid, evaluated tile by tile into a memory-mapped `.npy` file,
+        so only one tile is in RAM at a time.
+
+        Iterating gives (xgrid, ygrid, z) like `np.meshgrid` + fn, but xgrid and ygrid are `np.broadcast_to`
+        views of 1-d axes and z is `np.memmap`, so it may be passed as is to `contour(*grid)` and `plot_surface(*grid)`.
+
+        >>> grid = Grid(fn, (-4, 6), (-4, 6), 0.001, max_workers=4, cache_dir="cache")
+        >>> fig, axes = contour(grid)
+
+        With `cache_dir` the finished grid is kept in `cache_dir/<key>.npy`,
+        key depends on fn (see `objective_key`), bounds and step, so the next run just maps the file.
+        If fn uses values which can't be pickled, it is not cached: pass your own `cache_key` then,
+        as well as when fn depends on global variables (their values are not in the key).
+    """
+
+    TILE = 512
+
+    def __init__(self, fn, x_bounds, y_bounds, step, tile=TILE, max_workers=1, cache_dir=None, cache_key=None):
+        """
+            :param x_bounds: (start, stop) as in np.arange
+            :param tile: size of the square tile (points per side)
+            :param max_workers: processes to evaluate tiles, 1 - in this process (fn should be picklable otherwise)
+            :param cache_dir: directory for finished grids, None - temporary file removed with the object
+            :param cache_key: str - identity of fn in the cache instead of `objective_key(fn)`,
+                              it should change with everything fn depends on
+        """
+        self.path = None
+        self._temporary = False
+        self.fn = fn
+        self.xs = np.arange(*x_bounds, step)
+        self.ys = np.arange(*y_bounds, step)
+        self.shape = (len(self.ys), len(self.xs))
+        self.tile = tile
+        self.max_workers = max_workers
+        self.cached = False
+        self.z = None
+
+        fn_key = objective_key(fn) if cache_key is None else f"key:{cache_key}"
+        if cache_dir is not None and fn_key is None:
+            Logger.warning("! fn can't be identified for the cache (pass `cache_key`), grid is not cached !")
+            cache_dir = None
+        key = hashlib.sha1(repr((fn_key, tuple(x_bounds), tuple(y_bounds), step)).encode()).hexdigest()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.path = os.path.join(cache_dir, f"{key}.npy")
+            self._temporary = False
+        else:
+            fd, self.path = tempfile.mkstemp(suffix=".npy", prefix="grid_")
+            os.close(fd)
+            self._temporary = True
+
+        if self._temporary is False and os.path.exists(self.path):
+            self.cached = True
+        else:
+            self._evaluate()
+        self.z = np.load(self.path, mmap_mode="r")
+
+    def tiles(self):
+        """ :return: list of (rows, columns) slices """
+        return [(slice(r, min(r + self.tile, self.shape[0])), slice(c, min(c + self.tile, self.shape[1])))
+                for r in range(0, self.shape[0], self.tile)
+                for c in range(0, self.shape[1], self.tile)]
+
+    def _evaluate(self):
+        # finished file appears only after all tiles are written, so a broken run never leaves a cache entry
+        tmp_path = f"{self.path}.tmp.npy"
+        z = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=float, shape=self.shape)
+        tiles = self.tiles()
+
+        if self.max_workers == 1:
+            for rows, columns in tiles:
+                _fill_tile(self.fn, self.xs, self.ys, z, rows, columns)
+            z.flush()
+            del z
+        else:
+            z.flush()
+            del z
+            initargs = (self.fn, tmp_path, self.xs, self.ys)
+            with ProcessPoolExecutor(self.max_workers, initializer=_init_worker, initargs=initargs) as pool:
+                for future in [pool.submit(_run_tile, rows, columns) for rows, columns in tiles]:
+                    future.result()
+
+        os.replace(tmp_path, self.path)
+
+    @property
+    def xgrid(self):
+        return np.broadcast_to(self.xs, self.shape)
+
+    @property
+    def ygrid(self):
+        return np.broadcast_to(self.ys[:, None], self.shape)
+
+    def __iter__(self):
+        return iter((self.xgrid, self.ygrid, self.z))
+
+    def close(self):
+        self.z = None
+        if self._temporary is True and self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __del__(self):
+        self.close()
+
+    def __str__(self):
+        return f"<Grid {self.shape[0]}x{self.shape[1]}, tile={self.tile}, cached={self.cached}, path={self.path}>"
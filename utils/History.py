@@ -1,58 +1,197 @@
+import numpy as np
+
+
 class History:
+    """
+        Stores iterations in preallocated numpy buffers (i, x, f(x), direction, ||∇f(x)||).
+        Buffers grow twice when they are full.
+
+        maxlen=k - ring buffer mode: only last k iterations are kept.
+
+        Units returned by `current`, `last` and indexing are views into the buffers,
+        columns (`xs`, `fxs`, ...) are views too (except a ring buffer that has wrapped).
+    """
+
     class IterUnit:
-        def __init__(self, i, x, fx, direction):
+        def __init__(self, i, x, fx, direction, gx_norm=None):
             self.i = i
             self.x = x
             self.fx = fx
             self.direction = direction
+            self.gx_norm = gx_norm
 
         def __repr__(self):
             return f"<i={self.i}: x={self.x}, f(x)={self.fx:.10f}>"
 
-    def __init__(self):
-        self.__values = []
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, maxlen=None):
+        """ :param maxlen: how many last iterations to keep, None - keep all """
+        if maxlen is not None and maxlen < 1:
+            raise ValueError(f"maxlen should be positive, got {maxlen}")
+        self.maxlen = maxlen
+        self.clear()
+
+    def clear(self):
+        self.__size = 0
+        self.__start = 0    # index of the oldest record in buffers
+        self.__i = None
+        self.__x = None
+        self.__fx = None
+        self.__direction = None
+        self.__gx_norm = None
+
+    # buffers
+
+    @property
+    def capacity(self):
+        if self.__i is None:
+            return 0
+        return len(self.__i)
+
+    def __allocate(self, capacity, n):
+        self.__i = np.zeros(capacity, dtype=int)
+        self.__x = np.zeros((capacity, n))
+        self.__fx = np.zeros(capacity)
+        self.__direction = np.zeros((capacity, n))
+        self.__gx_norm = np.full(capacity, np.nan)
+
+    def __grow(self):
+        size, n = self.__size, self.__x.shape[1]
+        i, x, fx, direction, gx_norm = self.__columns()
+        self.__allocate(self.capacity * 2, n)
+        self.__i[:size], self.__x[:size], self.__fx[:size] = i, x, fx
+        self.__direction[:size], self.__gx_norm[:size] = direction, gx_norm
+        self.__start = 0
+
+    def __index(self, k):
+        """ buffer index of the k-th record """
+        if k < 0:
+            k += self.__size
+        if not 0 <= k < self.__size:
+            raise IndexError("History index out of range")
+        return (self.__start + k) % self.capacity
+
+    def __unit(self, idx):
+        return History.IterUnit(int(self.__i[idx]), self.__x[idx], float(self.__fx[idx]),
+                                self.__direction[idx], float(self.__gx_norm[idx]))
+
+    def __column(self, buffer):
+        end = self.__start + self.__size
+        if end <= self.capacity:
+            return buffer[self.__start:end]
+        return np.concatenate([buffer[self.__start:], buffer[:end - self.capacity]])
+
+    def __columns(self):
+        return tuple(self.__column(buffer)
+                     for buffer in (self.__i, self.__x, self.__fx, self.__direction, self.__gx_norm))
+
+    # records
 
     @property
     def current(self):
-        if len(self.__values) == 0:
+        if self.__size == 0:
             return None
-        return self.__values[-1]
+        return self.__unit(self.__index(-1))
 
     @property
     def last(self):
-        if len(self.__values) < 2:
+        if self.__size < 2:
             return None
-        return self.__values[-2]
+        return self.__unit(self.__index(-2))
 
-    def append(self, i, x, fx, direction):
-        iter_unit = History.IterUnit(i, x, fx, direction)
-        self.__values.append(iter_unit)
+    def append(self, i, x, fx, direction, gx_norm=np.nan):
+        if self.__i is None:
+            self.__allocate(self.maxlen or self.INITIAL_CAPACITY, len(x))
 
-    def clear(self):
-        self.__values = []
+        if self.__size == self.maxlen:
+            # ring buffer is full: overwrite the oldest record
+            self.__start = (self.__start + 1) % self.capacity
+            self.__size -= 1
+        elif self.__size == self.capacity:
+            self.__grow()
+
+        idx = (self.__start + self.__size) % self.capacity
+        self.__size += 1
+        self.__set(idx, i, x, fx, direction, gx_norm)
+
+    def __set(self, idx, i, x, fx, direction, gx_norm=np.nan):
+        self.__i[idx] = i
+        self.__x[idx] = x
+        self.__fx[idx] = fx
+        self.__direction[idx] = direction
+        self.__gx_norm[idx] = np.nan if gx_norm is None else gx_norm
 
     def items(self):
-        return self.__values
+        return [self.__unit(self.__index(k)) for k in range(self.__size)]
 
     def pop(self):
-        iter_unit = self.__values.pop()
+        idx = self.__index(-1)
+        iter_unit = self.__unit(idx)
+        # slot will be reused by the next append
+        iter_unit.x, iter_unit.direction = iter_unit.x.copy(), iter_unit.direction.copy()
+        self.__size -= 1
         return iter_unit
 
+    # columns
+
+    @property
+    def iterations(self):
+        return self.__column(self.__i) if self.__size else np.zeros(0, dtype=int)
+
+    @property
+    def xs(self):
+        return self.__column(self.__x) if self.__size else np.zeros((0, 0))
+
+    @property
+    def fxs(self):
+        return self.__column(self.__fx) if self.__size else np.zeros(0)
+
+    @property
+    def directions(self):
+        return self.__column(self.__direction) if self.__size else np.zeros((0, 0))
+
+    @property
+    def grad_norms(self):
+        return self.__column(self.__gx_norm) if self.__size else np.zeros(0)
+
+    def arrays(self):
+        """ :return: dict of columns i, x, fx, direction, gx_norm """
+        return {"i": self.iterations, "x": self.xs, "fx": self.fxs,
+                "direction": self.directions, "gx_norm": self.grad_norms}
+
+    def save(self, path):
+        """ exports records to `.npz` file with arrays i, x, fx, direction, gx_norm """
+        np.savez(path, **self.arrays())
+
+    @classmethod
+    def from_arrays(cls, arrays, maxlen=None):
+        """ :param arrays: dict (or loaded `.npz`) with columns i, x, fx, direction, gx_norm """
+        history = cls(maxlen)
+        for row in zip(arrays["i"], arrays["x"], arrays["fx"], arrays["direction"], arrays["gx_norm"]):
+            history.append(int(row[0]), *row[1:])
+        return history
+
+    @classmethod
+    def load(cls, path, maxlen=None):
+        """ imports records saved by `save` """
+        with np.load(path) as arrays:
+            return cls.from_arrays(arrays, maxlen)
+
     def __str__(self):
-        return f"<History [{len(self.__values)} records]>"
+        return f"<History [{self.__size} records]>"
 
     def __len__(self):
-        return len(self.__values)
+        return self.__size
 
     def __getitem__(self, i):
-        return self.__values[i]
+        if isinstance(i, slice):
+            return [self.__unit(self.__index(k)) for k in range(*i.indices(self.__size))]
+        return self.__unit(self.__index(i))
 
     def __setitem__(self, i, value):
         if isinstance(value, (list, tuple)) is False:
-            raise TypeError("Value must be list or tuple and has 3 items: i, x, fx, direction")
-        if len(value) != 4:
-            raise ValueError("You should input 3 values: i, x, fx, direction")
-        iter_unit = History.IterUnit(*value)
-        self.__values[i] = iter_unit
-
-
+            raise TypeError("Value must be list or tuple and has 4 items: i, x, fx, direction")
+        if len(value) not in (4, 5):
+            raise ValueError("You should input 4 values: i, x, fx, direction (and optionally ||∇f(x)||)")
+        self.__set(self.__index(i), *value)
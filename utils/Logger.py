@@ -1,10 +1,137 @@
+import sys
+import json
+import time
+import atexit
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class Record:
+    """ Log record, message is formatted only when some sink asks for it """
+
+    def __init__(self, level, depth, msg, args=(), new_line=False):
+        self.level = level
+        self.depth = depth
+        self.time = time.time()
+        self.new_line = new_line
+        self.__msg = msg
+        self.__args = args
+        self.__message = None
+
+    @property
+    def message(self):
+        if self.__message is None:
+            self.__message = self.__msg.format(*self.__args) if self.__args else str(self.__msg)
+        return self.__message
+
+    def text(self):
+        """ message with indent of the current depth """
+        _new_line = "\n" if self.new_line else ""
+        return _new_line + " "*self.depth*3 + self.message
+
+    def as_dict(self):
+        return {"time": self.time, "level": Logger.LEVEL_NAMES.get(self.level, self.level),
+                "depth": self.depth, "message": self.message}
+
+
+# sinks:
+
+
+class ConsoleSink:
+    """ prints records to the stream (stdout by default) """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, record):
+        print(record.text(), file=self.stream or sys.stdout)
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+    def close(self):
+        self.flush()
+
+
+class MemorySink:
+    """ keeps records in memory, `messages` formats them """
+
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+        if self.maxlen is not None and len(self.records) > self.maxlen:
+            del self.records[0]
+
+    @property
+    def messages(self):
+        return [record.message for record in self.records]
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FileSink:
+    """ writes text of records to the file, lines are buffered and written by `buffer_size` """
+
+    def __init__(self, path, buffer_size=1000, mode="a"):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.__file = open(path, mode, encoding="utf-8")
+        self.__buffer = []
+
+    def format(self, record):
+        return record.text()
+
+    def write(self, record):
+        self.__buffer.append(self.format(record))
+        if len(self.__buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.__file.closed:
+            return
+        if self.__buffer:
+            self.__file.write("\n".join(self.__buffer) + "\n")
+            self.__buffer = []
+        self.__file.flush()
+
+    def close(self):
+        self.flush()
+        self.__file.close()
+
+
+class JsonLinesSink(FileSink):
+    """ writes records to the file as json lines: {"time", "level", "depth", "message"} """
+
+    def format(self, record):
+        return json.dumps(record.as_dict(), ensure_ascii=False, default=str)
+
+
 class Logger:
     ENABLE = True
     ASSERTION_EXIT = True
 
     WIDTH = 100
     FILLCHAR = "="
-    CURRENT_DEPTH = 0
+
+    DEBUG = 10      # tables of iterations
+    INFO = 20       # titles and results
+    WARNING = 30
+    ERROR = 40
+    LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+    LEVEL = DEBUG   # records with lower level are skipped
+
+    SINKS = [ConsoleSink()]
+
+    # depth of nested `with Logger(...)` blocks and `suppressed` blocks, separate for every thread and asyncio task
+    _depth = ContextVar("logger_depth", default=0)
+    _suppressed = ContextVar("logger_suppressed", default=False)
 
     class Colors:
         FAIL = '\033[91m'
@@ -12,31 +139,51 @@ class Logger:
 
     def __init__(self, msg):
         self.msg = msg
+        self.__token = None
 
     def __enter__(self):
-        if self.ENABLE is False:
-            return
-        print(" "*Logger.CURRENT_DEPTH*3 + f" {self.msg} ".center(self.WIDTH, self.FILLCHAR))
-        Logger.CURRENT_DEPTH += 1
+        self._emit(self.INFO, " {} ".format(self.msg).center(self.WIDTH, self.FILLCHAR))
+        self.__token = Logger._depth.set(Logger._depth.get() + 1)
 
     def __exit__(self, *args):
-        if self.ENABLE is False:
-            return
-        Logger.CURRENT_DEPTH -= 1
-        print(" "*Logger.CURRENT_DEPTH*3 + self.FILLCHAR*self.WIDTH)
+        Logger._depth.reset(self.__token)
+        self._emit(self.INFO, self.FILLCHAR*self.WIDTH)
+
+    @classmethod
+    def depth(cls):
+        return cls._depth.get()
 
     @classmethod
-    def log(cls, msg, new_line=False):
-        if cls.ENABLE is False:
+    def is_enabled(cls, level=DEBUG):
+        return cls.ENABLE is True and cls._suppressed.get() is False and level >= cls.LEVEL and len(cls.SINKS) != 0
+
+    @classmethod
+    def _emit(cls, level, msg, args=(), new_line=False):
+        if cls.is_enabled(level) is False:
             return
-        _new_line = "\n" if new_line else ""
-        print(_new_line + " "*Logger.CURRENT_DEPTH*3 + f"{msg}")
+        record = Record(level, cls._depth.get(), msg, args, new_line)
+        for sink in cls.SINKS:
+            sink.write(record)
+
+    @classmethod
+    def log(cls, msg, *args, new_line=False, level=INFO):
+        """ :param args: if set - `msg` is a pattern, it is formatted with args only if the record is written """
+        cls._emit(level, msg, args, new_line)
 
     @classmethod
-    def assertion(cls, expression, msg):
+    def debug(cls, msg, *args, new_line=False):
+        cls._emit(cls.DEBUG, msg, args, new_line)
+
+    @classmethod
+    def warning(cls, msg, *args, new_line=False):
+        cls._emit(cls.WARNING, msg, args, new_line)
+
+    @classmethod
+    def assertion(cls, expression, msg, *args):
         if expression is True:
             return True     # OK
-        f_msg = " "*Logger.CURRENT_DEPTH*3 + f"{Logger.Colors.FAIL}AssertionError: {msg}{Logger.Colors.ENDC}"
+        msg = msg.format(*args) if args else msg
+        f_msg = " "*cls._depth.get()*3 + f"{Logger.Colors.FAIL}AssertionError: {msg}{Logger.Colors.ENDC}"
         if cls.ASSERTION_EXIT is True:
             input(f_msg)
             exit()
@@ -48,3 +195,35 @@ class Logger:
     def setEnable(cls, state):
         cls.ENABLE = bool(state)
 
+    @classmethod
+    @contextmanager
+    def suppressed(cls, state=True):
+        """ disables logging inside the block if state is True,
+            only for the current thread or asyncio task (`ENABLE` is not changed)
+        """
+        if state is not True:
+            yield
+            return
+        token = cls._suppressed.set(True)
+        try:
+            yield
+        finally:
+            cls._suppressed.reset(token)
+
+    @classmethod
+    def add_sink(cls, sink):
+        cls.SINKS.append(sink)
+        return sink
+
+    @classmethod
+    def remove_sink(cls, sink):
+        cls.SINKS.remove(sink)
+        sink.close()
+
+    @classmethod
+    def flush(cls):
+        for sink in cls.SINKS:
+            sink.flush()
+
+
+atexit.register(Logger.flush)
@@ -0,0 +1,134 @@
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from utils.Logger import Logger
+from utils.utils import evaluate_points
+
+
+# worker state, it is set once per process by `_init_worker`
+_worker = {}
+
+
+def _init_worker(fn, vectorized, points_name, values_name, shape):
+    Logger.ENABLE = False
+    Logger.ASSERTION_EXIT = False
+    points_shm = shared_memory.SharedMemory(name=points_name)
+    values_shm = shared_memory.SharedMemory(name=values_name)
+    _worker.update(
+        fn=fn,
+        vectorized=vectorized,
+        shm=(points_shm, values_shm),   # keep references, arrays below are views of these buffers
+        points=np.ndarray(shape, dtype=float, buffer=points_shm.buf),
+        values=np.ndarray(shape[0], dtype=float, buffer=values_shm.buf),
+    )
+
+
+def _evaluate(start, stop):
+    """ evaluates rows start:stop of shared points into shared values """
+    _worker["values"][start:stop] = evaluate_points(_worker["fn"], _worker["points"][start:stop], _worker["vectorized"])
+
+
+def _release(executor, segments):
+    executor.shutdown(wait=True, cancel_futures=True)
+    for shm in segments:
+        shm.close()
+        shm.unlink()
+
+
+class ParallelGradient:
+    """
+        Numeric gradient (see `utils.utils.gradient`) with perturbed points evaluated in a process pool.
+
+        The pool and two shared memory buffers (points and values) live as long as the object,
+        so every call only writes points into the buffer and sends (start, stop) slices to workers.
+        Use it for CPU-heavy objectives, for cheap fn the overhead of the pool is bigger than the gain.
+
+        >>> with ParallelGradient(fn, max_workers=4) as grad:
+        ...     optimizer = GradientDescent(fn, start_point, grad=grad).start()
+
+        fn should be picklable (defined on module level).
+    """
+
+    MODES = ("forward", "central")
+
+    def __init__(self, fn, h=0.00001, mode="forward", max_workers=None, vectorized=False):
+        """ :param vectorized: fn takes one np.ndarray `fn(x)` instead of `fn(x1, ..., xn)` """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown gradient mode {mode!r}, use one of {self.MODES}")
+        self.fn = fn
+        self.h = h
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count()
+        self.vectorized = vectorized
+        self.calls = 0
+
+        self.points = None      # (m, n) view of shared memory
+        self.values = None      # (m,) view of shared memory
+        self.__executor = None
+        self.__finalizer = None
+
+    def _points_count(self, n):
+        return n + 1 if self.mode == "forward" else 2 * n
+
+    def _setup(self, n):
+        """ creates shared buffers and the pool for dimension n (once, or again if dimension changes) """
+        self.close()
+        shape = (self._points_count(n), n)
+        points_shm = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1] * 8)
+        values_shm = shared_memory.SharedMemory(create=True, size=shape[0] * 8)
+        self.points = np.ndarray(shape, dtype=float, buffer=points_shm.buf)
+        self.values = np.ndarray(shape[0], dtype=float, buffer=values_shm.buf)
+
+        self.__executor = ProcessPoolExecutor(
+            min(self.max_workers, shape[0]), initializer=_init_worker,
+            initargs=(self.fn, self.vectorized, points_shm.name, values_shm.name, shape),
+        )
+        self.__finalizer = weakref.finalize(self, _release, self.__executor, (points_shm, values_shm))
+
+    def __call__(self, point):
+        point = np.asarray(point, dtype=float)
+        n = len(point)
+        if self.points is None or self.points.shape[1] != n:
+            self._setup(n)
+        self.calls += 1
+
+        h = self.h
+        steps = np.eye(n) * h
+        if self.mode == "forward":
+            self.points[0] = point
+            np.add(point, steps, out=self.points[1:])
+        else:
+            np.add(point, steps, out=self.points[:n])
+            np.subtract(point, steps, out=self.points[n:])
+
+        m = len(self.points)
+        bounds = np.linspace(0, m, min(self.max_workers, m) + 1).astype(int)
+        futures = [self.__executor.submit(_evaluate, start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+
+        values = self.values
+        if self.mode == "forward":
+            return (values[1:] - values[0]) / h
+        return (values[:n] - values[n:]) / (2*h)
+
+    def close(self):
+        """ stops the pool and frees shared memory """
+        self.points = self.values = None    # views should be released before shared memory is closed
+        if self.__finalizer is not None:
+            self.__finalizer()
+        self.__finalizer = None
+        self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __str__(self):
+        return f"<ParallelGradient mode={self.mode}, max_workers={self.max_workers}, calls={self.calls}>"
@@ -0,0 +1,105 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+
+def broadcast_points(*args):
+    """ count of points in a call `fn(x1, ..., xn)` with broadcast arrays, e.g. n+1 points of a numeric gradient """
+    return int(np.prod(np.broadcast_shapes(*(np.shape(arg) for arg in args))))
+
+
+def single_point(*args, **kwargs):
+    """ every call evaluates one point, e.g. `fn(x: np.ndarray)` """
+    return 1
+
+
+class Stats:
+    """
+        Counters of calls and wall time for every phase of the solver run.
+
+        >>> stats = Stats()
+        >>> f = stats.counted(lambda x: x**2, "fn")
+        >>> with stats.phase("sven"):
+        ...     f(1.0)
+        >>> stats.calls
+        {'sven': {'fn': 1}}
+
+        Phases may be nested, call is counted in the innermost one, time of phase includes nested phases.
+
+        One call of an objective may evaluate many points, `counted(fn, "fn", broadcast_points)`
+        counts points as "fn" and calls as "fn_calls".
+    """
+
+    MAIN_PHASE = "main"
+
+    def __init__(self):
+        self.calls = {}     # {phase: {kind: count}}
+        self.times = {}     # {phase: seconds}
+        self.__phases = []
+        self.__lock = threading.Lock()   # counted functions may be called from several threads
+
+    @property
+    def current_phase(self):
+        if len(self.__phases) == 0:
+            return self.MAIN_PHASE
+        return self.__phases[-1]
+
+    @contextmanager
+    def phase(self, name):
+        self.__phases.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] = self.times.get(name, 0.0) + time.perf_counter() - start
+            self.__phases.pop()
+
+    def count(self, kind, n=1):
+        with self.__lock:
+            counters = self.calls.setdefault(self.current_phase, {})
+            counters[kind] = counters.get(kind, 0) + n
+
+    def counted(self, fn, kind, points=None):
+        """ :param points: function of the call arguments -> count of points evaluated by the call
+                           (`broadcast_points`, `single_point`), then calls are counted as `{kind}_calls`
+            :return: fn that counts its calls (or points) as `kind`, a call which raised is not counted
+        """
+        def wrapper(*args, **kwargs):
+            value = fn(*args, **kwargs)
+            if points is None:
+                self.count(kind)
+            else:
+                self.count(kind, points(*args, **kwargs))
+                self.count(f"{kind}_calls")
+            return value
+        return wrapper
+
+    def total(self, kind):
+        return sum(counters.get(kind, 0) for counters in self.calls.values())
+
+    def as_dict(self):
+        kinds = sorted({kind for counters in self.calls.values() for kind in counters})
+        return {
+            "calls": self.calls,
+            "times": self.times,
+            "totals": {kind: self.total(kind) for kind in kinds},
+        }
+
+    def to_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+    def __str__(self):
+        totals = ", ".join(f"{kind}={count}" for kind, count in self.as_dict()["totals"].items())
+        times = ", ".join(f"{phase}={seconds:.4f}s" for phase, seconds in self.times.items())
+        return f"<Stats calls: {totals}; time: {times}>"
+
+
+def json_exporter(path):
+    """ hook for `stats_hook` param of solvers, writes stats of the run to json file """
+    def hook(stats):
+        stats.to_json(path)
+    return hook
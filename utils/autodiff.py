@@ -0,0 +1,206 @@
+""" Forward-mode automatic differentiation with dual numbers
+
+    x = a + b*ε,  ε^2 = 0  ->  f(a + b*ε) = f(a) + f'(a)*b*ε
+
+    `d` may be a vector: every input carries its own unit seed, so all partials are found in one pass.
+
+    fn may use + - * / ** abs, comparisons and numpy functions (np.exp, np.sin, np.sqrt, ... see `_UNARY`),
+    also on arrays of duals (`vectorized` fn). `math` functions and float() would drop the derivative,
+    so they raise TypeError.
+"""
+
+
+import math
+
+import numpy as np
+
+
+class Dual:
+    __slots__ = ("v", "d")
+
+    def __init__(self, v, d=0.0):
+        """ :param v: value
+            :param d: derivative (float or np.ndarray of partials)
+        """
+        self.v = v
+        self.d = d
+
+    @staticmethod
+    def lift(other):
+        if isinstance(other, Dual):
+            return other
+        return Dual(other, 0.0)
+
+    # arithmetic
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v + other.v, self.d + other.d)
+        return Dual(self.v + other, self.d)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v - other.v, self.d - other.d)
+        return Dual(self.v - other, self.d)
+
+    def __rsub__(self, other):
+        return Dual(other - self.v, -self.d)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v * other.v, self.d * other.v + self.v * other.d)
+        return Dual(self.v * other, self.d * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.v / other.v, (self.d * other.v - self.v * other.d) / other.v**2)
+        return Dual(self.v / other, self.d / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.v, -other * self.d / self.v**2)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            # a^b = exp(b * ln(a))
+            v = self.v ** other.v
+            return Dual(v, v * (other.d * math.log(self.v) + other.v * self.d / self.v))
+        if other == 0:
+            return Dual(1.0, self.d * 0.0)
+        return Dual(self.v ** other, other * self.v ** (other - 1) * self.d)
+
+    def __rpow__(self, other):
+        v = other ** self.v
+        return Dual(v, v * math.log(other) * self.d)
+
+    def __neg__(self):
+        return Dual(-self.v, -self.d)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(abs(self.v), self.d * (1.0 if self.v >= 0 else -1.0))
+
+    # comparisons use values (for branches in objectives)
+
+    def __eq__(self, other):
+        return self.v == Dual.lift(other).v
+
+    def __ne__(self, other):
+        return self.v != Dual.lift(other).v
+
+    def __lt__(self, other):
+        return self.v < Dual.lift(other).v
+
+    def __le__(self, other):
+        return self.v <= Dual.lift(other).v
+
+    def __gt__(self, other):
+        return self.v > Dual.lift(other).v
+
+    def __ge__(self, other):
+        return self.v >= Dual.lift(other).v
+
+    __hash__ = None
+
+    def __float__(self):
+        raise TypeError("Dual can't be converted to float, the derivative would be lost: "
+                        "use numpy functions (np.sin, np.exp, ...) instead of math, don't call float() in fn")
+
+    def __repr__(self):
+        return f"Dual({self.v}, {self.d})"
+
+    # numpy functions: np.sin(x), np.float64(2) * x, ...
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in _BINARY:
+            a, b = inputs
+            return _BINARY[ufunc](a if isinstance(a, Dual) else float(a), b)
+        if ufunc in _UNARY:
+            x = inputs[0]
+            fn, derivative = _UNARY[ufunc]
+            return Dual(fn(x.v), derivative(x.v) * x.d)
+        return NotImplemented
+
+    def _unary(self, ufunc):
+        fn, derivative = _UNARY[ufunc]
+        return Dual(fn(self.v), derivative(self.v) * self.d)
+
+
+def _binary(a, b, op):
+    if isinstance(a, Dual):
+        return op(a, b)
+    return op(Dual.lift(a), b)
+
+
+_BINARY = {
+    np.add: lambda a, b: _binary(a, b, Dual.__add__),
+    np.subtract: lambda a, b: _binary(a, b, Dual.__sub__),
+    np.multiply: lambda a, b: _binary(a, b, Dual.__mul__),
+    np.true_divide: lambda a, b: _binary(a, b, Dual.__truediv__),
+    np.power: lambda a, b: _binary(a, b, Dual.__pow__),
+}
+
+_UNARY = {
+    np.negative: (lambda v: -v, lambda v: -1.0),
+    np.absolute: (abs, lambda v: 1.0 if v >= 0 else -1.0),
+    np.square: (lambda v: v*v, lambda v: 2*v),
+    np.sqrt: (math.sqrt, lambda v: 0.5 / math.sqrt(v)),
+    np.exp: (math.exp, math.exp),
+    np.log: (math.log, lambda v: 1.0 / v),
+    np.sin: (math.sin, math.cos),
+    np.cos: (math.cos, lambda v: -math.sin(v)),
+    np.tan: (math.tan, lambda v: 1.0 / math.cos(v)**2),
+    np.arctan: (math.atan, lambda v: 1.0 / (1.0 + v*v)),
+    np.tanh: (math.tanh, lambda v: 1.0 - math.tanh(v)**2),
+}
+
+# numpy calls methods with the names of ufuncs for arrays of objects: np.exp(array of Dual) -> Dual.exp
+for _ufunc in _UNARY:
+    if hasattr(Dual, _ufunc.__name__) is False:
+        setattr(Dual, _ufunc.__name__, lambda self, _ufunc=_ufunc: self._unary(_ufunc))
+
+
+def _result(y):
+    """ Dual returned by fn, 0-d and one-element object arrays (e.g. `x @ x` of a vectorized fn) are unpacked """
+    if isinstance(y, np.ndarray) and y.dtype == object and y.size == 1:
+        y = y.item()
+    if isinstance(y, Dual) is False:
+        raise TypeError(f"fn returned {type(y).__name__} instead of Dual, the derivative is lost: "
+                        "fn should compute the result from its arguments with numpy functions, without float()")
+    return y
+
+
+def autodiff_gradient(fn, point, multi_seed=True, vectorized=False):
+    """ exact gradient of fn(x1, ..., xn) in the point with dual numbers
+
+        :param multi_seed: True - all partials in one call of fn (vector derivatives),
+                           False - one call of fn for every partial (scalar derivatives)
+        :param vectorized: fn takes one array `fn(x)`, it gets np.ndarray of `Dual` (dtype=object)
+        :type point: np.ndarray
+    """
+    point = np.asarray(point, dtype=float)
+    n = len(point)
+
+    def call(duals):
+        if vectorized is True:
+            array = np.empty(n, dtype=object)
+            array[:] = duals
+            return fn(array)
+        return fn(*duals)
+
+    if multi_seed is True:
+        seeds = np.eye(n)
+        y = _result(call([Dual(point[i], seeds[i]) for i in range(n)]))
+        return np.asarray(y.d, dtype=float) * np.ones(n)
+
+    partials = np.zeros(n)
+    for i in range(n):
+        partials[i] = _result(call([Dual(point[j], 1.0 if j == i else 0.0) for j in range(n)])).d
+    return partials
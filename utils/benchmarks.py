@@ -0,0 +1,271 @@
+""" Benchmark of all gradient descent methods on standard test functions
+
+    python -m utils.benchmarks --output bench.json
+    python -m utils.benchmarks --output bench_new.json --baseline bench.json
+"""
+
+
+import json
+import time
+import argparse
+
+import numpy as np
+
+from utils.Logger import Logger
+from methods.GradientDescent import GradientDescent, OptimalGradientDescent
+
+
+class Problem:
+    """ test function with known minima """
+
+    def __init__(self, name, fn, start_point, minima, grad=None):
+        """ :param minima: list of points of global minima (distance is measured to the nearest one)
+            :param grad: exact gradient, function of np.ndarray - without it methods are compared
+                         with the error of the numeric gradient
+        """
+        self.name = name
+        self.fn = fn
+        self.start_point = np.asarray(start_point, dtype=float)
+        self.minima = np.atleast_2d(np.asarray(minima, dtype=float))
+        self.grad = grad
+
+    @property
+    def dimension(self):
+        return len(self.start_point)
+
+    def distance(self, x):
+        return float(np.min(np.linalg.norm(self.minima - x, axis=1)))
+
+    def __repr__(self):
+        return f"<Problem {self.name} (n={self.dimension})>"
+
+
+# test functions:
+
+
+def quartic(x1, x2):
+    return (10 * (x1 - x2) ** 2 + (x1 - 1) ** 2) ** 4
+
+
+def quartic_gradient(x):
+    x1, x2 = x
+    u = 10 * (x1 - x2) ** 2 + (x1 - 1) ** 2
+    return 4 * u**3 * np.array([20 * (x1 - x2) + 2 * (x1 - 1), -20 * (x1 - x2)])
+
+
+def rosenbrock(*x):
+    return sum(100 * (x[i+1] - x[i]**2)**2 + (1 - x[i])**2 for i in range(len(x) - 1))
+
+
+def rosenbrock_gradient(x):
+    result = np.zeros(len(x))
+    residual = x[1:] - x[:-1]**2
+    result[:-1] = -400 * x[:-1] * residual - 2 * (1 - x[:-1])
+    result[1:] += 200 * residual
+    return result
+
+
+def beale(x1, x2):
+    return (1.5 - x1 + x1*x2)**2 + (2.25 - x1 + x1*x2**2)**2 + (2.625 - x1 + x1*x2**3)**2
+
+
+def beale_gradient(x):
+    x1, x2 = x
+    t1, t2, t3 = 1.5 - x1 + x1*x2, 2.25 - x1 + x1*x2**2, 2.625 - x1 + x1*x2**3
+    return np.array([2*t1*(x2 - 1) + 2*t2*(x2**2 - 1) + 2*t3*(x2**3 - 1),
+                     2*t1*x1 + 4*t2*x1*x2 + 6*t3*x1*x2**2])
+
+
+def himmelblau(x1, x2):
+    return (x1**2 + x2 - 11)**2 + (x1 + x2**2 - 7)**2
+
+
+def himmelblau_gradient(x):
+    x1, x2 = x
+    t1, t2 = x1**2 + x2 - 11, x1 + x2**2 - 7
+    return np.array([4*x1*t1 + 2*t2, 2*t1 + 4*x2*t2])
+
+
+def make_quadratic(condition, n=2):
+    """ f(x) = sum(c_i * x_i^2), c_i from 1 to `condition`
+        :return: f, its gradient
+    """
+    coefficients = np.logspace(0, np.log10(condition), n)
+
+    def quadratic(*x):
+        return sum(c * xi**2 for c, xi in zip(coefficients, x))
+
+    def quadratic_gradient(x):
+        return 2 * coefficients * x
+    return quadratic, quadratic_gradient
+
+
+def make_problems(dimensions=(5, 10)):
+    quadratic_c100, quadratic_c100_gradient = make_quadratic(100)
+    quadratic_c1000, quadratic_c1000_gradient = make_quadratic(1000)
+    problems = [
+        Problem("quartic", quartic, [-1.2, 0.0], [1.0, 1.0], quartic_gradient),
+        Problem("rosenbrock", rosenbrock, [-1.2, 1.0], [1.0, 1.0], rosenbrock_gradient),
+        Problem("beale", beale, [1.0, 1.0], [3.0, 0.5], beale_gradient),
+        # x = 0 would give zero heuristic step of Sven
+        Problem("himmelblau", himmelblau, [1.0, 1.0],
+                [[3.0, 2.0], [-2.805118, 3.131312], [-3.779310, -3.283186], [3.584428, -1.848126]],
+                himmelblau_gradient),
+        Problem("quadratic_c100", quadratic_c100, [1.0, 1.0], [0.0, 0.0], quadratic_c100_gradient),
+        Problem("quadratic_c1000", quadratic_c1000, [1.0, 1.0], [0.0, 0.0], quadratic_c1000_gradient),
+    ]
+    for n in dimensions:
+        problems.append(Problem(f"rosenbrock_{n}d", rosenbrock, [-1.2, 1.0] * (n // 2) + [-1.2] * (n % 2), np.ones(n),
+                                rosenbrock_gradient))
+        quadratic, quadratic_gradient = make_quadratic(100, n)
+        problems.append(Problem(f"quadratic_{n}d", quadratic, np.ones(n), np.zeros(n), quadratic_gradient))
+    return problems
+
+
+# methods:
+
+
+def make_methods(const_step=0.1):
+    """ :return: list of (name, params) for every class reachable with `GradientDescent`,
+                 only methods with a line search are crossed with every one-dim method
+    """
+    methods = [("const", {"step": const_step})]
+    modifications = [None] + list(GradientDescent.MODIFICATIONS)
+    for modification in modifications:
+        if modification is not None and issubclass(GradientDescent.MODIFICATIONS[modification],
+                                                   OptimalGradientDescent) is False:
+            methods.append((modification, {"modification": modification}))
+            continue
+        for one_dim_method in GradientDescent.ONE_DIM_METHODS:
+            params = {"one_dim_method": one_dim_method}
+            if modification is not None:
+                params["modification"] = modification
+            methods.append((f"{modification or 'optimal'}/{one_dim_method}", params))
+    return methods
+
+
+# harness:
+
+
+def run_one(problem, params, max_iterations=None, **common):
+    params = dict(common, **params)
+    if problem.grad is not None:
+        params.setdefault("grad", problem.grad)
+
+    record = {"problem": problem.name, "dimension": problem.dimension}
+    start = time.perf_counter()
+    try:
+        with np.errstate(all="ignore"):
+            solver = GradientDescent(problem.fn, problem.start_point, **params)
+            if max_iterations is not None:
+                solver.MAX_ITERATIONS = max_iterations
+            solver.start()
+    except Exception as e:
+        record.update(error=f"{type(e).__name__}: {e}", time=time.perf_counter() - start)
+        return record
+
+    x = solver.x if solver.x is not None else solver.history.current.x
+    record.update(
+        iterations=solver.iterations,
+        fn_evaluations=solver.stats.total("fn"),
+        grad_evaluations=solver.stats.total("grad"),
+        time=time.perf_counter() - start,
+        fx=float(solver.history.current.fx),
+        distance=problem.distance(x),
+        max_iterations_reached=solver.iterations >= solver.MAX_ITERATIONS,
+    )
+    return record
+
+
+def run_benchmarks(problems=None, methods=None, max_iterations=None, **common):
+    """ :param common: params for all runs (criteria, criteria_eps, one_dim_eps, ...)
+        :return: list of records, one for every pair problem x method
+    """
+    problems = problems or make_problems()
+    methods = methods or make_methods()
+    common.setdefault("criteria", 1)
+    common.setdefault("criteria_eps", 10**-4)
+
+    results = []
+    with Logger.suppressed():
+        for problem in problems:
+            for name, params in methods:
+                record = run_one(problem, params, max_iterations, **common)
+                record["method"] = name
+                results.append(record)
+    return results
+
+
+def save(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, default=float)
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results, baseline, tolerance=0.1):
+    """ compares records with the same problem and method
+
+        :param tolerance: relative change of iterations/evaluations/time which is reported
+        :return: list of (problem, method, field, old, new)
+    """
+    key = lambda record: (record["problem"], record["method"])
+    old_records = {key(record): record for record in baseline}
+
+    changes = []
+    for record in results:
+        old = old_records.get(key(record))
+        if old is None:
+            changes.append((*key(record), "new", None, None))
+            continue
+        if ("error" in record) != ("error" in old):
+            changes.append((*key(record), "error", old.get("error"), record.get("error")))
+            continue
+        for field in ["iterations", "fn_evaluations", "grad_evaluations", "time"]:
+            if field not in record or field not in old:
+                continue
+            a, b = old[field], record[field]
+            if abs(b - a) > tolerance * max(abs(a), 1e-12):
+                changes.append((*key(record), field, a, b))
+        if "distance" in record and "distance" in old and record["distance"] > old["distance"] * (1 + tolerance) + 1e-8:
+            changes.append((*key(record), "distance", old["distance"], record["distance"]))
+    return changes
+
+
+def report(results):
+    headers = ["problem", "method", "i", "f evals", "∇f evals", "time", "distance"]
+    log_pattern = "{!s:<18.18}\t{!s:<32.32}\t" + "{!s:<12.12}\t" * (len(headers)-2)
+    print(log_pattern.format(*headers))
+    for r in results:
+        if "error" in r:
+            print(log_pattern.format(r["problem"], r["method"], "error", r["error"], "", "", ""))
+            continue
+        print(log_pattern.format(r["problem"], r["method"], r["iterations"], r["fn_evaluations"],
+                                 r["grad_evaluations"], f"{r['time']:.4f}", f"{r['distance']:.3e}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench.json", help="json file for results")
+    parser.add_argument("--baseline", default=None, help="json file of previous results to compare with")
+    parser.add_argument("--max-iterations", type=int, default=None)
+    parser.add_argument("--criteria-eps", type=float, default=10**-4)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    Logger.ASSERTION_EXIT = False
+    results = run_benchmarks(max_iterations=args.max_iterations, criteria_eps=args.criteria_eps)
+    save(results, args.output)
+    report(results)
+
+    if args.baseline is not None:
+        print(f"\nchanges against {args.baseline}:")
+        for change in compare(results, load(args.baseline), args.tolerance):
+            print("{!s:<18.18}\t{!s:<32.32}\t{!s:<18}\t{} -> {}".format(*change))
+
+
+if __name__ == "__main__":
+    main()
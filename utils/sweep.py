@@ -0,0 +1,73 @@
+import os
+import time
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils.Logger import Logger
+from methods.GradientDescent import GradientDescent
+
+
+# worker state, it is set once per process by `_init_worker`
+_worker = {}
+
+
+def make_grid(grid):
+    """ list of params for every run in grid order
+
+        :param grid: dict {name: values} - all combinations (the last name changes the fastest),
+                     or list of dicts - runs as is
+    """
+    if isinstance(grid, dict):
+        names = list(grid.keys())
+        return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+    return [dict(params) for params in grid]
+
+
+def _init_worker(fn, start_point, params):
+    Logger.ENABLE = False
+    Logger.ASSERTION_EXIT = False
+    _worker.update(fn=fn, start_point=start_point, params=params)
+
+
+def _run(grid_params):
+    params = dict(_worker["params"], **grid_params)
+    start = time.perf_counter()
+    result = GradientDescent(_worker["fn"], _worker["start_point"], **params).start()
+    runtime = time.perf_counter() - start
+
+    current = result.history.current
+    return result.iterations, result.stats.total("fn"), current.x, current.fx, runtime
+
+
+def sweep(fn, start_point, grid, max_workers=None, chunksize=None, **params):
+    """ runs `GradientDescent(fn, start_point, **params, **grid_params)` for every grid point in a process pool
+
+        :param fn: objective, should be picklable (defined on module level)
+        :param grid: see `make_grid`
+        :param max_workers: processes count (by default - cpu count), 1 - run in this process
+        :param params: common params for all runs
+        :return: structured np.ndarray with fields iterations, evaluations (points of fn), x, fx, runtime in grid order
+    """
+    runs = make_grid(grid)
+    start_point = np.asarray(start_point, dtype=float)
+    dtype = [("iterations", int), ("evaluations", int), ("x", float, start_point.shape),
+             ("fx", float), ("runtime", float)]
+
+    if max_workers == 1:
+        logger_enable, assertion_exit = Logger.ENABLE, Logger.ASSERTION_EXIT
+        try:
+            _init_worker(fn, start_point, params)
+            rows = [_run(run) for run in runs]
+        finally:
+            Logger.ENABLE, Logger.ASSERTION_EXIT = logger_enable, assertion_exit
+        return np.array(rows, dtype=dtype)
+
+    max_workers = max_workers or os.cpu_count()
+    if chunksize is None:
+        chunksize = max(1, len(runs) // (max_workers * 4))
+
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(fn, start_point, params)) as executor:
+        rows = list(executor.map(_run, runs, chunksize=chunksize))
+    return np.array(rows, dtype=dtype)
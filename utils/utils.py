@@ -4,38 +4,192 @@ import numpy as np
 
 def benchmark(func):
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         return_value = func(*args, **kwargs)
-        end = time.time()
+        end = time.perf_counter()
         print('[*] Runtime: {} s.'.format(end-start))
         return return_value
     return wrapper
 
 
-def gradient(fn, point, h=0.00001):
-    """ central differences method
+GRADIENT_MODES = ("forward", "central", "complex")
+
+
+def evaluate_points(fn, points, vectorized=False):
+    """ evaluates fn in every row of `points` with one broadcast call,
+        falls back to a call per row if fn can't take arrays
+
+        :type fn: function
+        :type points: np.ndarray with shape (m, n)
+        :param vectorized: fn takes one np.ndarray `fn(x)` instead of `fn(x1, ..., xn)`, it is called per row
+        :return: np.ndarray with shape (m,)
+    """
+    if vectorized is True:
+        return np.array([fn(p) for p in points])
+    try:
+        values = np.asarray(fn(*points.T))
+        if values.shape == (len(points),):
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.array([fn(*p) for p in points])
+
+
+def gradient(fn, point, h=0.00001, mode=None, vectorized=False, fx=None):
+    """ finite differences method
+
+        forward:  df/dx_i = (f(x + h*e_i) - f(x)) / h             - n+1 calls (n if f(x) is known)
+        central:  df/dx_i = (f(x + h*e_i) - f(x - h*e_i)) / 2h    - 2n calls
+        complex:  df/dx_i = Im(f(x + i*h*e_i)) / h                - n calls, fn should support complex numbers
+
+        All perturbed points are stacked into one array and evaluated with one call (see `evaluate_points`).
+        For `vectorized` fn one work copy of the point is perturbed in place instead (O(n) memory, not O(n^2)).
 
         :type fn: function
         :type point: float|np.ndarray
+        :param mode: one of GRADIENT_MODES, by default 'forward' for vectors and 'central' for numbers
+        :param vectorized: fn takes one np.ndarray `fn(x)` instead of `fn(x1, ..., xn)`
+        :param fx: f(point) if it is computed already, forward mode doesn't evaluate it again
     """
     if isinstance(point, np.ndarray):
+        mode = mode or "forward"
         point = point.astype(float)
-        dxs = []
-        for i in range(len(point)):
-            p = point.copy()
-            p[i] += h
-            dx = (fn(*p) - fn(*point))/h
-            dxs.append(dx)
-        return np.array(dxs)
+        if vectorized is True:
+            return _gradient_in_place(fn, point, h, mode, fx)
+        n = len(point)
+        steps = np.eye(n) * h
+
+        if mode == "forward":
+            if fx is not None:
+                return (evaluate_points(fn, point + steps) - fx) / h
+            values = evaluate_points(fn, np.vstack([point, point + steps]))
+            return (values[1:] - values[0]) / h
+        if mode == "central":
+            values = evaluate_points(fn, np.vstack([point + steps, point - steps]))
+            return (values[:n] - values[n:]) / (2*h)
+        if mode == "complex":
+            values = evaluate_points(fn, point + 1j*steps)
+            return values.imag / h
+        raise ValueError(f"Unknown gradient mode {mode!r}, use one of {GRADIENT_MODES}")
+
+    mode = mode or "central"
+    if mode == "forward":
+        return (fn(point+h) - (fn(point) if fx is None else fx))/h
+    if mode == "central":
+        return (fn(point+h) - fn(point-h))/(2*h)
+    if mode == "complex":
+        return fn(point + 1j*h).imag/h
+    raise ValueError(f"Unknown gradient mode {mode!r}, use one of {GRADIENT_MODES}")
+
+
+def _gradient_in_place(fn, point, h, mode, fx=None):
+    """ `gradient` for fn(x): one component of the work copy is shifted and restored for every call """
+    n = len(point)
+    result = np.empty(n)
+
+    if mode == "complex":
+        work = point.astype(complex)
+        for i in range(n):
+            work[i] += 1j*h
+            result[i] = fn(work).imag / h
+            work[i] = point[i]
+        return result
+    if mode not in GRADIENT_MODES:
+        raise ValueError(f"Unknown gradient mode {mode!r}, use one of {GRADIENT_MODES}")
+
+    work = point.copy()
+    if mode == "forward" and fx is None:
+        fx = fn(work)
+    for i in range(n):
+        work[i] = point[i] + h
+        fx_forward = fn(work)
+        if mode == "forward":
+            result[i] = (fx_forward - fx) / h
+        else:
+            work[i] = point[i] - h
+            result[i] = (fx_forward - fn(work)) / (2*h)
+        work[i] = point[i]
+    return result
 
-    return (fn(point+h) - fn(point-h))/(2*h)
+
+def batch_gradient(fn, points, h=0.00001, mode="forward", fxs=None, with_values=False):
+    """ finite differences in every row of `points` with one call of fn (see `gradient`)
+
+        :type fn: function
+        :type points: np.ndarray with shape (N, n)
+        :param fxs: np.ndarray (N,) - f in every row if it is computed already, forward mode doesn't evaluate it again
+        :param with_values: forward mode only - return f in every row too, it is evaluated in the same call
+        :return: np.ndarray with shape (N, n), (f: np.ndarray (N,), gradient) if `with_values`
+    """
+    if with_values is True and (mode != "forward" or fxs is not None):
+        raise ValueError("with_values is supported only in forward mode without fxs")
+    points = points.astype(float)
+    N, n = points.shape
+    steps = np.eye(n) * h
+    base = points[:, None, :]
+
+    if mode == "forward" and fxs is not None:
+        values = evaluate_points(fn, (base + steps).reshape(-1, n)).reshape(N, n)
+        return (values - np.asarray(fxs)[:, None]) / h
+    if mode == "forward":
+        stacked = np.concatenate([base, base + steps], axis=1)
+        values = evaluate_points(fn, stacked.reshape(-1, n)).reshape(N, n+1)
+        gradient = (values[:, 1:] - values[:, :1]) / h
+        return (values[:, 0], gradient) if with_values is True else gradient
+    if mode == "central":
+        stacked = np.concatenate([base + steps, base - steps], axis=1)
+        values = evaluate_points(fn, stacked.reshape(-1, n)).reshape(N, 2*n)
+        return (values[:, :n] - values[:, n:]) / (2*h)
+    if mode == "complex":
+        stacked = base + 1j*steps
+        values = evaluate_points(fn, stacked.reshape(-1, n)).reshape(N, n)
+        return values.imag / h
+    raise ValueError(f"Unknown gradient mode {mode!r}, use one of {GRADIENT_MODES}")
+
+
+def hessian(fn, point, h=0.0001, vectorized=False):
+    """ finite differences method for the second derivatives (error O(h^2))
+
+        d2f/dx_i^2    = (f(x + h*e_i) - 2*f(x) + f(x - h*e_i)) / h^2
+        d2f/dx_i dx_j = (f(x + h*e_i + h*e_j) - f(x + h*e_i) - f(x + h*e_j) + 2*f(x)
+                         - f(x - h*e_i) - f(x - h*e_j) + f(x - h*e_i - h*e_j)) / 2h^2
+
+        All 1 + 2n + n(n-1) points are evaluated with one call (see `evaluate_points`).
+
+        :type fn: function
+        :type point: np.ndarray
+        :param vectorized: fn takes one np.ndarray `fn(x)` instead of `fn(x1, ..., xn)`
+        :return: symmetric np.ndarray with shape (n, n)
+    """
+    point = point.astype(float)
+    n = len(point)
+    steps = np.eye(n) * h
+    rows, columns = np.triu_indices(n, k=1)
+    pairs = steps[rows] + steps[columns]
+
+    values = evaluate_points(fn, np.vstack([point, point + steps, point - steps, point + pairs, point - pairs]), vectorized)
+    fx, forward, backward = values[0], values[1:n+1], values[n+1:2*n+1]
+    mixed_forward, mixed_backward = values[2*n+1:2*n+1+len(rows)], values[2*n+1+len(rows):]
+
+    result = np.empty((n, n))
+    result[np.diag_indices(n)] = (forward - 2*fx + backward) / h**2
+    result[rows, columns] = result[columns, rows] = (
+        mixed_forward - forward[rows] - forward[columns] + 2*fx - backward[rows] - backward[columns] + mixed_backward
+    ) / (2 * h**2)
+    return result
 
 
 def get_vector_norm(vec: np.ndarray):
-    norm = np.sqrt(sum(vec**2))
+    norm = np.linalg.norm(vec)
     return norm
 
 
+def format_vector(vec: np.ndarray, precision=24, edgeitems=3):
+    """ vector of any length for reports: long vectors are summarized as [x1, x2, x3, ..., xn] """
+    return np.array2string(np.asarray(vec), precision=precision, separator=", ", threshold=2*edgeitems,
+                           edgeitems=edgeitems, floatmode="fixed", max_line_width=10**6)
+
+
 def get_vector_direction(vec: np.ndarray):
     norm = get_vector_norm(vec)
     direction = vec/norm